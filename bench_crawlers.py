@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+from helix_replay_server import add_server_arguments, server_from_args
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+STEP1 = os.path.join(REPO_DIR, "step1_crawl_helix_requests_openai.py")
+
+# HelixCenterCrawler has no CLI; argv: repo dir, its base_url, request rate
+CLAUDE_VER1 = """
+import sys
+sys.path.insert(0, sys.argv[1])
+from helix_fetcher import configure_fetcher
+from helix_rate_limit import HostRateLimiter
+rate = float(sys.argv[3])
+configure_fetcher(rate_limiter=HostRateLimiter(rate=rate, burst=int(rate), max_rate=rate))
+from crawl_helix_requests_claude_ver1 import HelixCenterCrawler
+from helix_fetcher import get_fetcher
+HelixCenterCrawler(base_url=sys.argv[2]).crawl()
+get_fetcher().stats.print_summary()
+"""
+
+TARGETS = ("step1", "step1-async", "step1-pipeline", "claude-ver1")
+# Targets whose numbers do not cover a full crawl
+TARGET_NOTES = {
+    "claude-ver1": "fetches the year listings only: its detail selectors (a.event-link, "
+                   "div.event-speakers) match neither helixcenter.org nor the replayed pages",
+}
+# The crawler's own FetchStats line: latency as its HTTP client saw it
+FETCH_STATS_RE = re.compile(r"\[INFO\] Fetch stats: .*p50 ([\d.]+)ms, .*p99 ([\d.]+)ms")
+
+
+def target_command(target, base_url, args):
+    if target == "claude-ver1":
+        # HelixCenterCrawler appends two-digit years: <base>20 + "12/"
+        return [sys.executable, "-c", CLAUDE_VER1, REPO_DIR, f"{base_url}20", str(args.rate)]
+    command = [sys.executable, STEP1, "--base-url", base_url,
+               "--start-year", str(args.start_year), "--end-year", str(args.end_year),
+               "--no-cache", "--no-archive", "--no-journal",
+               "--rate", str(args.rate), "--max-rate", str(args.rate), "--burst", str(int(args.rate))]
+    if target == "step1-async":
+        command.append("--async")
+    elif target == "step1-pipeline":
+        command.append("--pipeline")
+    return command
+
+
+def run_target(command, workdir):
+    """Run one crawler to completion; return (exit status, wall seconds, peak RSS bytes)."""
+    with open(os.path.join(workdir, "output.log"), "ab") as log:
+        start = time.perf_counter()
+        proc = subprocess.Popen(command, cwd=workdir, stdout=log, stderr=subprocess.STDOUT)
+        _, status, usage = os.wait4(proc.pid, 0)
+        wall = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak_rss = usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+    return proc.returncode, wall, peak_rss
+
+
+def client_latency(workdir):
+    """(p50 ms, p99 ms) from the crawler's last Fetch stats line, or (None, None)."""
+    with open(os.path.join(workdir, "output.log"), "r", errors="replace") as f:
+        matches = FETCH_STATS_RE.findall(f.read())
+    if not matches:
+        return None, None
+    return tuple(float(v) for v in matches[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the crawlers against a local replay of helixcenter.org.")
+    add_server_arguments(parser)
+    parser.add_argument("--targets", nargs="+", choices=TARGETS, default=list(TARGETS))
+    parser.add_argument("--start-year", type=int, default=2012)
+    parser.add_argument("--end-year", type=int, default=2024)
+    parser.add_argument("--rate", type=float, default=1000,
+                        help="Per-host request rate given to the crawlers (high = measure the crawler, "
+                             "not the politeness limit).")
+    args = parser.parse_args()
+
+    server = server_from_args(args).start()
+    print(f"[INFO] Replay server at {server.base_url} with {len(server.pages)} pages")
+    print(f"\n{'target':<16}{'ok':>6}{'errors':>8}{'wall s':>9}{'pages/s':>10}"
+          f"{'p50 ms':>9}{'p99 ms':>9}{'peak MiB':>10}")
+    try:
+        for target in args.targets:
+            server.log.reset()
+            with tempfile.TemporaryDirectory(prefix=f"bench_{target}_") as workdir:
+                code, wall, peak_rss = run_target(target_command(target, server.base_url, args), workdir)
+                if code != 0:
+                    with open(os.path.join(workdir, "output.log"), "r", errors="replace") as f:
+                        tail = f.read()[-2000:]
+                    print(f"{target:<16}failed with exit code {code}:\n{tail}")
+                    continue
+                p50, p99 = client_latency(workdir)
+            s = server.log.summary()
+            label = target + ("*" if target in TARGET_NOTES else "")
+            latency = (f"{p50:>9.1f}{p99:>9.1f}" if p50 is not None else f"{'n/a':>9}{'n/a':>9}")
+            print(f"{label:<16}{s['ok']:>6}{s['errors']:>8}{wall:>9.2f}{s['ok'] / wall:>10.1f}"
+                  f"{latency}{peak_rss / 2 ** 20:>10.1f}")
+    finally:
+        server.stop()
+    print("\nLatency is per request as measured by each crawler's HTTP client.")
+    for target in args.targets:
+        if target in TARGET_NOTES:
+            print(f"* {target} {TARGET_NOTES[target]}.")
+
+
+if __name__ == "__main__":
+    main()
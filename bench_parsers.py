@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+
+import step1_crawl_helix_requests_openai as step1
+from helix_soup import PARSER_BACKENDS, configure_parser
+from helix_replay_server import RecordPages
+
+DEFAULT_FIXTURES = "helixcenter_openai_20241231-141845.json"
+FIXTURE_ORIGIN = "https://helixcenter.org"
+
+LISTING_RE = re.compile(r"/roundtables/\d{4}/$")
+DETAIL_RE = re.compile(r"/roundtables/\d{4}/[^/]+/$")
+SPEAKER_RE = re.compile(r"/participants/[^/]+/$")
+
+
+def classify(url):
+    """Which step1 parse_* function a saved page belongs to, or None."""
+    if LISTING_RE.search(url):
+        return "listing"
+    if DETAIL_RE.search(url):
+        return "detail"
+    if SPEAKER_RE.search(url):
+        return "speaker"
+    return None
+
+
+def load_cached_pages(cache_dir):
+    """
+    Saved pages from a helix_http_cache directory, as [(kind, url, html)].
+    """
+    pages = []
+    for meta_path in sorted(glob.glob(os.path.join(cache_dir, "*.json"))):
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        kind = classify(meta["url"])
+        if kind is None:
+            continue
+        with open(meta_path[:-len(".json")] + ".body", "rb") as f:
+            html = f.read().decode("utf-8", errors="replace")
+        pages.append((kind, meta["url"], html))
+    return pages
+
+
+def load_fixture_pages(filename):
+    """
+    Pages rendered from a committed step1 JSON file (RecordPages), as
+    [(kind, url, html)]; no crawl or cache needed.
+    """
+    pages = []
+    for path, (_, _, body) in sorted(RecordPages(filename).pages(FIXTURE_ORIGIN).items()):
+        kind = classify(path)
+        if kind is not None:
+            pages.append((kind, FIXTURE_ORIGIN + path, body.decode("utf-8")))
+    return pages
+
+
+def parse_page(kind, html):
+    if kind == "listing":
+        return step1.parse_year_listing(html)
+    if kind == "detail":
+        return step1.parse_roundtable_detail(html, year=2012)
+    return step1.parse_speaker_page(html)
+
+
+def run_backend(backend, pages, repeat, partial=True):
+    """
+    Parse every page `repeat` times; return ({url: result},
+    {kind: [seconds per page]}, {kind: [peak bytes per page]}).
+    """
+    configure_parser(backend, partial=partial)
+    results = {}
+    timings = {}
+    peaks = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for kind, url, html in pages:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                results[url] = parse_page(kind, html)
+                timings.setdefault(kind, []).append(time.perf_counter() - start)
+            # Separate pass: tracemalloc would skew the timings above
+            tracemalloc.start()
+            parse_page(kind, html)
+            peaks.setdefault(kind, []).append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+    return results, timings, peaks
+
+
+def variants(backends):
+    """
+    (label, backend, partial) runs. BeautifulSoup backends are run on the full
+    page first and then with partial parsing, so the first run (full
+    html.parser by default) is the original behaviour every other run is
+    compared against.
+    """
+    runs = []
+    for backend in backends:
+        if backend == "lxml-native":
+            runs.append((backend, backend, True))
+        else:
+            runs.append((f"{backend}/full", backend, False))
+            runs.append((f"{backend}/partial", backend, True))
+    return runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark step1 HTML parser backends on saved pages.")
+    parser.add_argument("--cache-dir", default=".helix_http_cache",
+                        help="helix_http_cache directory holding the saved pages.")
+    parser.add_argument("--backends", nargs="+", choices=PARSER_BACKENDS, default=list(PARSER_BACKENDS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--fixtures", metavar="JSON", nargs="?", const=DEFAULT_FIXTURES,
+                        help="Parse pages rendered from this committed step1 JSON instead of the cache "
+                             f"(default {DEFAULT_FIXTURES}); also used when the cache is empty.")
+    parser.add_argument("--check", action="store_true",
+                        help="Parity check: exit with status 1 if any backend's records differ from "
+                             "the first backend's.")
+    args = parser.parse_args()
+
+    pages = [] if args.fixtures else load_cached_pages(args.cache_dir)
+    if not pages:
+        fixtures = args.fixtures or DEFAULT_FIXTURES
+        if not args.fixtures:
+            print(f"[INFO] No saved pages in {args.cache_dir}; using pages rendered from {fixtures}")
+        pages = load_fixture_pages(fixtures)
+    counts = {kind: sum(1 for p in pages if p[0] == kind) for kind in ("listing", "detail", "speaker")}
+    print(f"[INFO] {len(pages)} saved pages: {counts}")
+
+    reference = None
+    baseline = {}
+    failed = []
+    print(f"\n{'backend':<22}{'page':<10}{'mean ms':>10}{'p50 ms':>10}{'peak KiB':>10}"
+          f"{'speedup':>10}{'mismatch':>10}")
+    for label, backend, partial in variants(args.backends):
+        try:
+            results, timings, peaks = run_backend(backend, pages, args.repeat, partial=partial)
+        except Exception as e:
+            print(f"{label:<22}failed: {e}")
+            failed.append(label)
+            continue
+        if reference is None:
+            reference = results
+        mismatches = sum(1 for url in results if results[url] != reference[url])
+        if mismatches:
+            failed.append(label)
+        for kind in ("listing", "detail", "speaker"):
+            if kind not in timings:
+                continue
+            mean = statistics.mean(timings[kind])
+            baseline.setdefault(kind, mean)
+            print(f"{label:<22}{kind:<10}{mean * 1000:>10.2f}{statistics.median(timings[kind]) * 1000:>10.2f}"
+                  f"{statistics.mean(peaks[kind]) / 1024:>10.0f}"
+                  f"{baseline[kind] / mean:>9.1f}x{mismatches:>10}")
+    configure_parser()
+    if args.check:
+        if failed:
+            print(f"\n[ERROR] Parser parity check failed for: {', '.join(failed)}")
+            sys.exit(1)
+        print("\n[INFO] Parser parity check passed")
+
+
+if __name__ == "__main__":
+    main()
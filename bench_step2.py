@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from helix_llm_stub import add_stub_arguments, stub_from_args
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+STEP2 = os.path.join(REPO_DIR, "step2_ai_parse_roundtable_raw_json.py")
+DEFAULT_INPUT_FILENAME = "helixcenter_openai_20241231-141845.json"
+
+MODES = {
+    "threads": [],
+    "async": ["--async"],
+    "stream": ["--stream"],
+    "pack4": ["--pack-size", "4"],
+}
+
+
+def run_step2(input_filename, base_url, mode, concurrency, args, workdir):
+    """Run step2 once against the stub; return (exit status, wall seconds, failed roundtables)."""
+    shutil.copy(input_filename, os.path.join(workdir, "input.json"))
+    command = [sys.executable, STEP2, "--input", "input.json", "--no-llm-cache",
+               "--provider", "openai", "--base-url", base_url,
+               "--concurrency", str(concurrency),
+               "--rpm", str(args.client_rpm), "--tpm", str(args.client_tpm),
+               "--retry-rounds", str(args.retry_rounds)] + MODES[mode]
+    env = dict(os.environ, OPENAI_API_KEY="stub")
+    with open(os.path.join(workdir, "output.log"), "ab") as log:
+        start = time.perf_counter()
+        code = subprocess.call(command, cwd=workdir, env=env, stdin=subprocess.DEVNULL,
+                               stdout=log, stderr=subprocess.STDOUT)
+        wall = time.perf_counter() - start
+    if code != 0:
+        return code, wall, None
+    with open(os.path.join(workdir, "input_cleaned.json"), "r", encoding="utf-8") as f:
+        failed = sum(1 for rt in json.load(f) if "enrichment_error" in rt)
+    return code, wall, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Load-test step2's enrichment against the local OpenAI stub.")
+    add_stub_arguments(parser)
+    parser.add_argument("--input", default=DEFAULT_INPUT_FILENAME, help="step1 output to enrich.")
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=["threads"])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--client-rpm", type=float, default=1e6,
+                        help="step2's own requests-per-minute limit (high = measure the client, "
+                             "not the limiter).")
+    parser.add_argument("--client-tpm", type=float, default=1e9, help="step2's own tokens-per-minute limit.")
+    parser.add_argument("--retry-rounds", type=int, default=2)
+    args = parser.parse_args()
+
+    input_filename = os.path.abspath(args.input)
+    with open(input_filename, "r", encoding="utf-8") as f:
+        total = len(json.load(f))
+    server = stub_from_args(args).start()
+    print(f"[INFO] Stub at {server.base_url}, latency {args.latency}; {total} roundtables per run")
+    print(f"\n{'mode':<10}{'conc':>6}{'wall s':>9}{'rt/s':>8}{'requests':>10}{'429':>6}{'500':>6}{'failed':>8}")
+    try:
+        for mode in args.modes:
+            for concurrency in args.concurrency:
+                with server.lock:
+                    server.counts.clear()
+                with tempfile.TemporaryDirectory(prefix=f"bench_step2_{mode}_") as workdir:
+                    code, wall, failed = run_step2(input_filename, server.base_url, mode, concurrency,
+                                                   args, workdir)
+                    if code != 0:
+                        with open(os.path.join(workdir, "output.log"), "r", errors="replace") as f:
+                            tail = f.read()[-2000:]
+                        print(f"{mode:<10}{concurrency:>6} failed with exit code {code}:\n{tail}")
+                        continue
+                c = server.counts
+                print(f"{mode:<10}{concurrency:>6}{wall:>9.2f}{total / wall:>8.1f}{c['requests']:>10}"
+                      f"{c['rate_limited']:>6}{c['server_error']:>6}{failed:>8}")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
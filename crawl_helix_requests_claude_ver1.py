@@ -1,13 +1,12 @@
-import requests
 from bs4 import BeautifulSoup
 import json
 import logging
 from datetime import datetime
 import re
-import time
 from typing import Dict, List, Optional
 import concurrent.futures
 from urllib.parse import urljoin
+from helix_fetcher import get_fetcher
 
 # Configure logging
 logging.basicConfig(
@@ -30,7 +29,7 @@ class HelixCenterCrawler:
             base_url (str): The base URL for Helix Center roundtables
         """
         self.base_url = base_url
-        self.session = requests.Session()
+        self.fetcher = get_fetcher()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
@@ -51,8 +50,7 @@ class HelixCenterCrawler:
             Optional[BeautifulSoup]: Parsed page content or None if failed
         """
         try:
-            time.sleep(1)  # Rate limiting
-            response = self.session.get(url, headers=self.headers)
+            response = self.fetcher.get(url, headers=self.headers)
             response.raise_for_status()
             return BeautifulSoup(response.text, 'html.parser')
         except Exception as e:
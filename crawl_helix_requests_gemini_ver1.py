@@ -2,7 +2,7 @@ import requests
 from bs4 import BeautifulSoup
 import json
 import re
-import time
+from helix_fetcher import get_fetcher
 
 def get_roundtable_details(url):
     """
@@ -15,7 +15,7 @@ def get_roundtable_details(url):
         A dictionary containing the roundtable details, or None if an error occurs.
     """
     try:
-        response = requests.get(url)
+        response = get_fetcher().get(url)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -87,7 +87,7 @@ def crawl_helixcenter_roundtables():
         print(f"Crawling {year_url}")
 
         try:
-            response = requests.get(year_url)
+            response = get_fetcher().get(year_url)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, 'html.parser')
 
@@ -107,7 +107,6 @@ def crawl_helixcenter_roundtables():
                         **roundtable_details
                     }
                     id_counter += 1
-                time.sleep(1)  # Be polite and add a delay between requests
 
         except requests.exceptions.RequestException as e:
             print(f"Error crawling {year_url}: {e}")
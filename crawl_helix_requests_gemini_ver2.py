@@ -2,8 +2,8 @@ import requests
 from bs4 import BeautifulSoup
 import json
 import re
-import time
 import string
+from helix_fetcher import get_fetcher
 
 def get_speaker_bio(name):
     """
@@ -31,7 +31,7 @@ def get_speaker_bio(name):
     }
 
     try:
-        response = requests.get(bio_url, headers=headers)
+        response = get_fetcher().get(bio_url, headers=headers)
         response.raise_for_status()
 
         if response.url == "https://www.helixcenter.org/": #check for redirect to homepage
@@ -72,7 +72,7 @@ def get_roundtable_details(url):
     }
 
     try:
-        response = requests.get(url, headers=headers)
+        response = get_fetcher().get(url, headers=headers)
         response.raise_for_status()
 
         if response.url == "https://www.helixcenter.org/": #check for redirect to homepage
@@ -154,7 +154,7 @@ def crawl_helixcenter_roundtables():
         print(f"Crawling {year_url}")
 
         try:
-            response = requests.get(year_url, headers=headers)
+            response = get_fetcher().get(year_url, headers=headers)
             response.raise_for_status()
 
             if response.url == "https://www.helixcenter.org/": #check for redirect to homepage
@@ -179,7 +179,6 @@ def crawl_helixcenter_roundtables():
                         **roundtable_details
                     }
                     id_counter += 1
-                time.sleep(1)  # Be polite and add a delay
 
         except requests.exceptions.RequestException as e:
             print(f"Error crawling {year_url}: {e}")
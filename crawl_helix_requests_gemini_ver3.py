@@ -2,9 +2,9 @@ import requests
 from bs4 import BeautifulSoup
 import json
 import re
-import time
 import string
 import logging
+from helix_fetcher import get_fetcher
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -27,7 +27,7 @@ def get_speaker_bio(name):
     }
 
     try:
-        response = requests.get(bio_url, headers=headers)
+        response = get_fetcher().get(bio_url, headers=headers)
         response.raise_for_status()
 
         if response.url == "https://www.helixcenter.org/":
@@ -61,7 +61,7 @@ def get_roundtable_details(url):
     }
 
     try:
-        response = requests.get(url, headers=headers)
+        response = get_fetcher().get(url, headers=headers)
         response.raise_for_status()
 
         if response.url == "https://www.helixcenter.org/":
@@ -148,7 +148,7 @@ def crawl_helixcenter_roundtables():
         logging.info(f"Crawling {year_url}")
 
         try:
-            response = requests.get(year_url, headers=headers)
+            response = get_fetcher().get(year_url, headers=headers)
             response.raise_for_status()
 
             if response.url == "https://www.helixcenter.org/":
@@ -179,7 +179,6 @@ def crawl_helixcenter_roundtables():
                     id_counter += 1
                 else:
                     logging.warning(f"    Could not fetch details for roundtable at {event_url}")
-                time.sleep(1)
 
         except requests.exceptions.RequestException as e:
             logging.error(f"Error crawling {year_url}: {e}")
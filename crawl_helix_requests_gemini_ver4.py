@@ -2,9 +2,10 @@ import requests
 from bs4 import BeautifulSoup
 import json
 import re
-import time
 import string
 import logging
+from helix_fetcher import get_fetcher
+from helix_participants import get_registry
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -29,13 +30,28 @@ def get_speaker_bio(name):
     bio_url = f"https://www.helixcenter.org/participants/{name_for_url}/"
     logging.debug(f"  Bio URL: {bio_url}")
 
+    # Recurring panelists share one fetch per crawl
+    return get_registry().get(bio_url, lambda url: fetch_speaker_bio(name, url))
+
+def fetch_speaker_bio(name, bio_url):
+    """
+    Fetches and parses a speaker's bio page. Called once per participant URL
+    via the participant registry.
+
+    Args:
+        name: The name of the speaker (for logging).
+        bio_url: The participant page URL.
+
+    Returns:
+        The speaker's bio as a string, or None if not found.
+    """
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
     }
 
     try:
-        response = requests.get(bio_url, headers=headers)
+        response = get_fetcher().get(bio_url, headers=headers)
         response.raise_for_status()
 
         if response.url == "https://www.helixcenter.org/":
@@ -77,7 +93,7 @@ def get_roundtable_details(url):
     }
 
     try:
-        response = requests.get(url, headers=headers)
+        response = get_fetcher().get(url, headers=headers)
         response.raise_for_status()
 
         if response.url == "https://www.helixcenter.org/":
@@ -164,7 +180,7 @@ def crawl_helixcenter_roundtables():
         logging.info(f"Crawling {year_url}")
 
         try:
-            response = requests.get(year_url, headers=headers)
+            response = get_fetcher().get(year_url, headers=headers)
             response.raise_for_status()
 
             if response.url == "https://www.helixcenter.org/":
@@ -192,7 +208,6 @@ def crawl_helixcenter_roundtables():
                     id_counter += 1
                 else:
                     logging.warning(f"    Could not fetch details for roundtable at {event_url}")
-                time.sleep(1)
 
         except requests.exceptions.RequestException as e:
             logging.error(f"Error crawling {year_url}: {e}")
@@ -203,6 +218,7 @@ def crawl_helixcenter_roundtables():
 
 if __name__ == "__main__":
     roundtable_data = crawl_helixcenter_roundtables()
+    get_registry().print_summary()
 
     with open("helixcenter_gemini_ver3.json", "w") as f:
         json.dump(roundtable_data, f, indent=2)
@@ -2,6 +2,7 @@ import requests
 from bs4 import BeautifulSoup
 import json
 import re
+from helix_fetcher import get_fetcher
 
 def crawl_helixcenter_roundtables():
     """
@@ -25,7 +26,7 @@ def crawl_helixcenter_roundtables():
         url = f"{base_url}{year}/"
         
         try:
-            response = requests.get(url)
+            response = get_fetcher().get(url)
             # If there's no valid page or some years are missing, skip gracefully
             if response.status_code != 200:
                 print(f"Skipping {url}, status code: {response.status_code}")
@@ -74,7 +75,7 @@ def crawl_roundtable_detail(url):
     Return a dictionary following the specified structure.
     """
     try:
-        response = requests.get(url)
+        response = get_fetcher().get(url)
         if response.status_code != 200:
             return None
     except requests.exceptions.RequestException:
@@ -2,6 +2,7 @@ import requests
 from bs4 import BeautifulSoup
 import json
 import re
+from helix_fetcher import get_fetcher
 
 
 def crawl_helixcenter_roundtables():
@@ -33,7 +34,7 @@ def crawl_helixcenter_roundtables():
         print(f"[DEBUG] Attempting to crawl roundtables for year: {year} at URL: {url}")
         
         try:
-            response = requests.get(url, headers=headers)
+            response = get_fetcher().get(url, headers=headers)
             status_code = response.status_code
             
             print(f"[DEBUG] Received response code {status_code} for {url}")
@@ -87,7 +88,7 @@ def crawl_roundtable_detail(url, headers):
     Return a dictionary following the specified structure.
     """
     try:
-        response = requests.get(url, headers=headers)
+        response = get_fetcher().get(url, headers=headers)
         status_code = response.status_code
         print(f"[DEBUG] Detail page response code for {url}: {status_code}")
         if status_code != 200:
@@ -4,6 +4,7 @@ import json
 import re
 from datetime import datetime   
 import time
+from helix_fetcher import get_fetcher
 
 def crawl_speaker_page(speaker_url, headers):
     """
@@ -12,7 +13,7 @@ def crawl_speaker_page(speaker_url, headers):
     """
     print(f"[DEBUG]   >> Accessing speaker page: {speaker_url}")
     try:
-        resp = requests.get(speaker_url, headers=headers)
+        resp = get_fetcher().get(speaker_url, headers=headers)
         if resp.status_code != 200:
             print(f"[DEBUG]   >> Speaker page request failed with status code {resp.status_code}")
             return None
@@ -53,7 +54,7 @@ def crawl_roundtable_detail(url, headers):
     """
     print(f"[DEBUG] Crawling roundtable detail page: {url}")
     try:
-        response = requests.get(url, headers=headers)
+        response = get_fetcher().get(url, headers=headers)
         if response.status_code != 200:
             print(f"[DEBUG] Skipping detail page {url}, status {response.status_code}")
             return None
@@ -220,7 +221,7 @@ def crawl_helixcenter_roundtables():
         year_url = f"{base_url}{year}/"
         print(f"\n[DEBUG] Fetching roundtables for year={year} : {year_url}")
         try:
-            resp = requests.get(year_url, headers=headers)
+            resp = get_fetcher().get(year_url, headers=headers)
             if resp.status_code != 200:
                 print(f"[DEBUG] Skipping {year_url}, status={resp.status_code}")
                 continue
@@ -0,0 +1,210 @@
+import hashlib
+import threading
+import time
+import uuid
+import zlib
+from datetime import datetime, timezone
+
+import httpx
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from helix_fetcher import HelixFetcher
+
+DEFAULT_ARCHIVE_FILENAME = "helixcenter_archive.warc.gz"
+
+# Bodies are archived decoded, so the transfer framing headers no longer apply
+_DROP_HEADERS = ("content-encoding", "transfer-encoding", "content-length")
+
+
+def _iter_members(data):
+    """
+    Yield (start, end, payload) for each complete gzip member of data.
+    Stops at the first torn or corrupt member.
+    """
+    start = 0
+    while start < len(data):
+        d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        parts = []
+        pos = start
+        try:
+            while not d.eof and pos < len(data):
+                chunk = data[pos:pos + 65536]
+                pos += len(chunk)
+                parts.append(d.decompress(chunk))
+        except zlib.error:
+            return
+        if not d.eof:
+            return
+        end = pos - len(d.unused_data)
+        yield start, end, b"".join(parts)
+        start = end
+
+
+def _parse_headers(block):
+    headers = {}
+    for line in block.decode("utf-8").split("\r\n"):
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip()] = value.strip()
+    return headers
+
+
+class ArchiveRecord:
+    """One archived response: url, status, headers (dict), decoded body bytes."""
+
+    def __init__(self, url, status, headers, body):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+
+def parse_record(payload):
+    """Turn one decompressed WARC response record into (warc_headers, ArchiveRecord)."""
+    warc_head, _, rest = payload.partition(b"\r\n\r\n")
+    warc_headers = _parse_headers(warc_head.split(b"\r\n", 1)[1])
+    block = rest[:int(warc_headers["Content-Length"])]
+    http_head, _, body = block.partition(b"\r\n\r\n")
+    status_line, _, header_lines = http_head.partition(b"\r\n")
+    status = int(status_line.split()[1])
+    return warc_headers, ArchiveRecord(warc_headers["WARC-Target-URI"], status,
+                                       _parse_headers(header_lines), body)
+
+
+class WarcArchive:
+    """
+    Append-only archive of every fetched page, written as WARC/1.1
+    "response" records with each record in its own gzip member (the usual
+    .warc.gz layout, so standard WARC tools can read it).
+
+    A response whose body is identical to the last one archived for the same
+    URL (same WARC-Payload-Digest) is not written again, so repeated crawls
+    served from the HTTP cache do not grow the file. A torn last record left
+    by a crash is cut off when the archive is reopened.
+    """
+
+    def __init__(self, filename=DEFAULT_ARCHIVE_FILENAME):
+        self.filename = filename
+        self.lock = threading.Lock()
+        self.digests = self._load()
+        self.f = open(filename, "ab")
+
+    def _load(self):
+        digests = {}
+        try:
+            with open(self.filename, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return digests
+        complete = 0
+        for _, end, payload in _iter_members(data):
+            warc_headers, _ = parse_record(payload)
+            digests[warc_headers["WARC-Target-URI"]] = warc_headers.get("WARC-Payload-Digest")
+            complete = end
+        if complete < len(data):
+            print(f"[WARN] Dropping torn last record of {self.filename}")
+            with open(self.filename, "rb+") as f:
+                f.truncate(complete)
+        return digests
+
+    def record(self, url, status, headers, body):
+        """Archive one response unless its body is unchanged since the last record for url."""
+        digest = "sha256:" + hashlib.sha256(body).hexdigest()
+        if self.digests.get(url) == digest:
+            return
+        http_headers = {k: v for k, v in headers.items() if k.lower() not in _DROP_HEADERS}
+        http_headers["Content-Length"] = str(len(body))
+        http_block = (f"HTTP/1.1 {status}\r\n"
+                      + "".join(f"{k}: {v}\r\n" for k, v in http_headers.items())
+                      + "\r\n").encode("utf-8") + body
+        warc_head = (
+            "WARC/1.1\r\n"
+            "WARC-Type: response\r\n"
+            f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>\r\n"
+            f"WARC-Date: {datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}\r\n"
+            f"WARC-Target-URI: {url}\r\n"
+            f"WARC-Payload-Digest: {digest}\r\n"
+            "Content-Type: application/http;msgtype=response\r\n"
+            f"Content-Length: {len(http_block)}\r\n"
+            "\r\n"
+        ).encode("utf-8")
+        member = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        data = member.compress(warc_head + http_block + b"\r\n\r\n") + member.flush()
+        with self.lock:
+            self.f.write(data)
+            self.f.flush()
+            self.digests[url] = digest
+
+    def close(self):
+        self.f.close()
+
+
+class WarcReader:
+    """
+    Random access to an archive written by WarcArchive. Only member offsets
+    are indexed; a record is decompressed again when it is asked for. The
+    last record for a URL wins.
+    """
+
+    def __init__(self, filename=DEFAULT_ARCHIVE_FILENAME):
+        self.filename = filename
+        with open(filename, "rb") as f:
+            self.data = f.read()
+        self.index = {}
+        for start, end, payload in _iter_members(self.data):
+            warc_headers, _ = parse_record(payload)
+            self.index[warc_headers["WARC-Target-URI"]] = (start, end)
+        print(f"[INFO] Archive {filename}: {len(self.index)} URLs")
+
+    def get(self, url):
+        """Return the ArchiveRecord for url, or None if it was never archived."""
+        span = self.index.get(url)
+        if span is None:
+            return None
+        start, end = span
+        return parse_record(zlib.decompress(self.data[start:end], 16 + zlib.MAX_WBITS))[1]
+
+
+class ArchiveFetcher(HelixFetcher):
+    """
+    Drop-in replacement for the shared HelixFetcher that answers every
+    request from a WarcReader and never touches the network (step1
+    --from-archive). URLs missing from the archive fail like a connection
+    error and are listed in dead_letters.
+    """
+
+    def __init__(self, reader, **kwargs):
+        super().__init__(**kwargs)
+        self.reader = reader
+
+    def _replay(self, url):
+        start = time.perf_counter()
+        record = self.reader.get(url)
+        if record is None:
+            self.stats.record(url, None, time.perf_counter() - start, 0, "archive")
+            self.dead_letters.add(url, "not in archive", 1)
+            return None
+        self.stats.record(url, record.status, time.perf_counter() - start, 0, "archive")
+        return record
+
+    def get(self, url, headers=None, **kwargs):
+        record = self._replay(url)
+        if record is None:
+            raise requests.exceptions.ConnectionError(f"{url} is not in {self.reader.filename}")
+        resp = requests.Response()
+        resp.status_code = record.status
+        resp.url = record.url
+        resp.headers = CaseInsensitiveDict(record.headers)
+        resp.encoding = get_encoding_from_headers(resp.headers)
+        resp._content = record.body
+        return resp
+
+    async def aget(self, url, headers=None, **kwargs):
+        request = httpx.Request("GET", url)
+        record = self._replay(url)
+        if record is None:
+            raise httpx.ConnectError(f"{url} is not in {self.reader.filename}", request=request)
+        return httpx.Response(record.status, headers=record.headers, content=record.body,
+                              request=request)
@@ -0,0 +1,190 @@
+import asyncio
+from urllib.parse import urlsplit
+
+import httpx
+
+from helix_fetcher import get_fetcher
+from helix_participants import get_registry
+from helix_retry import CircuitOpenError
+from step1_crawl_helix_requests_openai import (
+    BASE_URL,
+    START_YEAR,
+    END_YEAR,
+    HEADERS,
+    parse_year_listing,
+    parse_roundtable_detail,
+    parse_speaker_page,
+    apply_speaker_bios,
+    page_hash,
+)
+
+
+class HostLimiter:
+    """
+    Caps the number of in-flight requests overall and per host.
+    Use as `async with limiter.slot(url): ...`.
+    """
+
+    def __init__(self, max_concurrency=16, per_host_limit=4):
+        self.total = asyncio.Semaphore(max_concurrency)
+        self.per_host_limit = per_host_limit
+        self.hosts = {}
+
+    def slot(self, url):
+        host = urlsplit(url).netloc
+        if host not in self.hosts:
+            self.hosts[host] = asyncio.Semaphore(self.per_host_limit)
+        return _Slot(self.total, self.hosts[host])
+
+
+class _Slot:
+    def __init__(self, total, host):
+        self.total = total
+        self.host = host
+
+    async def __aenter__(self):
+        await self.host.acquire()
+        await self.total.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.total.release()
+        self.host.release()
+
+
+async def fetch_text(fetcher, limiter, url):
+    """
+    GET url under the limiter. Return the body text, or None on a non-200
+    status or transport error (same contract as the blocking crawler).
+    """
+    try:
+        async with limiter.slot(url):
+            resp = await fetcher.aget(url, headers=HEADERS)
+    except (httpx.HTTPError, CircuitOpenError) as e:
+        print(f"[DEBUG] HTTPError for {url}: {e}")
+        return None
+    if resp.status_code != 200:
+        print(f"[DEBUG] Skipping {url}, status={resp.status_code}")
+        return None
+    return resp.text
+
+
+async def crawl_speaker_page_async(fetcher, limiter, speaker_url):
+    print(f"[DEBUG]   >> Accessing speaker page: {speaker_url}")
+    html = await fetch_text(fetcher, limiter, speaker_url)
+    if html is None:
+        return None
+    return parse_speaker_page(html)
+
+
+async def crawl_roundtable_detail_async(fetcher, limiter, url, year=None, page_info=None):
+    """
+    Async twin of crawl_roundtable_detail: fetch the detail page, then fetch
+    all of its speaker pages concurrently and merge the full bios.
+    If page_info is given, page_info[url] records the page fingerprint and
+    speaker URLs for the manifest.
+    """
+    print(f"[DEBUG] Crawling roundtable detail page: {url} (year={year})")
+    html = await fetch_text(fetcher, limiter, url)
+    if html is None:
+        return None
+    roundtable_info, speaker_links = parse_roundtable_detail(html, year=year)
+    if page_info is not None:
+        page_info[url] = {"page_sha256": page_hash(html),
+                          "speaker_urls": list(speaker_links.values())}
+
+    registry = get_registry()
+    idxs = list(speaker_links)
+    bios = await asyncio.gather(
+        *(registry.aget(speaker_links[idx],
+                        lambda u: crawl_speaker_page_async(fetcher, limiter, u))
+          for idx in idxs)
+    )
+    return apply_speaker_bios(roundtable_info, dict(zip(idxs, bios)))
+
+
+async def crawl_or_resume_async(fetcher, limiter, url, year, page_info, journal):
+    """
+    Take a finished roundtable from the journal if it is there; otherwise
+    crawl it and journal the result.
+    """
+    done = journal.get(url) if journal is not None else None
+    if done is not None:
+        print(f"[DEBUG] Already crawled (journal): {url}")
+        page_info[url] = {"page_sha256": done["page_sha256"], "speaker_urls": done["speaker_urls"]}
+        return dict(done["record"])
+
+    rt_data = await crawl_roundtable_detail_async(fetcher, limiter, url, year=year,
+                                                  page_info=page_info)
+    if rt_data and journal is not None:
+        journal.append(url, year, rt_data, page_info[url]["page_sha256"],
+                       page_info[url]["speaker_urls"])
+    return rt_data
+
+
+async def crawl_year_async(fetcher, limiter, base_url, year, page_info=None, journal=None):
+    """
+    Fetch one year listing and all of its roundtables.
+    Returns [(roundtable_url, record or None), ...] in listing order.
+    """
+    if page_info is None:
+        page_info = {}
+    year_url = f"{base_url}{year}/"
+    print(f"\n[DEBUG] Fetching roundtables for year={year} : {year_url}")
+    html = await fetch_text(fetcher, limiter, year_url)
+    if html is None:
+        return []
+
+    rt_links = parse_year_listing(html)
+    records = await asyncio.gather(
+        *(crawl_or_resume_async(fetcher, limiter, rt_link, year, page_info, journal)
+          for rt_link in rt_links)
+    )
+    return list(zip(rt_links, records))
+
+
+async def crawl_helixcenter_roundtables_async(base_url=BASE_URL, start_year=START_YEAR,
+                                              end_year=END_YEAR, max_concurrency=16,
+                                              per_host_limit=4, manifest=None, journal=None,
+                                              on_record=None):
+    """
+    Concurrent version of crawl_helixcenter_roundtables. All year listings,
+    roundtable pages and speaker pages are in flight at once, bounded by
+    max_concurrency overall and per_host_limit per host.
+    IDs are assigned afterwards in (year, listing) order, so the output is
+    identical to the blocking crawler's. manifest and journal are handled
+    the same way too.
+    With on_record, each roundtable is handed to on_record(record) as soon
+    as its year (and every earlier year) is finished, instead of being
+    collected into the returned list.
+    """
+    page_info = {}
+    limiter = HostLimiter(max_concurrency, per_host_limit)
+    fetcher = get_fetcher()
+    all_roundtables = []
+    current_id = 0
+    year_tasks = [
+        asyncio.ensure_future(crawl_year_async(fetcher, limiter, base_url, year, page_info, journal))
+        for year in range(start_year, end_year + 1)
+    ]
+    try:
+        for year, year_task in zip(range(start_year, end_year + 1), year_tasks):
+            for rt_link, rt_data in await year_task:
+                if not rt_data:
+                    continue
+                current_id += 1
+                rt_data["id"] = current_id
+                if manifest is not None:
+                    manifest[rt_link] = {"id": current_id, "year": year, **page_info[rt_link]}
+                if on_record is not None:
+                    on_record(rt_data)
+                else:
+                    all_roundtables.append(rt_data)
+    finally:
+        for year_task in year_tasks:
+            year_task.cancel()
+        await fetcher.aclose()
+    return all_roundtables
+
+
+def run_async_crawl(**kwargs):
+    return asyncio.run(crawl_helixcenter_roundtables_async(**kwargs))
@@ -0,0 +1,218 @@
+import re
+
+# Words that make a title fragment an organisation name
+INSTITUTION_WORDS = (
+    "University", "College", "School", "Institute", "Institution", "Center", "Centre", "Hospital",
+    "Laboratory", "Laboratories", "Museum", "Academy", "Foundation", "Society", "Council",
+    "Observatory", "Library", "Seminary", "Conservatory", "Clinic", "Corporation", "Inc",
+    "Association", "Press", "Company", "Agency",
+)
+# Well-known short names that carry no INSTITUTION_WORDS
+INSTITUTION_ABBREVIATIONS = ("NYU", "CUNY", "SUNY", "MIT", "UCLA", "CERN", "NASA", "IBM", "Caltech")
+# Words that make a fragment a job title rather than an organisation
+ROLE_WORDS = (
+    "Professor", "Director", "Chair", "Chairman", "Dean", "President", "Lecturer", "Fellow",
+    "Founder", "Co-Founder", "Head", "Curator", "Scientist", "Researcher", "Investigator",
+    "Candidate", "Student", "Resident", "Editor", "Author", "Writer", "Journalist", "Member",
+    "Officer", "Partner", "Leader", "Manager", "Coordinator", "Chief", "Provost", "Chancellor",
+    "Poet", "Physician", "Lawyer", "Attorney", "Composer", "Philosopher", "Psychoanalyst",
+    r"\w+ist",
+)
+# Roles whose "of X" / "in X" names an academic subject
+ACADEMIC_ROLE_WORDS = ("Professor", "Lecturer", "Chair", "Candidate", "Fellow", "Scientist",
+                       "Researcher", "Student", "Instructor")
+# Sub-units: their subject is a speciality, never an institution
+UNIT_WORDS = ("Department", "Division", "Program", "Programme", "Faculty")
+
+INSTITUTION_RE = re.compile(r"\b(?:%s)\b" % "|".join(INSTITUTION_WORDS + INSTITUTION_ABBREVIATIONS))
+ROLE_RE = re.compile(r"\b(?:%s)s?\b" % "|".join(ROLE_WORDS))
+UNIT_RE = re.compile(r"\b(?:%s)\b" % "|".join(UNIT_WORDS))
+UNIT_START_RE = re.compile(r"^(?:the\s+)?(?:%s)\b" % "|".join(UNIT_WORDS), re.I)
+# "Bard CollegeAuthor": a new title glued on without a separator
+GLUED_RE = re.compile(r"\b(%s)(?=[A-Z][a-z])" % "|".join(INSTITUTION_WORDS))
+# "Associate Professorof Psychology": a preposition glued onto the role
+GLUED_PREPOSITION_RE = re.compile(r"\b(%s)(of|in|at|for)(?=\s)" % "|".join(ROLE_WORDS + UNIT_WORDS))
+# The subject never ends at an abbreviation's inner dot: "Professor in the
+# C.N. Yang Institute" names no subject, rather than "C"
+SUBJECT_RE = re.compile(
+    r"\b(?:%s|%s)s?(?:\s+Emerit(?:us|a))?\s+(?:of|in)\s+(?:the\s+)?([A-Z][\w&'\- ]*)(?!\.\w)"
+    % ("|".join(ACADEMIC_ROLE_WORDS), "|".join(UNIT_WORDS))
+)
+# "Astronomy and of Physics": a preposition left on a split-off subject
+LEADING_PREPOSITION_RE = re.compile(r"^(?:of|in|on|for|at)\s+(?:the\s+)?")
+# "... at the University of Chicago", "... of Columbia University" in a bio
+BIO_INSTITUTION_RE = re.compile(
+    r"\b(?:at|from|of|with)\s+((?:the\s+)?(?:[A-Z][\w.'\-]*(?:\s+(?:of|for|and|at|&)\s+|\s+)){0,6}?"
+    r"(?:%s)\b(?:\s+(?:of|for|at|in)(?:\s+[A-Z][\w.'\-]*)+)?)" % "|".join(INSTITUTION_WORDS)
+)
+BIO_SUBJECT_RE = re.compile(r"\b[Pp]rofessor\s+(?:of|in)\s+([A-Z][\w&'\-]*(?:\s+(?:and\s+)?[A-Z][\w&'\-]*)*)")
+CONNECTORS = (" and ", " & ")
+
+
+def numbered(panelist, prefix):
+    """{n: value} for the panelist dict's <prefix>_<n> entries."""
+    values = {}
+    for key, value in panelist.items():
+        name, _, n = key.rpartition("_")
+        if name == prefix and n.isdigit():
+            values[int(n)] = value
+    return values
+
+
+def panelist_count(panelist):
+    """Panelists with a non-empty name_<n>; exact, unlike asking the model."""
+    return sum(1 for name in numbered(panelist, "name").values() if name and name.strip())
+
+
+def normalise(text):
+    """Put back the space a glued-on preposition lost."""
+    return GLUED_PREPOSITION_RE.sub(r"\1 \2", text)
+
+
+def clean(fragment):
+    return re.sub(r"^the\s+", "", fragment.strip(" \t\n.;:")).strip()
+
+
+def title_fragments(title):
+    """Split a title into the comma/semicolon/"at" separated pieces it lists."""
+    title = GLUED_RE.sub(r"\1; ", title)
+    return [clean(f) for f in re.split(r"[,;]|\s+at\s+", title) if clean(f)]
+
+
+def is_full_institution(fragment):
+    """An organisation name on its own: "Columbia University", "NYU", but not a bare "Institute"."""
+    words = fragment.split()
+    return bool(INSTITUTION_RE.search(fragment)) and (
+        len(words) > 1 or fragment in INSTITUTION_ABBREVIATIONS)
+
+
+def split_connected(fragment):
+    """
+    'Columbia University & New York State Psychiatric Institute' -> both,
+    if each part is a full institution name. "New York Psychoanalytic
+    Society and Institute" stays whole.
+    """
+    for connector in CONNECTORS:
+        parts = [clean(p) for p in fragment.split(connector)]
+        if len(parts) > 1 and all(is_full_institution(p) for p in parts):
+            return parts
+    return [fragment]
+
+
+def title_institutions(title):
+    """
+    Organisations named in a title, top-level ones only: of several
+    institution fragments in one comma-separated run the last is kept
+    ("Stern School of Business, NYU" -> NYU).
+    """
+    institutions = []
+    for segment in re.split(r";", GLUED_RE.sub(r"\1; ", title)):
+        found = []
+        for fragment in title_fragments(segment):
+            if not INSTITUTION_RE.search(fragment) or UNIT_START_RE.match(fragment):
+                continue
+            if is_role(fragment):
+                continue  # "University Professor", "IBM Fellow"
+            if ROLE_RE.search(fragment.split(" of ")[0].split(" for ")[0]):
+                continue  # "Director of the Center for ..."
+            found.append(fragment)
+        if found:
+            institutions.extend(split_connected(found[-1]))
+    return institutions
+
+
+def bio_institutions(bio):
+    """Organisations a bio says the panelist is at; only its first sentences are searched."""
+    head = " ".join(re.split(r"(?<=[.!?])\s+", bio)[:2])
+    return [clean(m.group(1)) for m in BIO_INSTITUTION_RE.finditer(head)][:2]
+
+
+def clean_subject(part):
+    """clean() a subject, dropping a preposition left over from the split."""
+    return clean(LEADING_PREPOSITION_RE.sub("", part.strip()))
+
+
+def subjects(text, pattern):
+    found = []
+    for m in pattern.finditer(text):
+        subject = re.split(r"\s+(?:in|at|for|with)\s+", m.group(1))[0]
+        subject = re.sub(r"^(?:%s)\s+(?:of|in)\s+(?:the\s+)?" % "|".join(UNIT_WORDS), "", subject)
+        for part in re.split(r",|\s+and\s+", subject):
+            part = clean_subject(part)
+            if part and not (INSTITUTION_RE.search(part) or ROLE_RE.search(part) or UNIT_RE.search(part)):
+                found.append(part)
+    return found
+
+
+def is_role(fragment):
+    """A fragment that is only a job title: "Professor", "Associate Professor & Head"."""
+    return bool(ROLE_RE.search(fragment)) and not re.search(r"\s+(?:of|in|for|at)\s+", fragment)
+
+
+def title_specialities(title):
+    """
+    Subjects a title names: "Professor of X", "Department of X", or a bare
+    fragment right after a job title ("Professor, Astronomy, ...").
+    """
+    found = subjects(title, SUBJECT_RE)
+    fragments = title_fragments(title)
+    for previous, fragment in zip(fragments, fragments[1:]):
+        if is_role(previous) and not (INSTITUTION_RE.search(fragment) or ROLE_RE.search(fragment)
+                                      or UNIT_RE.search(fragment)):
+            found.extend(p for p in map(clean_subject, re.split(r"\s+and\s+", fragment)) if p)
+    return found
+
+
+def is_suspect(value):
+    """
+    A value that looks like a stray piece of a longer name: under three
+    characters, starting in lowercase, or with an unclosed parenthesis.
+    """
+    return len(value) < 3 or not value[0].isupper() or value.count("(") != value.count(")")
+
+
+def unique(values):
+    seen = set()
+    out = []
+    for value in values:
+        if value.lower() not in seen:
+            seen.add(value.lower())
+            out.append(value)
+    return out
+
+
+def extract_panelist_fields(panelist):
+    """
+    ({"panelist_ct", "institutions", "specialities"}, confident) from a
+    roundtable's panelist dict, by rule. Institutions come from each
+    title, or the bio's opening sentences when the title has none. Not
+    confident when a title or bio mentions an organisation the rules could
+    not isolate, when nothing at all was found (no panelists, or no
+    institutions or specialities), or when a value looks like a stray
+    fragment (is_suspect()), so the caller should ask the model instead.
+    """
+    names = numbered(panelist, "name")
+    titles = numbered(panelist, "title")
+    bios = numbered(panelist, "description")
+    institutions, specialities = [], []
+    confident = True
+    for n, name in sorted(names.items()):
+        if not (name and name.strip()):
+            continue
+        title = normalise(titles.get(n) or "")
+        bio = normalise(bios.get(n) or "")
+        found = title_institutions(title) or bio_institutions(bio)
+        if not found and (INSTITUTION_RE.search(title) or INSTITUTION_RE.search(bio)):
+            confident = False
+        institutions.extend(found)
+        specialities.extend(title_specialities(title) or subjects(bio, BIO_SUBJECT_RE)[:2])
+    fields = {
+        "panelist_ct": panelist_count(panelist),
+        "institutions": unique(institutions),
+        "specialities": unique(specialities),
+    }
+    if not (fields["panelist_ct"] and fields["institutions"] and fields["specialities"]):
+        confident = False
+    if any(is_suspect(value) for value in fields["institutions"] + fields["specialities"]):
+        confident = False
+    return fields, confident
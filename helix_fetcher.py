@@ -0,0 +1,322 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from helix_rate_limit import HostRateLimiter, parse_retry_after
+from helix_retry import RetryPolicy, CircuitBreaker, CircuitOpenError, DeadLetterQueue
+
+try:
+    import brotli  # noqa: F401  (requests/httpx only decode "br" when it is installed)
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+    "Accept-Encoding": ACCEPT_ENCODING,
+}
+POOL_CONNECTIONS = 10  # number of distinct hosts kept in the pool
+POOL_MAXSIZE = 16      # keep-alive connections per host
+
+
+class FetchStats:
+    """
+    Thread-safe per-fetch timing log: (url, status, seconds, bytes, source).
+    Status is None when the request raised before a response arrived.
+    source is "network" (full download), "revalidated" (304 from a
+    conditional GET), "cache" (fresh entry, no request sent) or "archive"
+    (replayed by helix_archive.ArchiveFetcher); bytes only counts bodies
+    actually received over the network.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.records = []
+
+    def record(self, url, status, elapsed, nbytes, source="network"):
+        with self.lock:
+            self.records.append((url, status, elapsed, nbytes, source))
+
+    def summary(self):
+        with self.lock:
+            records = list(self.records)
+        times = sorted(r[2] for r in records)
+        if not times:
+            return {"fetches": 0, "errors": 0, "bytes": 0, "cache_hits": 0, "revalidated": 0,
+                    "total_sec": 0.0, "mean_sec": 0.0, "p50_sec": 0.0, "p95_sec": 0.0, "p99_sec": 0.0,
+                    "max_sec": 0.0}
+        return {
+            "fetches": len(records),
+            "errors": sum(1 for r in records if r[1] is None or r[1] >= 400),
+            "bytes": sum(r[3] for r in records),
+            "cache_hits": sum(1 for r in records if r[4] == "cache"),
+            "revalidated": sum(1 for r in records if r[4] == "revalidated"),
+            "total_sec": sum(times),
+            "mean_sec": sum(times) / len(times),
+            "p50_sec": times[len(times) // 2],
+            "p95_sec": times[min(len(times) - 1, int(len(times) * 0.95))],
+            "p99_sec": times[min(len(times) - 1, int(len(times) * 0.99))],
+            "max_sec": times[-1],
+        }
+
+    def print_summary(self):
+        s = self.summary()
+        print(f"[INFO] Fetch stats: {s['fetches']} fetches, {s['errors']} errors, "
+              f"{s['cache_hits']} cache hits, {s['revalidated']} revalidated, "
+              f"{s['bytes'] / 1024:.1f} KiB, total {s['total_sec']:.2f}s, "
+              f"mean {s['mean_sec'] * 1000:.1f}ms, p50 {s['p50_sec'] * 1000:.1f}ms, "
+              f"p95 {s['p95_sec'] * 1000:.1f}ms, p99 {s['p99_sec'] * 1000:.1f}ms, "
+              f"max {s['max_sec'] * 1000:.1f}ms")
+
+
+class HelixFetcher:
+    """
+    One pooled HTTP client shared by every crawler entry point.
+
+    Blocking callers use get(), which goes through a keep-alive
+    requests.Session; asyncio callers use aget(), which goes through an
+    httpx.AsyncClient with the same pool sizes. Both record timing stats.
+
+    With a helix_http_cache.HttpCache attached, fresh entries are answered
+    from disk, stale ones are revalidated with a conditional GET, and 200
+    responses are stored.
+
+    Every request that reaches the network first takes a token from the
+    per-host helix_rate_limit.HostRateLimiter, which backs off on 429/503.
+    Failures are retried per helix_retry.RetryPolicy behind a per-host
+    CircuitBreaker; URLs that never succeed are kept in dead_letters.
+
+    With a helix_archive.WarcArchive attached, every final response
+    (including ones answered from the cache) is appended to the archive.
+    """
+
+    def __init__(self, headers=None, pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE,
+                 cache=None, rate_limiter=None, retry=None, breaker=None, archive=None):
+        self.headers = dict(DEFAULT_HEADERS)
+        if headers:
+            self.headers.update(headers)
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.stats = FetchStats()
+        self.cache = cache
+        self.rate_limiter = rate_limiter if rate_limiter is not None else HostRateLimiter()
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
+        self.dead_letters = DeadLetterQueue()
+        self.archive = archive
+
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._aclient = None
+
+    def _cache_lookup(self, url, headers):
+        """
+        Return (entry, fresh, headers) for url: entry is None on a miss, and
+        headers gain If-None-Match/If-Modified-Since when entry is stale.
+        """
+        if self.cache is None:
+            return None, False, headers
+        entry = self.cache.lookup(url)
+        if entry is None:
+            return None, False, headers
+        if self.cache.is_fresh(entry):
+            return entry, True, headers
+        conditional = dict(headers or {})
+        conditional.update(entry.validators())
+        return entry, False, conditional
+
+    def _archive(self, url, status, headers, body):
+        if self.archive is not None:
+            self.archive.record(url, status, headers, body)
+
+    def _from_cache(self, url, entry, start, cached_response):
+        """Answer a fresh cache entry without a request."""
+        self.stats.record(url, 200, time.perf_counter() - start, 0, "cache")
+        self._archive(url, 200, entry.headers, entry.body)
+        return cached_response(entry)
+
+    def _finish(self, url, entry, resp, start, cached_response):
+        """Apply cache bookkeeping to a final response and record its stats."""
+        if entry is not None and resp.status_code == 304:
+            self.cache.touch(entry)
+            self.stats.record(url, 304, time.perf_counter() - start, 0, "revalidated")
+            self._archive(url, 200, entry.headers, entry.body)
+            return cached_response(entry)
+        if self.cache is not None and resp.status_code == 200:
+            self.cache.store(url, resp.headers, resp.content)
+        self.stats.record(url, resp.status_code, time.perf_counter() - start, len(resp.content))
+        self._archive(url, resp.status_code, resp.headers, resp.content)
+        return resp
+
+    def _give_up(self, url, error, attempt):
+        print(f"[DEBUG] Giving up on {url} after {attempt} attempt(s): {error}")
+        self.dead_letters.add(url, error, attempt)
+
+    def get(self, url, headers=None, **kwargs):
+        """
+        Blocking GET through the pooled session. Same signature and return
+        value as requests.get, so existing callers keep their error handling.
+        Transport errors and 429/5xx are retried with backoff; what still
+        fails lands in self.dead_letters.
+        """
+        start = time.perf_counter()
+        entry, fresh, headers = self._cache_lookup(url, headers)
+        if fresh:
+            return self._from_cache(url, entry, start, _requests_response)
+
+        kwargs.setdefault("timeout", self.retry.timeout)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                self.breaker.before_request(url)
+            except CircuitOpenError as e:
+                self._give_up(url, e, attempt)
+                raise
+            self.rate_limiter.acquire(url)
+            start = time.perf_counter()
+            try:
+                resp = self.session.get(url, headers=headers, **kwargs)
+            except requests.exceptions.RequestException as e:
+                self.stats.record(url, None, time.perf_counter() - start, 0)
+                self.breaker.record_failure(url)
+                if attempt >= self.retry.max_attempts:
+                    self._give_up(url, e, attempt)
+                    raise
+                time.sleep(self.retry.delay(attempt))
+                continue
+
+            retry_after = resp.headers.get("Retry-After")
+            self.rate_limiter.observe(url, resp.status_code, retry_after)
+            if resp.status_code not in self.retry.retry_statuses:
+                self.breaker.record_success(url)
+                self.dead_letters.discard(url)
+                return self._finish(url, entry, resp, start, _requests_response)
+
+            self.stats.record(url, resp.status_code, time.perf_counter() - start, len(resp.content))
+            self.breaker.record_failure(url)
+            if attempt >= self.retry.max_attempts:
+                self._give_up(url, f"HTTP {resp.status_code}", attempt)
+                return resp
+            time.sleep(self.retry.delay(attempt, parse_retry_after(retry_after)))
+
+    def _async_client(self):
+        if self._aclient is None:
+            limits = httpx.Limits(max_connections=self.pool_connections * self.pool_maxsize,
+                                  max_keepalive_connections=self.pool_maxsize)
+            self._aclient = httpx.AsyncClient(headers=self.headers, limits=limits,
+                                              follow_redirects=True)
+        return self._aclient
+
+    async def aget(self, url, headers=None, **kwargs):
+        """
+        Async GET through the pooled httpx client. Returns an httpx.Response.
+        Same retry, circuit-breaker and dead-letter behaviour as get(); an
+        open circuit raises CircuitOpenError.
+        """
+        start = time.perf_counter()
+        entry, fresh, headers = self._cache_lookup(url, headers)
+        if fresh:
+            return self._from_cache(url, entry, start, _httpx_response)
+
+        kwargs.setdefault("timeout", self.retry.timeout)
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                self.breaker.before_request(url)
+            except CircuitOpenError as e:
+                self._give_up(url, e, attempt)
+                raise
+            await self.rate_limiter.aacquire(url)
+            start = time.perf_counter()
+            try:
+                resp = await self._async_client().get(url, headers=headers, **kwargs)
+            except httpx.HTTPError as e:
+                self.stats.record(url, None, time.perf_counter() - start, 0)
+                self.breaker.record_failure(url)
+                if attempt >= self.retry.max_attempts:
+                    self._give_up(url, e, attempt)
+                    raise
+                await asyncio.sleep(self.retry.delay(attempt))
+                continue
+
+            retry_after = resp.headers.get("Retry-After")
+            self.rate_limiter.observe(url, resp.status_code, retry_after)
+            if resp.status_code not in self.retry.retry_statuses:
+                self.breaker.record_success(url)
+                self.dead_letters.discard(url)
+                return self._finish(url, entry, resp, start, _httpx_response)
+
+            self.stats.record(url, resp.status_code, time.perf_counter() - start, len(resp.content))
+            self.breaker.record_failure(url)
+            if attempt >= self.retry.max_attempts:
+                self._give_up(url, f"HTTP {resp.status_code}", attempt)
+                return resp
+            await asyncio.sleep(self.retry.delay(attempt, parse_retry_after(retry_after)))
+
+    async def aclose(self):
+        """
+        Close the async client. It is bound to the running event loop, so
+        call this before that loop ends; the next aget() opens a new one.
+        """
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    def close(self):
+        self.session.close()
+
+
+def _requests_response(entry):
+    """Build a requests.Response for a cached entry."""
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.url = entry.url
+    resp.headers = CaseInsensitiveDict(entry.headers)
+    resp.encoding = get_encoding_from_headers(resp.headers)
+    resp._content = entry.body
+    return resp
+
+
+def _httpx_response(entry):
+    """Build an httpx.Response for a cached entry."""
+    return httpx.Response(200, headers=entry.headers, content=entry.body,
+                          request=httpx.Request("GET", entry.url))
+
+
+_shared_fetcher = None
+_shared_lock = threading.Lock()
+
+
+def get_fetcher():
+    """Return the process-wide HelixFetcher, creating it on first use."""
+    global _shared_fetcher
+    with _shared_lock:
+        if _shared_fetcher is None:
+            _shared_fetcher = HelixFetcher()
+        return _shared_fetcher
+
+
+def configure_fetcher(factory=HelixFetcher, **kwargs):
+    """
+    Replace the process-wide fetcher, e.g. to tune pool sizes:
+        configure_fetcher(pool_connections=4, pool_maxsize=32)
+    factory is the fetcher class, e.g. helix_archive.ArchiveFetcher.
+    """
+    global _shared_fetcher
+    with _shared_lock:
+        if _shared_fetcher is not None:
+            _shared_fetcher.close()
+        _shared_fetcher = factory(**kwargs)
+        return _shared_fetcher
@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+
+DEFAULT_CACHE_DIR = ".helix_http_cache"
+DEFAULT_TTL_SEC = 60 * 60  # anything not matched below is revalidated after an hour
+FOREVER = None             # TTL meaning "never revalidate"
+
+
+def default_ttl_rules(current_year=None):
+    """
+    TTL policy as an ordered list of (compiled regex, ttl seconds or FOREVER).
+    The first rule whose pattern matches the URL wins.
+
+      - past roundtable year listings (/roundtables/2012/ ...) and any page
+        whose path is under one (/roundtables/2012/<slug>/) never change
+        once that year is over, so they are served from cache without
+        revalidation. The pattern's first group is the year: an entry
+        stored during that year (a listing fetched before its last
+        roundtables went up) is still revalidated, see is_fresh();
+      - participant bios change occasionally, so they are revalidated weekly;
+      - everything else, including the current year's pages and any
+        roundtable detail page whose URL does not carry its year, falls to
+        the default TTL (an hour). The rules only see the URL, so a detail
+        page is pinned only if its permalink includes the year; otherwise it
+        is revalidated hourly with a conditional GET, which costs a 304.
+    """
+    if current_year is None:
+        current_year = datetime.now().year
+    past_years = "|".join(str(y) for y in range(2000, current_year))
+    return [
+        (re.compile(rf"/roundtables/({past_years})/"), FOREVER),
+        (re.compile(r"/participants/"), 7 * 24 * 60 * 60),
+    ]
+
+
+class CacheEntry:
+    def __init__(self, meta, body):
+        self.meta = meta
+        self.body = body
+
+    @property
+    def url(self):
+        return self.meta["url"]
+
+    @property
+    def headers(self):
+        return self.meta["headers"]
+
+    def validators(self):
+        """Conditional-GET headers for revalidating this entry."""
+        headers = {}
+        if self.meta.get("etag"):
+            headers["If-None-Match"] = self.meta["etag"]
+        if self.meta.get("last_modified"):
+            headers["If-Modified-Since"] = self.meta["last_modified"]
+        return headers
+
+
+class HttpCache:
+    """
+    On-disk response cache keyed by URL. Each entry is two files:
+    <sha256(url)>.json (url, headers, validators, stored_at) and
+    <sha256(url)>.body (the decoded response body).
+    Only 200 responses are stored.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, ttl_rules=None, default_ttl=DEFAULT_TTL_SEC):
+        self.cache_dir = cache_dir
+        self.ttl_rules = default_ttl_rules() if ttl_rules is None else ttl_rules
+        self.default_ttl = default_ttl
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return base + ".json", base + ".body"
+
+    def ttl_for(self, url, stored_at=None):
+        """
+        TTL of the first rule matching url. A FOREVER rule whose pattern
+        captures a year only applies to entries stored after that year
+        ended; earlier ones get the default TTL, so they are revalidated
+        once and, after the 304 or refetch, kept for good.
+        """
+        for pattern, ttl in self.ttl_rules:
+            match = pattern.search(url)
+            if not match:
+                continue
+            if ttl is FOREVER and stored_at is not None and match.groups():
+                if datetime.fromtimestamp(stored_at).year <= int(match.group(1)):
+                    return self.default_ttl
+            return ttl
+        return self.default_ttl
+
+    def lookup(self, url):
+        """Return the CacheEntry for url, or None if it is not cached."""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(meta, body)
+
+    def is_fresh(self, entry):
+        ttl = self.ttl_for(entry.url, entry.meta["stored_at"])
+        if ttl is FOREVER:
+            return True
+        return time.time() - entry.meta["stored_at"] < ttl
+
+    def store(self, url, headers, body):
+        """Store a 200 response. headers is any mapping of response headers."""
+        meta = {
+            "url": url,
+            "headers": {"Content-Type": headers.get("Content-Type", "")},
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "stored_at": time.time(),
+        }
+        meta_path, body_path = self._paths(url)
+        _atomic_write(body_path, body)
+        _atomic_write(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+
+    def touch(self, entry):
+        """Mark a revalidated (304) entry as fresh again."""
+        entry.meta["stored_at"] = time.time()
+        meta_path, _ = self._paths(entry.url)
+        _atomic_write(meta_path, json.dumps(entry.meta, ensure_ascii=False).encode("utf-8"))
+
+
+def _atomic_write(path, data):
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
@@ -0,0 +1,127 @@
+import json
+import os
+from datetime import datetime
+
+import requests
+
+from helix_fetcher import get_fetcher
+from step1_crawl_helix_requests_openai import (
+    BASE_URL,
+    START_YEAR,
+    END_YEAR,
+    HEADERS,
+    parse_year_listing,
+    fetch_roundtable_page,
+    build_roundtable_record,
+    page_hash,
+    manifest_filename,
+)
+
+
+def load_snapshot(previous_filename):
+    """
+    Load a previous step1 output and its URL manifest.
+    Returns (roundtables, manifest); manifest is {} for snapshots written
+    before manifests existed.
+    """
+    with open(previous_filename, "r", encoding="utf-8") as f:
+        roundtables = json.load(f)
+
+    manifest = {}
+    previous_manifest = manifest_filename(previous_filename)
+    if os.path.exists(previous_manifest):
+        with open(previous_manifest, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    else:
+        print(f"[INFO] No manifest {previous_manifest}; every listed roundtable will be "
+              f"fetched once and matched to the snapshot by (title, date).")
+    return roundtables, manifest
+
+
+def crawl_incremental(previous_filename, base_url=BASE_URL, start_year=START_YEAR,
+                      end_year=END_YEAR, recheck_from_year=None, redrive_urls=None):
+    """
+    Re-crawl only what is new or may have changed since previous_filename:
+
+      - every year listing is fetched (that is how new roundtables appear);
+      - roundtable URLs already in the manifest from years before
+        recheck_from_year (default: the current year) are kept as-is
+        without any request;
+      - known URLs from recheck_from_year onwards are re-fetched and only
+        re-parsed (with speaker pages) if the page fingerprint changed;
+      - unseen URLs are crawled in full.
+
+    redrive_urls (from a dead-letter file) forces a rebuild of any known
+    roundtable whose own URL or one of whose speaker pages is listed.
+
+    Existing records keep their `id`; new ones get ids after the current
+    maximum, in listing order. Returns (roundtables, manifest).
+    """
+    if recheck_from_year is None:
+        recheck_from_year = datetime.now().year
+    redrive_urls = set(redrive_urls or ())
+
+    roundtables, manifest = load_snapshot(previous_filename)
+    by_id = {rt["id"]: rt for rt in roundtables}
+    by_title_date = {(rt.get("title"), rt.get("date")): rt for rt in roundtables}
+    next_id = max(by_id, default=0) + 1
+    headers = HEADERS
+    counts = {"kept": 0, "unchanged": 0, "changed": 0, "new": 0}
+
+    for year in range(start_year, end_year + 1):
+        year_url = f"{base_url}{year}/"
+        print(f"\n[DEBUG] Fetching roundtables for year={year} : {year_url}")
+        try:
+            resp = get_fetcher().get(year_url, headers=headers)
+            if resp.status_code != 200:
+                print(f"[DEBUG] Skipping {year_url}, status={resp.status_code}")
+                continue
+        except requests.exceptions.RequestException as e:
+            print(f"[DEBUG] RequestException for {year_url}: {e}")
+            continue
+
+        for rt_link in parse_year_listing(resp.text):
+            known = manifest.get(rt_link)
+            if known and known["id"] not in by_id:
+                known = None
+            forced = bool(known) and (rt_link in redrive_urls
+                                      or redrive_urls.intersection(known.get("speaker_urls", ())))
+            if known and not forced and year < recheck_from_year:
+                counts["kept"] += 1
+                continue
+
+            html = fetch_roundtable_page(rt_link, headers, year=year)
+            if html is None:
+                continue
+            fingerprint = page_hash(html)
+            if known and not forced and known["page_sha256"] == fingerprint:
+                counts["unchanged"] += 1
+                continue
+
+            speaker_urls = []
+            rt_data = build_roundtable_record(html, headers, year=year, speaker_urls=speaker_urls)
+            previous = by_id.get(known["id"]) if known else None
+            if previous is None:
+                previous = by_title_date.get((rt_data["title"], rt_data["date"]))
+
+            if previous is not None:
+                rt_data["id"] = previous["id"]
+                if rt_data != previous:
+                    counts["changed"] += 1
+                    previous.clear()
+                    previous.update(rt_data)
+                else:
+                    counts["unchanged"] += 1
+            else:
+                rt_data["id"] = next_id
+                next_id += 1
+                counts["new"] += 1
+                roundtables.append(rt_data)
+                by_id[rt_data["id"]] = rt_data
+
+            manifest[rt_link] = {"id": rt_data["id"], "year": year, "page_sha256": fingerprint,
+                                 "speaker_urls": speaker_urls}
+
+    print(f"[INFO] Incremental crawl: {counts['new']} new, {counts['changed']} changed, "
+          f"{counts['unchanged']} unchanged, {counts['kept']} kept without fetching")
+    return roundtables, manifest
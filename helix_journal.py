@@ -0,0 +1,121 @@
+import json
+import os
+import threading
+import time
+
+DEFAULT_JOURNAL_FILENAME = "helixcenter_openai_crawl_journal.jsonl"
+FSYNC_EVERY = 16        # enrichment journal: records per fsync...
+FSYNC_INTERVAL_SEC = 2  # ...or seconds since the last one, whichever comes first
+
+
+def read_journal(filename):
+    """
+    Entries of a JSONL journal, oldest first. A torn last line (from a
+    crash mid-write) is cut off the file so later appends start cleanly.
+    """
+    if not os.path.exists(filename):
+        return []
+    with open(filename, "rb+") as f:
+        data = f.read()
+        complete = data.rfind(b"\n") + 1
+        if complete < len(data):
+            print(f"[WARN] Dropping torn last line of {filename}")
+            f.truncate(complete)
+    return [json.loads(line) for line in data[:complete].decode("utf-8").splitlines()]
+
+
+class CrawlJournal:
+    """
+    Append-only JSONL journal of finished roundtables, one line each:
+        {"url", "year", "page_sha256", "speaker_urls", "record"}
+    Each line is flushed and fsync'd as soon as the roundtable is done, so a
+    crash loses at most the roundtable in flight. On restart the journal is
+    read back and already-finished URLs are skipped (a torn last line from
+    the crash is ignored).
+    """
+
+    def __init__(self, filename=DEFAULT_JOURNAL_FILENAME):
+        self.filename = filename
+        self.lock = threading.Lock()
+        self.done = self._load()
+        if self.done:
+            print(f"[INFO] Resuming from {filename}: {len(self.done)} roundtables already crawled")
+        self.f = open(filename, "a", encoding="utf-8")
+
+    def _load(self):
+        return {entry["url"]: entry for entry in read_journal(self.filename)}
+
+    def get(self, url):
+        """Return the journaled entry for url, or None if it has not been crawled."""
+        return self.done.get(url)
+
+    def append(self, url, year, record, page_sha256, speaker_urls):
+        entry = {"url": url, "year": year, "page_sha256": page_sha256,
+                 "speaker_urls": speaker_urls, "record": record}
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self.lock:
+            self.f.write(line)
+            self.f.flush()
+            os.fsync(self.f.fileno())
+            self.done[url] = entry
+
+    def close(self):
+        self.f.close()
+
+    def finish(self):
+        """The crawl's output is safely written: the journal is no longer needed."""
+        self.close()
+        os.remove(self.filename)
+
+
+class EnrichmentJournal:
+    """
+    Append-only JSONL journal of step2 results, one line per roundtable:
+        {"id", "fields"}
+    Every line is flushed right away, so a crashed process loses nothing;
+    fsync is batched (every FSYNC_EVERY lines or FSYNC_INTERVAL_SEC) to
+    bound what an OS crash can lose without syncing once per record.
+    Resume is keyed by roundtable id; the last line for an id wins.
+    """
+
+    def __init__(self, filename, fsync_every=FSYNC_EVERY, fsync_interval=FSYNC_INTERVAL_SEC):
+        self.filename = filename
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.lock = threading.Lock()
+        self.done = {entry["id"]: entry["fields"] for entry in read_journal(filename)}
+        if self.done:
+            print(f"[INFO] Resuming from {filename}: {len(self.done)} roundtables already enriched")
+        self.f = open(filename, "a", encoding="utf-8")
+        self.unsynced = 0
+        self.synced_at = time.monotonic()
+
+    def get(self, roundtable_id):
+        """Return the journaled fields for roundtable_id, or None."""
+        return self.done.get(roundtable_id)
+
+    def append(self, roundtable_id, fields):
+        line = json.dumps({"id": roundtable_id, "fields": fields}, ensure_ascii=False) + "\n"
+        with self.lock:
+            self.f.write(line)
+            self.f.flush()
+            self.done[roundtable_id] = fields
+            self.unsynced += 1
+            if (self.unsynced >= self.fsync_every
+                    or time.monotonic() - self.synced_at >= self.fsync_interval):
+                self._sync()
+
+    def _sync(self):
+        os.fsync(self.f.fileno())
+        self.unsynced = 0
+        self.synced_at = time.monotonic()
+
+    def close(self):
+        with self.lock:
+            self._sync()
+            self.f.close()
+
+    def finish(self):
+        """The final output is safely written: the journal is no longer needed."""
+        self.close()
+        os.remove(self.filename)
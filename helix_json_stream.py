@@ -0,0 +1,212 @@
+import threading
+import time
+from collections import Counter
+
+# What a JSON value of each Python type must start with
+VALUE_STARTS = {
+    str: '"',
+    list: "[",
+    dict: "{",
+    int: "-0123456789",
+    float: "-0123456789",
+    bool: "tf",
+}
+WHITESPACE = " \t\r\n"
+
+
+class StreamViolation(ValueError):
+    """A streamed answer broke the expected shape before it finished."""
+    pass
+
+
+class StreamingFieldValidator:
+    """
+    Incremental check of a streamed JSON object against {field: type}.
+    feed() takes each text delta as it arrives and raises StreamViolation
+    as soon as the answer can no longer be valid: text before the opening
+    brace (prose, code fences), an unknown or repeated key, or a value that
+    starts as the wrong JSON type. Values are not parsed here; json.loads
+    of the finished text does that. Records when the first token and each
+    complete field arrived, in seconds from `start`.
+    """
+
+    def __init__(self, field_types, start=None):
+        self.field_types = field_types
+        self.start = time.monotonic() if start is None else start
+        self.state = "start"
+        self.text = []
+        self.key = []
+        self.current = None
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.first_token_sec = None
+        self.field_secs = {}
+
+    @property
+    def first_field_sec(self):
+        return min(self.field_secs.values()) if self.field_secs else None
+
+    @property
+    def complete(self):
+        return self.state == "done"
+
+    def answer(self):
+        return "".join(self.text)
+
+    def _fail(self, message):
+        raise StreamViolation(f"{message} (after {len(self.answer())} characters)")
+
+    def _field_done(self):
+        self.field_secs[self.current] = time.monotonic() - self.start
+        self.state = "comma_or_end"
+
+    def feed(self, delta):
+        if self.first_token_sec is None and delta:
+            self.first_token_sec = time.monotonic() - self.start
+        self.text.append(delta)
+        for ch in delta:
+            self._step(ch)
+
+    def _step(self, ch):
+        state = self.state
+        if state == "value":
+            self._step_value(ch)
+        elif state == "key":
+            if self.escaped:
+                self.escaped = False
+                self.key.append(ch)
+            elif ch == "\\":
+                self.escaped = True
+                self.key.append(ch)
+            elif ch == '"':
+                key = "".join(self.key)
+                if key not in self.field_types:
+                    self._fail(f"unexpected field {key!r}")
+                if key in self.field_secs:
+                    self._fail(f"repeated field {key!r}")
+                self.current = key
+                self.state = "colon"
+            else:
+                self.key.append(ch)
+        elif ch in WHITESPACE:
+            return
+        elif state == "start":
+            if ch != "{":
+                self._fail(f"answer starts with {ch!r}, not a JSON object")
+            self.state = "key_or_end"
+        elif state == "key_or_end":
+            if ch == '"':
+                self.key = []
+                self.state = "key"
+            elif ch == "}" and not self.field_secs:
+                self.state = "done"
+            else:
+                self._fail(f"expected a field name, got {ch!r}")
+        elif state == "colon":
+            if ch != ":":
+                self._fail(f"expected ':' after {self.current!r}, got {ch!r}")
+            self.state = "value_start"
+        elif state == "value_start":
+            expected = self.field_types[self.current]
+            if ch not in VALUE_STARTS[expected]:
+                self._fail(f"{self.current!r} should be a {expected.__name__}, starts with {ch!r}")
+            self.state = "value"
+            self.depth = 0
+            self.in_string = False
+            self._step_value(ch)
+        elif state == "comma_or_end":
+            if ch == ",":
+                self.state = "key_or_end"
+            elif ch == "}":
+                self.state = "done"
+            else:
+                self._fail(f"expected ',' or '}}' after {self.current!r}, got {ch!r}")
+        elif state == "done":
+            self._fail(f"text after the closing brace: {ch!r}")
+
+    def _step_value(self, ch):
+        if self.in_string:
+            if self.escaped:
+                self.escaped = False
+            elif ch == "\\":
+                self.escaped = True
+            elif ch == '"':
+                self.in_string = False
+                if self.depth == 0:
+                    self._field_done()
+            return
+        if ch == '"':
+            self.in_string = True
+        elif ch in "[{":
+            self.depth += 1
+        elif ch in "]}":
+            if self.depth == 0:
+                # A bare number/literal ended with the object
+                self._field_done()
+                self._step(ch)
+                return
+            self.depth -= 1
+            if self.depth == 0:
+                self._field_done()
+        elif self.depth == 0 and (ch == "," or ch in WHITESPACE):
+            # End of a bare number/literal
+            self._field_done()
+            self._step(ch)
+
+
+class StreamMetrics:
+    """
+    Latency of streamed answers across worker threads: time to first token,
+    time to first complete field and to the whole answer, plus how many
+    answers were cut off early (StreamViolation) and how many characters
+    that skipped. Streams ended by anything else (HTTP errors, 429s,
+    timeouts) are counted apart by exception class.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.first_token = []
+        self.first_field = []
+        self.total = []
+        self.aborted = 0
+        self.aborted_chars = 0
+        self.failed = Counter()
+
+    def record(self, validator, error=None):
+        """Record one stream; error is the exception that ended it, or None if it finished."""
+        total_sec = time.monotonic() - validator.start
+        with self.lock:
+            if validator.first_token_sec is not None:
+                self.first_token.append(validator.first_token_sec)
+            if validator.first_field_sec is not None:
+                self.first_field.append(validator.first_field_sec)
+            if isinstance(error, StreamViolation):
+                self.aborted += 1
+                self.aborted_chars += len(validator.answer())
+            elif error is not None:
+                self.failed[type(error).__name__] += 1
+            else:
+                self.total.append(total_sec)
+
+    @staticmethod
+    def _percentiles(values):
+        if not values:
+            return "n/a"
+        values = sorted(values)
+        p50 = values[len(values) // 2]
+        p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+        return f"p50 {p50:.2f}s, p95 {p95:.2f}s"
+
+    def print_summary(self):
+        if not (self.total or self.aborted or self.failed):
+            return
+        print(f"[INFO] Streaming: first token {self._percentiles(self.first_token)}; "
+              f"first field {self._percentiles(self.first_field)}; "
+              f"full answer {self._percentiles(self.total)}")
+        if self.aborted:
+            print(f"[INFO] Streaming: {self.aborted} answers aborted early after "
+                  f"{self.aborted_chars / self.aborted:.0f} characters on average")
+        if self.failed:
+            print(f"[INFO] Streaming: {sum(self.failed.values())} streams failed before finishing "
+                  f"(not schema aborts): {dict(self.failed)}")
@@ -0,0 +1,60 @@
+import hashlib
+import json
+import os
+import threading
+
+from helix_http_cache import _atomic_write
+
+DEFAULT_LLM_CACHE_DIR = ".helix_llm_cache"
+
+
+def content_key(model, messages, **params):
+    """
+    Cache key for one LLM request: sha256 over the model, the sampling
+    parameters and the full prompt. The prompt carries both the template
+    and the roundtable's input fields, so editing either one misses.
+    """
+    payload = json.dumps({"model": model, "params": params, "messages": messages},
+                         sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """
+    On-disk cache of parsed LLM answers: <cache_dir>/<content_key>.json
+    holds the JSON fields the model returned for that exact request. Only
+    successfully parsed answers are stored, so failures are asked again.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_LLM_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def get(self, key):
+        """Return the cached fields for key, or None."""
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                fields = json.load(f)
+        except (OSError, ValueError):
+            fields = None
+        with self.lock:
+            if fields is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return fields
+
+    def put(self, key, fields):
+        _atomic_write(self._path(key), json.dumps(fields, ensure_ascii=False).encode("utf-8"))
+
+    def print_summary(self):
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0.0
+        print(f"[INFO] LLM cache: {self.hits} reused, {self.misses} sent to the model "
+              f"({rate:.1f}% hit rate)")
@@ -0,0 +1,149 @@
+import getpass
+import os
+import threading
+from urllib.parse import urlsplit
+
+from openai import OpenAI, AsyncOpenAI
+
+from helix_llm_stub import add_stub_arguments, stub_from_args
+
+DEFAULT_MODEL = "gpt-4"
+STUB_API_KEY = "stub"
+OPENAI_HOST = "api.openai.com"
+
+
+class LLMProvider:
+    """
+    Where chat completions go. Clients are built on first use, so importing
+    a script or choosing a provider never asks for an API key. complete()
+    and acomplete() call chat.completions.create with the provider's model;
+    timeout and max_retries apply to that call only.
+    """
+
+    name = None
+
+    def __init__(self, model=DEFAULT_MODEL):
+        self.model = model
+        self.lock = threading.Lock()
+        self._client = None
+        self._async_client = None
+
+    @property
+    def cache_namespace(self):
+        """Model name for LLM cache keys; only real answers share the bare model name."""
+        return f"{self.name}/{self.model}"
+
+    def connect(self):
+        """(api_key, base_url or None) for the clients."""
+        raise NotImplementedError
+
+    @property
+    def client(self):
+        with self.lock:
+            if self._client is None:
+                api_key, base_url = self.connect()
+                self._client = OpenAI(api_key=api_key, base_url=base_url)
+            return self._client
+
+    @property
+    def async_client(self):
+        with self.lock:
+            if self._async_client is None:
+                api_key, base_url = self.connect()
+                self._async_client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+            return self._async_client
+
+    @staticmethod
+    def _options(client, timeout, max_retries):
+        options = {k: v for k, v in (("timeout", timeout), ("max_retries", max_retries)) if v is not None}
+        return client.with_options(**options) if options else client
+
+    def complete(self, messages, timeout=None, max_retries=None, **params):
+        return self._options(self.client, timeout, max_retries).chat.completions.create(
+            model=self.model, messages=messages, **params)
+
+    async def acomplete(self, messages, timeout=None, max_retries=None, **params):
+        return await self._options(self.async_client, timeout, max_retries).chat.completions.create(
+            model=self.model, messages=messages, **params)
+
+    def close(self):
+        pass
+
+
+class OpenAIProvider(LLMProvider):
+    """
+    The OpenAI API, or any OpenAI-compatible endpoint at base_url. The key
+    is api_key, else $OPENAI_API_KEY, else asked for once at first use.
+    """
+
+    name = "openai"
+
+    def __init__(self, model=DEFAULT_MODEL, api_key=None, base_url=None):
+        super().__init__(model)
+        self.api_key = api_key
+        self.base_url = base_url
+
+    @property
+    def cache_namespace(self):
+        """
+        The bare model name for the OpenAI API itself (so existing cache
+        entries still hit); any other endpoint's answers are keyed under
+        its host as well.
+        """
+        base_url = self.base_url or os.environ.get("OPENAI_BASE_URL")
+        host = urlsplit(base_url).netloc if base_url else OPENAI_HOST
+        if host == OPENAI_HOST:
+            return self.model
+        return f"{host}/{self.model}"
+
+    def connect(self):
+        if self.api_key is None:
+            self.api_key = os.environ.get("OPENAI_API_KEY") or getpass.getpass("Enter your OpenAI API key: ")
+        return self.api_key, self.base_url
+
+
+class StubProvider(LLMProvider):
+    """
+    A helix_llm_stub.StubServer started in-process on a free port, for
+    offline runs and load tests. `server` is built by the caller (see
+    stub_from_args()); its request counts are printed on close().
+    """
+
+    name = "stub"
+
+    def __init__(self, server, model=DEFAULT_MODEL):
+        super().__init__(model)
+        self.server = server
+
+    def connect(self):
+        if self.server.thread is None:
+            self.server.start()
+            print(f"[INFO] Using the local LLM stub at {self.server.base_url}")
+        return STUB_API_KEY, self.server.base_url
+
+    def close(self):
+        if self.server.thread is None:
+            self.server.server_close()
+            return
+        self.server.stop()
+        self.server.print_summary()
+
+
+PROVIDERS = ("openai", "stub")
+
+
+def add_provider_arguments(parser, default_model=DEFAULT_MODEL):
+    parser.add_argument("--provider", choices=PROVIDERS, default="openai",
+                        help="Where LLM requests go: the OpenAI API, or a local stub server "
+                             "(no key, no network) configured with the --stub-* options.")
+    parser.add_argument("--model", default=default_model, help="Chat model to send requests to.")
+    parser.add_argument("--base-url", default=None,
+                        help="OpenAI-compatible endpoint for --provider openai "
+                             "(default: $OPENAI_BASE_URL or the OpenAI API).")
+    add_stub_arguments(parser.add_argument_group("local stub (--provider stub)"), prefix="stub-")
+
+
+def provider_from_args(args):
+    if args.provider == "stub":
+        return StubProvider(stub_from_args(args, prefix="stub-"), model=args.model)
+    return OpenAIProvider(model=args.model, base_url=args.base_url)
@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+
+import argparse
+import itertools
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Local stand-in for the parts of the OpenAI API step2 and step4 use: chat
+# completions, file upload/download and the Batch API. Point the client at
+# it with OPENAI_BASE_URL=http://127.0.0.1:<port>/v1 (any API key works),
+# or run them with --provider stub to start one in-process.
+
+
+SUMMARY_FIELDS = ("description_one-sentence", "description_summary", "keywords")
+CHARS_PER_TOKEN = 4
+CHUNK_CHARS = 16
+RATE_WINDOW_SEC = 60
+
+
+def canned_fields(prompt, summary_only=False):
+    """Schema-valid fields for the (single) roundtable block in prompt."""
+    title = re.search(r"^Title: (.*)$", prompt, re.M)
+    title = title.group(1) if title else ""
+    titles = re.findall(r"^title_\d+: (.*)$", prompt, re.M)
+    fields = {
+        "description_one-sentence": f"A roundtable on {title}.",
+        "description_summary": f"A roundtable on {title}. Panelists discuss it from several fields.",
+        "keywords": [w.lower() for w in re.findall(r"[A-Za-z]{5,}", title)][:6] or ["roundtable"],
+        "panelist_ct": len(re.findall(r"^name_\d+: ", prompt, re.M)),
+        "institutions": sorted({t.split(",")[-1].strip() for t in titles if "," in t}),
+        "specialities": sorted({t.split(",")[1].strip() for t in titles if t.count(",") >= 2}),
+    }
+    if summary_only:
+        return {field: fields[field] for field in SUMMARY_FIELDS}
+    return fields
+
+
+def canned_answer(messages):
+    """
+    A deterministic, schema-valid answer for a step2 prompt, built from the
+    roundtable(s) in the last message. Packed prompts get a JSON array with
+    one object per roundtable, keyed by its id. Prompts whose schema has no
+    panelist_ct get only the summary fields. step4's normalisation prompts
+    get an identity mapping of their terms.
+    """
+    prompt = messages[-1]["content"]
+    if "mapping of original to normalized terms" in prompt:
+        terms = prompt.split("\n", 1)[1] if "\n" in prompt else ""
+        return {term.strip(): term.strip() for term in terms.split(", ") if term.strip()}
+    summary_only = '"panelist_ct"' not in prompt
+    blocks = re.split(r"(?m)^Roundtable ID: ", prompt)[1:]
+    if len(blocks) <= 1 and "JSON array" not in prompt:
+        return canned_fields(prompt, summary_only)
+    return [{"id": block.split("\n", 1)[0].strip(), **canned_fields(block, summary_only)} for block in blocks]
+
+
+def chat_completion(body, content=None):
+    """OpenAI chat.completion object answering one request body (with content, if given)."""
+    prompt_tokens = sum(len(m["content"]) for m in body["messages"]) // CHARS_PER_TOKEN
+    if content is None:
+        content = json.dumps(canned_answer(body["messages"]), ensure_ascii=False)
+    completion_tokens = len(content) // CHARS_PER_TOKEN
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", ""),
+        "choices": [{"index": 0, "finish_reason": "stop",
+                     "message": {"role": "assistant", "content": content}}],
+        "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                  "total_tokens": prompt_tokens + completion_tokens},
+    }
+
+
+def chat_completion_chunks(body, chunk_chars=CHUNK_CHARS, content=None):
+    """The same answer as chat_completion(), as a list of chat.completion.chunk objects."""
+    completion = chat_completion(body, content)
+    content = completion["choices"][0]["message"]["content"]
+    base = {"id": completion["id"], "object": "chat.completion.chunk",
+            "created": completion["created"], "model": completion["model"]}
+    chunks = [dict(base, choices=[{"index": 0, "delta": {"role": "assistant", "content": ""},
+                                   "finish_reason": None}])]
+    for i in range(0, len(content), chunk_chars):
+        chunks.append(dict(base, choices=[{"index": 0, "delta": {"content": content[i:i + chunk_chars]},
+                                           "finish_reason": None}]))
+    chunks.append(dict(base, choices=[{"index": 0, "delta": {}, "finish_reason": "stop"}]))
+    if (body.get("stream_options") or {}).get("include_usage"):
+        chunks.append(dict(base, choices=[], usage=completion["usage"]))
+    return chunks
+
+
+def api_error(message, error_type, code=None):
+    """Error body in the shape the OpenAI client parses."""
+    return {"error": {"message": message, "type": error_type, "param": None, "code": code}}
+
+
+class LatencyModel:
+    """
+    Response latency drawn from a distribution, given in milliseconds as
+    "200" (fixed), "uniform:100,900", "normal:500,150" (clipped at 0),
+    "lognormal:500,0.6" (median and sigma of the log, for a long tail) or
+    "exponential:400" (mean).
+    """
+
+    SHAPES = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exponential": 1}
+
+    def __init__(self, spec="0"):
+        self.spec = spec
+        shape, _, params = spec.partition(":") if ":" in spec else ("fixed", "", spec)
+        if shape not in self.SHAPES:
+            raise ValueError(f"unknown latency distribution {shape!r}")
+        self.shape = shape
+        self.params = [float(p) / 1000 for p in params.split(",")]
+        if shape == "lognormal":
+            self.params[1] *= 1000  # sigma has no unit
+        if len(self.params) != self.SHAPES[shape] or min(self.params) < 0:
+            raise ValueError(f"latency {spec!r}: {shape} takes {self.SHAPES[shape]} non-negative numbers")
+
+    def __str__(self):
+        return self.spec
+
+    def sample(self, rng):
+        """Seconds to wait before answering."""
+        if self.shape == "fixed":
+            return self.params[0]
+        if self.shape == "uniform":
+            return rng.uniform(*self.params)
+        if self.shape == "normal":
+            return max(0.0, rng.gauss(*self.params))
+        if self.shape == "lognormal":
+            median, sigma = self.params
+            return median * math.exp(rng.gauss(0, sigma)) if median else 0.0
+        return rng.expovariate(1 / self.params[0]) if self.params[0] else 0.0
+
+
+def load_canned(filename):
+    """
+    Answers to serve in turn from a JSON file holding one answer or a list
+    of them: strings are sent as-is (so broken JSON can be served too),
+    anything else as its JSON text.
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        answers = json.load(f)
+    if not isinstance(answers, list) or not answers:
+        answers = [answers]
+    return [a if isinstance(a, str) else json.dumps(a, ensure_ascii=False) for a in answers]
+
+
+class StubState:
+    """Uploaded files and batches, shared by the handler threads."""
+
+    def __init__(self, batch_delay=1.0, answer=None):
+        self.batch_delay = batch_delay
+        self.answer = answer or (lambda body: None)
+        self.lock = threading.Lock()
+        self.files = {}
+        self.batches = {}
+
+    def add_file(self, content, filename, purpose):
+        file_id = f"file-{uuid.uuid4().hex}"
+        with self.lock:
+            self.files[file_id] = (content, {
+                "id": file_id, "object": "file", "bytes": len(content), "created_at": int(time.time()),
+                "filename": filename, "purpose": purpose, "status": "processed",
+            })
+        return self.files[file_id][1]
+
+    def add_batch(self, input_file_id, endpoint, completion_window):
+        batch_id = f"batch_{uuid.uuid4().hex}"
+        batch = {
+            "id": batch_id, "object": "batch", "endpoint": endpoint, "input_file_id": input_file_id,
+            "completion_window": completion_window, "status": "validating", "created_at": int(time.time()),
+            "output_file_id": None, "error_file_id": None,
+            "request_counts": {"total": 0, "completed": 0, "failed": 0},
+        }
+        with self.lock:
+            self.batches[batch_id] = batch
+        threading.Thread(target=self._run_batch, args=(batch_id,), daemon=True).start()
+        return dict(batch)
+
+    def _run_batch(self, batch_id):
+        batch = self.batches[batch_id]
+        lines = self.files[batch["input_file_id"]][0].decode("utf-8").splitlines()
+        with self.lock:
+            batch["status"] = "in_progress"
+            batch["request_counts"]["total"] = len(lines)
+        time.sleep(self.batch_delay)
+
+        outputs, errors = [], []
+        for line in lines:
+            request = json.loads(line)
+            try:
+                response = {"status_code": 200, "request_id": uuid.uuid4().hex,
+                            "body": chat_completion(request["body"], self.answer(request["body"]))}
+                outputs.append({"id": f"batch_req_{uuid.uuid4().hex}", "custom_id": request["custom_id"],
+                                "response": response, "error": None})
+            except (KeyError, TypeError) as e:
+                errors.append({"id": f"batch_req_{uuid.uuid4().hex}", "custom_id": request.get("custom_id"),
+                               "response": None, "error": {"code": "invalid_request", "message": str(e)}})
+
+        output_file = self.add_file("".join(json.dumps(o) + "\n" for o in outputs).encode("utf-8"),
+                                    "batch_output.jsonl", "batch_output")
+        error_file = self.add_file("".join(json.dumps(e) + "\n" for e in errors).encode("utf-8"),
+                                   "batch_errors.jsonl", "batch_output") if errors else None
+        with self.lock:
+            batch["output_file_id"] = output_file["id"]
+            batch["error_file_id"] = error_file["id"] if error_file else None
+            batch["request_counts"].update(completed=len(outputs), failed=len(errors))
+            batch["status"] = "completed"
+            batch["completed_at"] = int(time.time())
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; with Nagle on, a
+    # keep-alive client's delayed ACK stalls every reused connection ~40 ms
+    disable_nagle_algorithm = True
+
+    def _send_json(self, status, obj, headers=None):
+        self._send_bytes(status, json.dumps(obj).encode("utf-8"), "application/json", headers)
+
+    def _send_bytes(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_events(self, chunks, tokens_per_sec=None):
+        """Server-sent events, closing the connection to end the stream."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        try:
+            for chunk in chunks:
+                if tokens_per_sec and chunk["choices"]:
+                    text = chunk["choices"][0]["delta"].get("content") or ""
+                    time.sleep(len(text) / CHARS_PER_TOKEN / tokens_per_sec)
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+            self.wfile.write(b"data: [DONE]\n\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client stopped reading
+
+    def _body(self):
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def _chat_completion(self, body):
+        server = self.server
+        refusal = server.admit()
+        if refusal:
+            status, retry_after, error = refusal
+            headers = {"Retry-After": str(math.ceil(retry_after))} if retry_after is not None else None
+            self._send_json(status, error, headers)
+            return
+        time.sleep(server.sample_latency())
+        content = server.answer(body)
+        if body.get("stream"):
+            self._send_events(chat_completion_chunks(body, content=content), server.tokens_per_sec)
+            return
+        completion = chat_completion(body, content)
+        if server.tokens_per_sec:
+            time.sleep(completion["usage"]["completion_tokens"] / server.tokens_per_sec)
+        self._send_json(200, completion)
+
+    def do_POST(self):
+        state = self.server.state
+        path = self.path.split("?")[0]
+        if path.endswith("/chat/completions"):
+            self._chat_completion(json.loads(self._body()))
+        elif path.endswith("/files"):
+            head = f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode("utf-8")
+            form = BytesParser(policy=HTTP).parsebytes(head + self._body())
+            fields = {part.get_param("name", header="content-disposition"): part
+                      for part in form.iter_parts()}
+            upload = fields["file"]
+            self._send_json(200, state.add_file(upload.get_payload(decode=True), upload.get_filename(),
+                                                fields["purpose"].get_content().strip()))
+        elif path.endswith("/batches"):
+            body = json.loads(self._body())
+            self._send_json(200, state.add_batch(body["input_file_id"], body["endpoint"],
+                                                 body["completion_window"]))
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown endpoint {path}"}})
+
+    def do_GET(self):
+        state = self.server.state
+        path = self.path.split("?")[0]
+        match = re.search(r"/files/([^/]+)/content$", path)
+        if match and match.group(1) in state.files:
+            self._send_bytes(200, state.files[match.group(1)][0], "application/octet-stream")
+            return
+        match = re.search(r"/batches/([^/]+)$", path)
+        if match and match.group(1) in state.batches:
+            with state.lock:
+                batch = dict(state.batches[match.group(1)])
+            self._send_json(200, batch)
+            return
+        self._send_json(404, {"error": {"message": f"Unknown endpoint {path}"}})
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    Local OpenAI-compatible endpoint for offline load tests. Each chat
+    completion waits a `latency` sample (a LatencyModel), then
+    `tokens_per_sec` paces the answer (per chunk when streamed). Requests
+    beyond `rpm` in the last minute get a 429 with Retry-After, and a
+    further `rate_limit_rate` / `error_rate` of them a random 429 / 500.
+    Answers come from `canned` in turn if given (see load_canned()), else
+    from canned_answer(). Outcomes are counted in self.counts.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, batch_delay=1.0, latency=None, tokens_per_sec=None,
+                 rpm=None, rate_limit_rate=0.0, error_rate=0.0, canned=None, seed=None):
+        super().__init__((host, port), StubHandler)
+        self.state = StubState(batch_delay=batch_delay, answer=self.answer)
+        self.latency = latency or LatencyModel()
+        self.tokens_per_sec = tokens_per_sec
+        self.rpm = rpm
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.canned = itertools.cycle(canned) if canned else None
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.window = deque()
+        self.counts = Counter()
+        self.thread = None
+
+    @property
+    def base_url(self):
+        """Value for OPENAI_BASE_URL."""
+        return f"http://{self.server_address[0]}:{self.server_address[1]}/v1"
+
+    def admit(self):
+        """None to answer a chat completion, else (status, retry-after seconds, error body)."""
+        with self.lock:
+            self.counts["requests"] += 1
+            now = time.monotonic()
+            while self.window and now - self.window[0] >= RATE_WINDOW_SEC:
+                self.window.popleft()
+            roll = self.rng.random()
+            if self.rpm and len(self.window) >= self.rpm:
+                self.counts["rate_limited"] += 1
+                return 429, RATE_WINDOW_SEC - (now - self.window[0]), api_error(
+                    f"Rate limit reached: limit {self.rpm:g} requests per min", "requests", "rate_limit_exceeded")
+            if roll < self.rate_limit_rate:
+                self.counts["rate_limited"] += 1
+                return 429, 1, api_error("Rate limit reached (injected)", "requests", "rate_limit_exceeded")
+            if roll < self.rate_limit_rate + self.error_rate:
+                self.counts["server_error"] += 1
+                return 500, None, api_error("The server had an error (injected)", "server_error")
+            self.window.append(now)
+            self.counts["answered"] += 1
+        return None
+
+    def sample_latency(self):
+        with self.lock:
+            return self.latency.sample(self.rng)
+
+    def answer(self, body):
+        """The next canned answer text, or None for canned_answer()'s."""
+        if self.canned is None:
+            return None
+        with self.lock:
+            return next(self.canned)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def print_summary(self):
+        counts = self.counts
+        print(f"[INFO] Stub: {counts['requests']} chat completions; {counts['answered']} answered, "
+              f"{counts['rate_limited']} rate-limited (429), {counts['server_error']} server errors (500)")
+
+
+def add_stub_arguments(parser, prefix=""):
+    """Stub options; `prefix` (e.g. "stub-") keeps them apart from a host script's own flags."""
+    parser.add_argument(f"--{prefix}latency", type=LatencyModel, default=LatencyModel(),
+                        help="Milliseconds before each answer: N, uniform:A,B, normal:MEAN,SD, "
+                             "lognormal:MEDIAN,SIGMA or exponential:MEAN.")
+    parser.add_argument(f"--{prefix}tokens-per-sec", type=float, default=None,
+                        help="Pace answers at this many completion tokens per second.")
+    parser.add_argument(f"--{prefix}rpm", type=float, default=None,
+                        help="Answer at most this many requests per minute; the rest get a 429.")
+    parser.add_argument(f"--{prefix}rate-limit-rate", type=float, default=0.0,
+                        help="Fraction of requests answered with a random 429.")
+    parser.add_argument(f"--{prefix}error-rate", type=float, default=0.0,
+                        help="Fraction of requests answered with a 500.")
+    parser.add_argument(f"--{prefix}canned", default=None,
+                        help="JSON file of answers to serve in turn instead of generated ones.")
+    parser.add_argument(f"--{prefix}batch-delay", type=float, default=1.0,
+                        help="Seconds a submitted batch stays in_progress.")
+    parser.add_argument(f"--{prefix}seed", type=int, default=None)
+
+
+def stub_from_args(args, port=0, prefix=""):
+    def arg(name):
+        return getattr(args, (prefix + name).replace("-", "_"))
+
+    canned = load_canned(arg("canned")) if arg("canned") else None
+    return StubServer(port=port, batch_delay=arg("batch-delay"), latency=arg("latency"),
+                      tokens_per_sec=arg("tokens-per-sec"), rpm=arg("rpm"),
+                      rate_limit_rate=arg("rate-limit-rate"), error_rate=arg("error-rate"),
+                      canned=canned, seed=arg("seed"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible stub for step2 and step4.")
+    add_stub_arguments(parser)
+    parser.add_argument("--port", type=int, default=8900)
+    args = parser.parse_args()
+
+    server = stub_from_args(args, port=args.port)
+    print(f"[INFO] OpenAI stub listening; run step2 with OPENAI_BASE_URL={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.print_summary()
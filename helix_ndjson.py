@@ -0,0 +1,63 @@
+import json
+import sys
+
+
+def ndjson_filename(output_filename):
+    """helixcenter_openai_<ts>.json -> helixcenter_openai_<ts>.ndjson"""
+    return output_filename.rsplit(".", 1)[0] + ".ndjson"
+
+
+class NdjsonWriter:
+    """
+    Streams records to a newline-delimited JSON file, one roundtable per
+    line, flushed as soon as it is written so partial output is usable
+    while the crawl is still running.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.count = 0
+        self.f = open(filename, "w", encoding="utf-8")
+
+    def write(self, record):
+        self.f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.f.flush()
+        self.count += 1
+
+    def close(self):
+        self.f.close()
+        print(f"[INFO] Streamed {self.count} roundtables to {self.filename}")
+
+
+def iter_ndjson(filename):
+    """Yield the records of an NDJSON file one at a time."""
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def compact_ndjson(ndjson_filename, json_filename):
+    """
+    Rewrite an NDJSON file as the pretty JSON array step2 expects, byte for
+    byte what json.dump(records, f, indent=2, ensure_ascii=False) would
+    produce, while holding only one record in memory at a time.
+    """
+    count = 0
+    with open(json_filename, "w", encoding="utf-8") as out:
+        for record in iter_ndjson(ndjson_filename):
+            out.write("[\n  " if count == 0 else ",\n  ")
+            out.write(json.dumps(record, indent=2, ensure_ascii=False).replace("\n", "\n  "))
+            count += 1
+        out.write("\n]" if count else "[]")
+    print(f"[INFO] Compacted {count} roundtables from {ndjson_filename} into {json_filename}")
+    return count
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python helix_ndjson.py INPUT.ndjson [OUTPUT.json]")
+        sys.exit(1)
+    src = sys.argv[1]
+    dst = sys.argv[2] if len(sys.argv) == 3 else src.rsplit(".", 1)[0] + ".json"
+    compact_ndjson(src, dst)
@@ -0,0 +1,177 @@
+import re
+
+import lxml.html
+
+from step1_crawl_helix_requests_openai import split_date_time
+
+# lxml-native versions of the step1 parse_* functions, selected with
+# step1 --parser lxml-native. They walk the libxml2 tree directly instead of
+# going through BeautifulSoup, mirroring find()/find_all()/get_text() so the
+# extracted records are identical (bench_parsers.py checks that).
+
+# Text inside these elements is not part of BeautifulSoup's get_text()
+_SKIP_TEXT_TAGS = ("script", "style", "template")
+
+
+def _document(html):
+    if isinstance(html, str):
+        html = html.encode("utf-8")
+    parser = lxml.html.HTMLParser(encoding="utf-8")
+    return lxml.html.document_fromstring(html, parser=parser)
+
+
+def _iter_strings(el):
+    if not isinstance(el.tag, str) or el.tag in _SKIP_TEXT_TAGS:
+        return
+    if el.text:
+        yield el.text
+    for child in el:
+        yield from _iter_strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def get_text(el, separator="", strip=False):
+    """BeautifulSoup Tag.get_text() for an lxml element."""
+    strings = _iter_strings(el)
+    if strip:
+        strings = (s.strip() for s in strings)
+        strings = (s for s in strings if s)
+    return separator.join(strings)
+
+
+def _class_matches(el, class_):
+    """BeautifulSoup's class_ matching: any single class, or the whole attribute."""
+    classes = el.get("class", "").split()
+    if not classes:
+        return False
+    if isinstance(class_, str):
+        return class_ in classes or class_ == " ".join(classes)
+    return any(class_.search(c) for c in classes) or bool(class_.search(" ".join(classes)))
+
+
+def find_all(el, tag, class_=None, recursive=True):
+    candidates = el.iterdescendants(tag) if recursive else el.iterchildren(tag)
+    return [c for c in candidates if class_ is None or _class_matches(c, class_)]
+
+
+def find(el, tag, class_=None):
+    for c in el.iterdescendants(tag):
+        if class_ is None or _class_matches(c, class_):
+            return c
+    return None
+
+
+def parse_speaker_page(html):
+    root = _document(html)
+
+    article_tag = find(root, "article", re.compile(r"(participant|post-\d+)"))
+    if article_tag is None:
+        print("[DEBUG] crawl_speaker_page: No matching <article> found.")
+        return None
+
+    content_div = find(article_tag, "div", "entry-content")
+    if content_div is None:
+        print("[DEBUG] crawl_speaker_page: No <div class='entry-content'> found.")
+        return None
+
+    paras = find_all(content_div, "p")
+    return " ".join(get_text(p, " ", strip=True) for p in paras if get_text(p, strip=True))
+
+
+def parse_roundtable_detail(html, year=None):
+    root = _document(html)
+
+    roundtable_info = {
+        "id": None,
+        "title": "",
+        "date": "",
+        "time": "",
+        "description": "",
+        "panelist": {}
+    }
+    speaker_links = {}
+
+    title_tag = find(root, "h1", "entry-title")
+    if title_tag is not None:
+        roundtable_info["title"] = get_text(title_tag, strip=True)
+        print(f"[DEBUG] Roundtable title: {roundtable_info['title']}")
+
+    main_header = find(root, "header", "entry-header")
+    if main_header is not None:
+        col_md9_div = find(main_header, "div", "col-md-9")
+        if col_md9_div is not None:
+            for p_tag in find_all(col_md9_div, "p", recursive=False):
+                raw_text = get_text(p_tag, " ", strip=True)
+                if "AM" in raw_text or "PM" in raw_text:
+                    date_str, time_str = split_date_time(raw_text, year=year)
+                    roundtable_info["date"] = date_str
+                    roundtable_info["time"] = time_str
+                    print(f"[DEBUG] => date='{date_str}', time='{time_str}' from p_tag='{raw_text}'")
+                    break
+        else:
+            print("[DEBUG] Did not find <div class='col-md-9'> in header.")
+    else:
+        print("[DEBUG] No main_header found for date/time parsing.")
+
+    desc_div = find(root, "div", "entry-content")
+    if desc_div is not None:
+        desc_paras = find_all(desc_div, "p", recursive=False)
+        roundtable_info["description"] = " ".join(
+            get_text(p, strip=True) for p in desc_paras if get_text(p, strip=True)
+        )
+        print(f"[DEBUG] Roundtable description: {roundtable_info['description']}")
+
+    participants_div = find(root, "div", "roundtable-participants")
+    if participants_div is not None:
+        articles = find_all(participants_div, "article", re.compile(r"participant"))
+        print(f"[DEBUG] Found {len(articles)} participant entries.")
+        for idx, art in enumerate(articles, start=1):
+            name_tag = find(art, "h2", "entry-title")
+            name_str = get_text(name_tag, strip=True) if name_tag is not None else "Unknown"
+
+            speaker_title = ""
+            header_div = find(art, "header", "entry-header")
+            if header_div is not None:
+                p_title = find(header_div, "p")
+                if p_title is not None:
+                    speaker_title = get_text(p_title, strip=True)
+
+            short_bio = ""
+            entry_content_div = find(art, "div", "entry-content")
+            if entry_content_div is not None:
+                short_bio = " ".join(
+                    get_text(p, " ", strip=True)
+                    for p in find_all(entry_content_div, "p", recursive=False)
+                    if get_text(p, strip=True)
+                )
+                read_more_link = find(entry_content_div, "a", "read-more")
+                if read_more_link is not None and read_more_link.get("href"):
+                    speaker_links[idx] = read_more_link.get("href")
+
+            roundtable_info["panelist"][f"name_{idx}"] = name_str
+            roundtable_info["panelist"][f"title_{idx}"] = speaker_title
+            roundtable_info["panelist"][f"description_{idx}"] = short_bio
+    else:
+        print("[DEBUG] No <div class='roundtable-participants'> found for panelists.")
+
+    return roundtable_info, speaker_links
+
+
+def parse_year_listing(html):
+    root = _document(html)
+    events = find_all(root, "article", "roundtable")
+    if not events:
+        events = find_all(root, "div", "roundtable")
+    print(f"[DEBUG] Found {len(events)} events.")
+
+    rt_links = []
+    for evt in events:
+        a_tag = find(evt, "a")
+        if a_tag is None:
+            continue
+        rt_link = a_tag.get("href")
+        if not rt_link:
+            continue
+        rt_links.append(rt_link)
+    return rt_links
@@ -0,0 +1,108 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from urllib.parse import urlsplit, urlunsplit
+
+
+def canonical_participant_url(url):
+    """
+    Normalise a participant page URL so every spelling of the same page
+    shares one registry entry: lower-case scheme and host, no query or
+    fragment, and exactly one trailing slash on the path.
+    """
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/") + "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, "", ""))
+
+
+class ParticipantRegistry:
+    """
+    Crawl-wide memo of participant bios keyed by canonical participant URL.
+
+    Each URL is fetched exactly once. Threads asking for a URL that is
+    already being fetched block on the same concurrent.futures.Future;
+    coroutines await the same asyncio.Task. Failed fetches (None) are
+    memoised too, so a missing page is not retried once per roundtable.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.tasks = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, url, fetch):
+        """
+        Blocking lookup. fetch(url) is called only by the first caller for
+        a canonical URL; everyone else waits for and shares its result.
+        """
+        key = canonical_participant_url(url)
+        with self.lock:
+            future = self.entries.get(key)
+            if future is not None:
+                self.hits += 1
+                owner = False
+            else:
+                self.misses += 1
+                future = self.entries[key] = Future()
+                owner = True
+
+        if owner:
+            try:
+                future.set_result(fetch(url))
+            except Exception as e:
+                future.set_exception(e)
+        return future.result()
+
+    async def aget(self, url, fetch):
+        """
+        Async lookup. fetch(url) must return an awaitable; concurrent
+        callers for the same canonical URL await a single task. Finished
+        results are shared with blocking get() callers too.
+        """
+        key = canonical_participant_url(url)
+        with self.lock:
+            future = self.entries.get(key)
+            task = self.tasks.get(key)
+            if future is not None or task is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+                task = self.tasks[key] = asyncio.ensure_future(fetch(url))
+                task.add_done_callback(lambda t: self._task_done(key, t))
+        if future is not None:
+            return await asyncio.wrap_future(future)
+        return await asyncio.shield(task)
+
+    def _task_done(self, key, task):
+        future = Future()
+        if task.cancelled():
+            future = None
+        elif task.exception() is not None:
+            future.set_exception(task.exception())
+        else:
+            future.set_result(task.result())
+        with self.lock:
+            self.tasks.pop(key, None)
+            if future is not None:
+                self.entries[key] = future
+
+    def print_summary(self):
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0.0
+        print(f"[INFO] Participant registry: {self.misses} fetched, {self.hits} reused "
+              f"({rate:.1f}% hit rate)")
+
+
+_shared_registry = None
+_shared_lock = threading.Lock()
+
+
+def get_registry():
+    """Return the process-wide ParticipantRegistry, creating it on first use."""
+    global _shared_registry
+    with _shared_lock:
+        if _shared_registry is None:
+            _shared_registry = ParticipantRegistry()
+        return _shared_registry
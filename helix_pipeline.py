@@ -0,0 +1,132 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+import requests
+
+from helix_fetcher import get_fetcher
+from helix_participants import get_registry
+from helix_soup import configure_parser, get_parser
+import step1_crawl_helix_requests_openai as step1
+
+FETCH_WORKERS = 8
+PARSE_WORKERS = os.cpu_count() or 1
+
+
+class ParsePipeline:
+    """
+    Two-stage crawl: a thread pool does the blocking fetches and hands the
+    HTML to a ProcessPoolExecutor of parser workers (one per core by
+    default), which run the step1 parse_* functions. Network waits and
+    BeautifulSoup work overlap, and parsing is not serialised by the GIL.
+
+    Parser processes use the parser backend selected in this process when
+    the pipeline is created.
+    """
+
+    def __init__(self, fetch_workers=FETCH_WORKERS, parse_workers=PARSE_WORKERS,
+                 headers=step1.HEADERS):
+        self.headers = headers
+        self.fetch_pool = ThreadPoolExecutor(max_workers=fetch_workers)
+        self.parse_pool = ProcessPoolExecutor(
+            max_workers=parse_workers,
+            initializer=configure_parser,
+            initargs=(get_parser().name, get_parser().partial),
+        )
+
+    def parse(self, func, *args):
+        """Run a step1 parse_* function in a parser process and wait for its result."""
+        return self.parse_pool.submit(func, *args).result()
+
+    def speaker_bio(self, speaker_url):
+        html = step1.fetch_speaker_page(speaker_url, self.headers)
+        if html is None:
+            return None
+        return self.parse(step1.parse_speaker_page, html)
+
+    def roundtable(self, url, year, journal=None):
+        """
+        Fetch and parse one roundtable with its FULL speaker bios.
+        Returns (record, page_sha256, speaker_urls), or None if the page
+        could not be fetched.
+        """
+        html = step1.fetch_roundtable_page(url, self.headers, year=year)
+        if html is None:
+            return None
+        roundtable_info, speaker_links = self.parse(step1.parse_roundtable_detail, html, year)
+
+        registry = get_registry()
+        full_bios = {
+            idx: registry.get(speaker_page_href, self.speaker_bio)
+            for idx, speaker_page_href in speaker_links.items()
+        }
+        rt_data = step1.apply_speaker_bios(roundtable_info, full_bios)
+        fingerprint = step1.page_hash(html)
+        speaker_urls = list(speaker_links.values())
+        if journal is not None:
+            journal.append(url, year, rt_data, fingerprint, speaker_urls)
+        return rt_data, fingerprint, speaker_urls
+
+    def submit_roundtable(self, url, year, journal=None):
+        """Future for roundtable(), or an already-finished one for a journaled URL."""
+        done = journal.get(url) if journal is not None else None
+        if done is None:
+            return self.fetch_pool.submit(self.roundtable, url, year, journal)
+        print(f"[DEBUG] Already crawled (journal): {url}")
+        future = Future()
+        future.set_result((dict(done["record"]), done["page_sha256"], done["speaker_urls"]))
+        return future
+
+    def close(self):
+        self.fetch_pool.shutdown(wait=True, cancel_futures=True)
+        self.parse_pool.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_helixcenter_roundtables_pipelined(base_url=step1.BASE_URL, start_year=step1.START_YEAR,
+                                           end_year=step1.END_YEAR, manifest=None, journal=None,
+                                           fetch_workers=FETCH_WORKERS, parse_workers=PARSE_WORKERS):
+    """
+    Pipelined version of step1.iter_helixcenter_roundtables. Year listings
+    are fetched in order on the calling thread while the roundtables of
+    earlier years are fetched and parsed in the pools. Roundtables are
+    yielded (and given ids) in (year, listing) order, so the output,
+    manifest and journal are the same as the blocking crawler's.
+    """
+    pipeline = ParsePipeline(fetch_workers, parse_workers)
+    pending = deque()
+    current_id = 0
+
+    def finished(block):
+        nonlocal current_id
+        while pending and (block or pending[0][2].done()):
+            rt_link, year, future = pending.popleft()
+            result = future.result()
+            if result is None:
+                continue
+            rt_data, fingerprint, speaker_urls = result
+            current_id += 1
+            rt_data["id"] = current_id
+            if manifest is not None:
+                manifest[rt_link] = {"id": current_id, "year": year, "page_sha256": fingerprint,
+                                     "speaker_urls": speaker_urls}
+            yield rt_data
+
+    try:
+        for year in range(start_year, end_year + 1):
+            year_url = f"{base_url}{year}/"
+            print(f"\n[DEBUG] Fetching roundtables for year={year} : {year_url}")
+            try:
+                resp = get_fetcher().get(year_url, headers=pipeline.headers)
+                if resp.status_code != 200:
+                    print(f"[DEBUG] Skipping {year_url}, status={resp.status_code}")
+                    continue
+            except requests.exceptions.RequestException as e:
+                print(f"[DEBUG] RequestException for {year_url}: {e}")
+                continue
+
+            for rt_link in pipeline.parse(step1.parse_year_listing, resp.text):
+                pending.append((rt_link, year, pipeline.submit_roundtable(rt_link, year, journal)))
+            yield from finished(block=False)
+        yield from finished(block=True)
+    finally:
+        pipeline.close()
@@ -0,0 +1,151 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+DEFAULT_RATE = 4.0   # requests/second per host to start with
+DEFAULT_BURST = 5    # requests that may go out back-to-back
+MIN_RATE = 0.2
+MAX_RATE = 10.0
+RATE_STEP = 0.1      # additive increase per successful response
+BACKOFF_STATUSES = (429, 503)
+
+
+class TokenBucket:
+    """
+    Classic token bucket: refills at `rate` tokens/second up to `burst`.
+    reserve() always takes its tokens (the balance may go negative) and
+    returns how long the caller must wait before using them, so waiters
+    queue fairly.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount=1):
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= amount
+            wait = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+            return max(wait, self.blocked_until - now)
+
+    def refund(self, amount):
+        """Give back (or, if negative, take more) tokens after a reservation."""
+        with self.lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.burst, self.tokens + amount)
+
+    def block_for(self, seconds):
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+def parse_retry_after(value):
+    """Retry-After is either delta-seconds or an HTTP date. Returns seconds or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class HostRateLimiter:
+    """
+    Per-host token buckets shared by every fetch, with AIMD rate control:
+    each successful response raises the host's rate by RATE_STEP (up to
+    max_rate); a 429/503 halves it (down to min_rate) and, if the server
+    sent Retry-After, holds all requests to that host until it has passed.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, min_rate=MIN_RATE, max_rate=MAX_RATE):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def bucket(self, url):
+        host = urlsplit(url).netloc
+        with self.lock:
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket(self.rate, self.burst)
+            return self.buckets[host]
+
+    def acquire(self, url):
+        """Block the calling thread until a request to url's host may go out."""
+        wait = self.bucket(url).reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, url):
+        """Async version of acquire()."""
+        wait = self.bucket(url).reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def observe(self, url, status, retry_after=None):
+        """Adapt the host's rate to a response status (and Retry-After header)."""
+        bucket = self.bucket(url)
+        with bucket.lock:
+            if status in BACKOFF_STATUSES:
+                bucket.rate = max(self.min_rate, bucket.rate / 2)
+                delay = parse_retry_after(retry_after)
+                if delay is not None:
+                    bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
+                print(f"[DEBUG] {status} from {urlsplit(url).netloc}: rate -> {bucket.rate:.2f}/s"
+                      + (f", pausing {delay:.1f}s" if delay else ""))
+            elif status is not None and status < 400:
+                bucket.rate = min(self.max_rate, bucket.rate + RATE_STEP)
+
+
+class LLMRateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limits for LLM API calls,
+    shared by every worker thread. Each is a TokenBucket holding up to
+    burst_sec seconds' worth. acquire(n) waits for one request and an
+    estimated n tokens; settle() corrects the estimate with the usage the
+    API reported, and pause() holds everyone back after a 429.
+    """
+
+    def __init__(self, requests_per_min, tokens_per_min, burst_sec=10):
+        self.requests = TokenBucket(requests_per_min / 60, max(1.0, requests_per_min / 60 * burst_sec))
+        self.tokens = TokenBucket(tokens_per_min / 60, max(1.0, tokens_per_min / 60 * burst_sec))
+
+    def acquire(self, tokens):
+        wait = max(self.requests.reserve(), self.tokens.reserve(tokens))
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens):
+        wait = max(self.requests.reserve(), self.tokens.reserve(tokens))
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def settle(self, estimated, actual):
+        self.tokens.refund(estimated - actual)
+
+    def pause(self, seconds):
+        print(f"[DEBUG] LLM rate limit hit: pausing all requests for {seconds:.1f}s")
+        self.requests.block_for(seconds)
+        self.tokens.block_for(seconds)
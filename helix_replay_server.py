@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from helix_archive import WarcReader, DEFAULT_ARCHIVE_FILENAME
+
+CHUNK_BYTES = 16 * 1024
+SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+class ArchivePages:
+    """
+    Pages recorded by step1 in a WARC archive (helix_archive.py), keyed by
+    path. Links to the recorded site are rewritten to the replay server, so
+    a crawler pointed at it never leaves localhost.
+    """
+
+    def __init__(self, filename=DEFAULT_ARCHIVE_FILENAME):
+        self.filename = filename
+
+    def pages(self, origin):
+        reader = WarcReader(self.filename)
+        recorded = set()
+        for url in reader.index:
+            parts = urlsplit(url)
+            recorded.add(parts.netloc)
+        pages = {}
+        for url in reader.index:
+            record = reader.get(url)
+            body = record.body
+            for netloc in recorded:
+                for scheme in ("https", "http"):
+                    body = body.replace(f"{scheme}://{netloc}".encode("utf-8"), origin.encode("utf-8"))
+            parts = urlsplit(url)
+            path = parts.path + (f"?{parts.query}" if parts.query else "")
+            content_type = {k.lower(): v for k, v in record.headers.items()}.get(
+                "content-type", "text/html; charset=UTF-8")
+            pages[path] = (record.status, content_type, body)
+        return pages
+
+
+class SyntheticPages:
+    """
+    Generated pages with the helixcenter.org markup step1 parses (year
+    listings, roundtable pages with participants, participant pages),
+    padded with WordPress-style menus and footers. For benchmarking when no
+    recorded archive is at hand; the content is made up.
+    """
+
+    def __init__(self, start_year=2012, end_year=2024, per_year=8, speakers=40, panel_size=4):
+        self.start_year = start_year
+        self.end_year = end_year
+        self.per_year = per_year
+        self.speakers = speakers
+        self.panel_size = panel_size
+
+    def _page(self, body):
+        menu = "".join(f"<li class='menu-item'><a href='/menu-{i}/'>Menu item {i}</a></li>" for i in range(120))
+        footer = "".join(f"<div class='widget'><p>Footer widget {i} &copy; Helix Center</p></div>"
+                         for i in range(60))
+        scripts = "".join(f"<script>var helix_{i} = {{\"n\": {i}}};</script>" for i in range(20))
+        return (f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>Helix Center</title>{scripts}</head>"
+                f"<body><nav><ul class='menu'>{menu}</ul></nav><main>{body}</main>"
+                f"<footer>{footer}</footer></body></html>").encode("utf-8")
+
+    def pages(self, origin):
+        rng = random.Random(0)
+        pages = {}
+        for n in range(self.speakers):
+            pages[f"/participants/person-{n}/"] = self._page(
+                f"<article class='participant post-{1000 + n}'><div class='entry-content'>"
+                + "".join(f"<p>Person {n} biography paragraph {k}, with <em>emphasis</em>.</p>"
+                          for k in range(6))
+                + "</div></article>")
+
+        for year in range(self.start_year, self.end_year + 1):
+            links = []
+            for i in range(self.per_year):
+                slug = f"roundtable-{year}-{i}"
+                links.append(f"<article class='roundtable post-{year}{i}'>"
+                             f"<a href='{origin}/roundtables/{year}/{slug}/'>Roundtable {year} {i}</a></article>")
+                panel = []
+                for idx, n in enumerate(rng.sample(range(self.speakers), self.panel_size)):
+                    panel.append(
+                        f"<article class='participant post-{1000 + n}'><header class='entry-header'>"
+                        f"<h2 class='entry-title'>Person {n}</h2><p>Professor {idx}, Helix University</p></header>"
+                        f"<div class='entry-content'><p>Short bio of person {n}.</p>"
+                        f"<a class='read-more' href='{origin}/participants/person-{n}/'>Read more</a></div></article>")
+                pages[f"/roundtables/{year}/{slug}/"] = self._page(
+                    f"<article class='roundtable'><header class='entry-header'><div class='row'>"
+                    f"<div class='col-md-9'><h1 class='entry-title'>Roundtable {year} {i}</h1>"
+                    f"<p>Saturday, May {i + 1}th<br/>4:30 &#8211; 6:30PM</p></div></div></header>"
+                    f"<div class='entry-content'>"
+                    + "".join(f"<p>Description paragraph {k} of roundtable {year} {i}.</p>" for k in range(4))
+                    + f"</div><div class='roundtable-participants'>{''.join(panel)}</div></article>")
+            pages[f"/roundtables/{year}/"] = self._page("".join(links))
+        return {path: (200, "text/html; charset=UTF-8", body) for path, body in pages.items()}
+
+
+class RecordPages(SyntheticPages):
+    """
+    Pages rendered from a step1 JSON file, in the markup SyntheticPages
+    uses but with the real titles, dates, descriptions, panelist titles and
+    bios (the short bio on the roundtable page is the bio's first
+    sentence). Fixtures for bench_parsers.py when nothing has been crawled.
+    """
+
+    def __init__(self, filename):
+        super().__init__()
+        with open(filename, "r", encoding="utf-8") as f:
+            self.records = json.load(f)
+
+    def pages(self, origin):
+        pages = {}
+        listings = {}
+        for rt in self.records:
+            year = re.search(r"\d{4}", rt.get("date") or "")
+            year = year.group(0) if year else str(self.start_year)
+            slug = f"roundtable-{rt.get('id')}"
+            listings.setdefault(year, []).append(
+                f"<article class='roundtable post-{rt.get('id')}'>"
+                f"<a href='{origin}/roundtables/{year}/{slug}/'>{escape(rt.get('title') or '')}</a></article>")
+            panelist = rt.get("panelist") or {}
+            panel = []
+            n = 1
+            while f"name_{n}" in panelist:
+                sentences = [p for p in SENTENCE_END_RE.split(panelist.get(f"description_{n}") or "") if p]
+                person = f"person-{rt.get('id')}-{n}"
+                pages[f"/participants/{person}/"] = self._page(
+                    f"<article class='participant post-{rt.get('id')}{n}'><div class='entry-content'>"
+                    + "".join(f"<p>{escape(p)}</p>" for p in sentences)
+                    + "</div></article>")
+                panel.append(
+                    f"<article class='participant post-{rt.get('id')}{n}'><header class='entry-header'>"
+                    f"<h2 class='entry-title'>{escape(panelist[f'name_{n}'] or '')}</h2>"
+                    f"<p>{escape(panelist.get(f'title_{n}') or '')}</p></header>"
+                    f"<div class='entry-content'><p>{escape(sentences[0] if sentences else '')}</p>"
+                    f"<a class='read-more' href='{origin}/participants/{person}/'>Read more</a></div></article>")
+                n += 1
+            date = re.sub(r",?\s*\d{4}$", "", rt.get("date") or "")
+            pages[f"/roundtables/{year}/{slug}/"] = self._page(
+                f"<article class='roundtable'><header class='entry-header'><div class='row'>"
+                f"<div class='col-md-9'><h1 class='entry-title'>{escape(rt.get('title') or '')}</h1>"
+                f"<p>{escape(date)}<br/>{escape(rt.get('time') or '')}</p></div></div></header>"
+                f"<div class='entry-content'><p>{escape(rt.get('description') or '')}</p></div>"
+                f"<div class='roundtable-participants'>{''.join(panel)}</div></article>")
+        for year, links in listings.items():
+            pages[f"/roundtables/{year}/"] = self._page("".join(links))
+        return {path: (200, "text/html; charset=UTF-8", body) for path, body in pages.items()}
+
+
+class RequestLog:
+    """Thread-safe (path, status, seconds) log of every request served."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.records = []
+
+    def record(self, path, status, elapsed):
+        with self.lock:
+            self.records.append((path, status, elapsed))
+
+    def reset(self):
+        with self.lock:
+            self.records = []
+
+    def summary(self):
+        with self.lock:
+            records = list(self.records)
+        times = sorted(r[2] for r in records)
+        if not times:
+            return {"requests": 0, "ok": 0, "errors": 0, "p50_sec": 0.0, "p99_sec": 0.0}
+        return {
+            "requests": len(records),
+            "ok": sum(1 for r in records if r[1] == 200),
+            "errors": sum(1 for r in records if r[1] is None or r[1] >= 400),
+            "p50_sec": times[len(times) // 2],
+            "p99_sec": times[min(len(times) - 1, int(len(times) * 0.99))],
+        }
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; with Nagle on, a
+    # keep-alive client's delayed ACK stalls every reused connection ~40 ms
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        server = self.server
+        start = time.perf_counter()
+        status, content_type, body = server.pages.get(self.path, (404, "text/html", b"Not Found"))
+
+        roll = server.rng.random()
+        if roll < server.drop_rate:
+            # Drop the connection without answering
+            server.log.record(self.path, None, time.perf_counter() - start)
+            self.close_connection = True
+            return
+        if roll < server.drop_rate + server.error_rate:
+            status, content_type, body = 503, "text/html", b"Service Unavailable"
+
+        if server.latency or server.jitter:
+            time.sleep(server.latency + server.rng.uniform(0, server.jitter))
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        for offset in range(0, len(body), CHUNK_BYTES):
+            chunk = body[offset:offset + CHUNK_BYTES]
+            self.wfile.write(chunk)
+            if server.bandwidth:
+                time.sleep(len(chunk) / server.bandwidth)
+        server.log.record(self.path, status, time.perf_counter() - start)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """
+    Local stand-in for helixcenter.org. Serves pages from `source`
+    (ArchivePages or SyntheticPages) with optional artificial latency
+    (seconds before the response, plus up to `jitter` more), a per-response
+    bandwidth cap in bytes/second, and error injection: `error_rate` of
+    requests get a 503, `drop_rate` are closed without an answer.
+    Every request is timed in self.log.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, source, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, bandwidth=None,
+                 error_rate=0.0, drop_rate=0.0, seed=None):
+        super().__init__((host, port), ReplayHandler)
+        self.origin = f"http://{host}:{self.server_address[1]}"
+        self.pages = source.pages(self.origin)
+        self.latency = latency
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self.rng = random.Random(seed)
+        self.log = RequestLog()
+        self.thread = None
+
+    @property
+    def base_url(self):
+        """Roundtable listing root to pass to step1 --base-url."""
+        return f"{self.origin}/roundtables/"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def add_server_arguments(parser):
+    parser.add_argument("--archive", default=DEFAULT_ARCHIVE_FILENAME,
+                        help="WARC archive recorded by step1 to serve.")
+    parser.add_argument("--synthetic", action="store_true",
+                        help="Serve generated pages instead of a recorded archive.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Milliseconds before each response.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Up to this many extra random milliseconds.")
+    parser.add_argument("--bandwidth", type=float, default=None, help="Per-response cap in KiB/s.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503.")
+    parser.add_argument("--drop-rate", type=float, default=0.0,
+                        help="Fraction of requests whose connection is closed without an answer.")
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def server_from_args(args, port=0):
+    source = SyntheticPages() if args.synthetic else ArchivePages(args.archive)
+    return ReplayServer(source, port=port, latency=args.latency / 1000, jitter=args.jitter / 1000,
+                        bandwidth=args.bandwidth * 1024 if args.bandwidth else None,
+                        error_rate=args.error_rate, drop_rate=args.drop_rate, seed=args.seed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve recorded Helix Center pages locally.")
+    add_server_arguments(parser)
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    server = server_from_args(args, port=args.port)
+    print(f"[INFO] Serving {len(server.pages)} pages; crawl with "
+          f"--base-url {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,131 @@
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime
+from urllib.parse import urlsplit
+
+import requests
+
+DEFAULT_TIMEOUT_SEC = 20
+MAX_ATTEMPTS = 4
+BASE_DELAY_SEC = 0.5
+MAX_DELAY_SEC = 30
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+FAILURE_THRESHOLD = 5   # consecutive failures that open a host's circuit
+RESET_TIMEOUT_SEC = 30  # how long an open circuit rejects requests
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+
+class RetryPolicy:
+    """
+    Bounded exponential backoff with full jitter: attempt n (1-based) waits
+    uniform(0, min(max_delay, base_delay * 2**(n-1))) seconds, or at least
+    the server's Retry-After when one is given.
+    """
+
+    def __init__(self, max_attempts=MAX_ATTEMPTS, base_delay=BASE_DELAY_SEC,
+                 max_delay=MAX_DELAY_SEC, timeout=DEFAULT_TIMEOUT_SEC, retry_statuses=RETRY_STATUSES):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.retry_statuses = retry_statuses
+
+    def delay(self, attempt, retry_after=None):
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        if retry_after is not None:
+            backoff = max(backoff, min(self.max_delay, retry_after))
+        return backoff
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker. After failure_threshold consecutive failures
+    the host's circuit opens and requests fail fast with CircuitOpenError
+    for reset_timeout seconds; then a single trial request is let through
+    (half-open) and its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold=FAILURE_THRESHOLD, reset_timeout=RESET_TIMEOUT_SEC):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.lock = threading.Lock()
+        self.failures = {}
+        self.opened_at = {}
+        self.trial_in_flight = set()
+
+    def before_request(self, url):
+        host = urlsplit(url).netloc
+        with self.lock:
+            opened_at = self.opened_at.get(host)
+            if opened_at is None:
+                return
+            if time.monotonic() - opened_at < self.reset_timeout or host in self.trial_in_flight:
+                raise CircuitOpenError(f"circuit open for {host}")
+            self.trial_in_flight.add(host)
+
+    def record_success(self, url):
+        host = urlsplit(url).netloc
+        with self.lock:
+            self.failures[host] = 0
+            self.opened_at.pop(host, None)
+            self.trial_in_flight.discard(host)
+
+    def record_failure(self, url):
+        host = urlsplit(url).netloc
+        with self.lock:
+            self.failures[host] = self.failures.get(host, 0) + 1
+            if host in self.trial_in_flight or self.failures[host] >= self.failure_threshold:
+                if host not in self.opened_at:
+                    print(f"[DEBUG] Circuit opened for {host} after {self.failures[host]} failures")
+                self.opened_at[host] = time.monotonic()
+                self.trial_in_flight.discard(host)
+
+
+class DeadLetterQueue:
+    """
+    URLs whose fetch still failed after all retries (or hit an open
+    circuit). Saved next to the crawl output so they can be re-driven
+    with step1 --redrive instead of re-running the whole crawl.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    def add(self, url, error, attempts):
+        with self.lock:
+            self.entries[url] = {
+                "url": url,
+                "error": str(error),
+                "attempts": attempts,
+                "failed_at": datetime.now().isoformat(timespec="seconds"),
+            }
+
+    def discard(self, url):
+        with self.lock:
+            self.entries.pop(url, None)
+
+    def urls(self):
+        with self.lock:
+            return list(self.entries)
+
+    def save(self, filename):
+        with self.lock:
+            entries = list(self.entries.values())
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=2, ensure_ascii=False)
+        print(f"[INFO] {len(entries)} failed URLs written to {filename}")
+
+
+def load_dead_letters(filename):
+    """Return the URLs recorded in a dead-letter file; none if there is no such file."""
+    if not os.path.exists(filename):
+        return []
+    with open(filename, "r", encoding="utf-8") as f:
+        return [entry["url"] for entry in json.load(f)]
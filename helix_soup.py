@@ -0,0 +1,54 @@
+import threading
+
+from bs4 import BeautifulSoup
+
+# HTML parser used by the step1 parse_* functions. A BeautifulSoup tree
+# builder ("html.parser", "lxml") or "lxml-native", which
+# bypasses BeautifulSoup and runs the lxml implementations in
+# helix_parsers.py. Kept here rather than in step1 so that step1 run as a
+# script and step1 imported by name (helix_async_crawler, helix_incremental,
+# helix_pipeline) read the same setting.
+DEFAULT_PARSER_BACKEND = "html.parser"
+PARSER_BACKENDS = ("html.parser", "lxml", "lxml-native")
+
+
+class ParserBackend:
+    """
+    One parser backend. With `partial`, the BeautifulSoup backends only
+    build the page regions each parse_* function declares. `native` is the
+    helix_parsers module for "lxml-native", else None.
+    """
+
+    def __init__(self, name=DEFAULT_PARSER_BACKEND, partial=True):
+        if name not in PARSER_BACKENDS:
+            raise ValueError(f"Unknown parser backend {name!r}; choose from {PARSER_BACKENDS}")
+        self.name = name
+        self.partial = partial
+        self.native = None
+        if name == "lxml-native":
+            import helix_parsers
+            self.native = helix_parsers
+
+    def make_soup(self, html, regions=None):
+        """Parse html, building only `regions` (a SoupStrainer) when partial parsing is on."""
+        if regions is None or not self.partial:
+            return BeautifulSoup(html, self.name)
+        return BeautifulSoup(html, self.name, parse_only=regions)
+
+
+_shared_parser = ParserBackend()
+_shared_lock = threading.Lock()
+
+
+def get_parser():
+    """Return the process-wide ParserBackend."""
+    return _shared_parser
+
+
+def configure_parser(name=DEFAULT_PARSER_BACKEND, partial=True):
+    """Select the parser backend every step1 parse_* function uses, process-wide."""
+    global _shared_parser
+    backend = ParserBackend(name, partial=partial)
+    with _shared_lock:
+        _shared_parser = backend
+    return backend
@@ -0,0 +1,95 @@
+import json
+import math
+import re
+import threading
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None  # counts fall back to CHARS_PER_TOKEN
+
+CHARS_PER_TOKEN = 4
+TOKENS_PER_MESSAGE = 3   # chat format overhead per message
+REPLY_PRIMING_TOKENS = 3
+SENTENCE_END = re.compile(r"[.!?][\"')\]]?\s")
+TRUNCATION_MARK = " [...]"
+
+
+class TokenCounter:
+    """
+    Local prompt token counts for one model. Uses tiktoken's encoding when
+    it is installed (pip install tiktoken) and otherwise assumes
+    CHARS_PER_TOKEN characters per token, which is close for English prose.
+    """
+
+    def __init__(self, model):
+        self.encoding = None
+        if tiktoken is not None:
+            try:
+                self.encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                self.encoding = tiktoken.get_encoding("cl100k_base")
+
+    @property
+    def exact(self):
+        return self.encoding is not None
+
+    def count(self, text):
+        if self.encoding is not None:
+            return len(self.encoding.encode(text, disallowed_special=()))
+        return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+    def count_messages(self, messages):
+        """Prompt tokens a chat request with these messages is billed for."""
+        return sum(TOKENS_PER_MESSAGE + self.count(m["role"]) + self.count(m["content"])
+                   for m in messages) + REPLY_PRIMING_TOKENS
+
+    def truncate(self, text, max_tokens):
+        """
+        text cut to at most max_tokens, backing up to the last sentence end
+        when that keeps at least half of it. Marked with TRUNCATION_MARK.
+        """
+        if self.count(text) <= max_tokens:
+            return text
+        max_tokens = max(0, max_tokens - self.count(TRUNCATION_MARK))
+        if self.encoding is not None:
+            head = self.encoding.decode(self.encoding.encode(text, disallowed_special=())[:max_tokens])
+        else:
+            head = text[:max_tokens * CHARS_PER_TOKEN]
+        ends = [m.end() for m in SENTENCE_END.finditer(head)]
+        if ends and ends[-1] >= len(head) / 2:
+            head = head[:ends[-1]]
+        return head.rstrip() + TRUNCATION_MARK
+
+
+class TokenUsageLog:
+    """
+    Tokens used per roundtable, filled in by the worker threads: the
+    locally counted prompt, how much bio text was cut to fit the budget,
+    and the completion/total tokens the API reported (None for cache hits).
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.records = {}
+
+    def record(self, roundtable_id, **usage):
+        with self.lock:
+            self.records[str(roundtable_id)] = dict(usage, id=roundtable_id)
+
+    def save(self, filename):
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(list(self.records.values()), f, indent=2, ensure_ascii=False)
+
+    def print_summary(self):
+        records = list(self.records.values())
+        if not records:
+            return
+        prompts = [r["prompt_tokens"] for r in records]
+        billed = [r["total_tokens"] for r in records if r.get("total_tokens") is not None]
+        trimmed = sum(1 for r in records if r.get("bio_tokens_cut"))
+        print(f"[INFO] Prompt tokens per roundtable: mean {sum(prompts) / len(prompts):.0f}, "
+              f"max {max(prompts)}; bios trimmed for {trimmed} of {len(records)}")
+        if billed:
+            print(f"[INFO] API reported {sum(billed)} tokens for {len(billed)} roundtables "
+                  f"(mean {sum(billed) / len(billed):.0f})")
@@ -1,9 +1,46 @@
+import argparse
+import hashlib
 import requests
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 import json
 import re
+import sys
 from datetime import datetime
 import time
+from helix_fetcher import get_fetcher, configure_fetcher, POOL_CONNECTIONS, POOL_MAXSIZE
+from helix_http_cache import HttpCache, DEFAULT_CACHE_DIR
+from helix_participants import get_registry
+from helix_rate_limit import HostRateLimiter, DEFAULT_RATE, DEFAULT_BURST, MAX_RATE
+from helix_retry import RetryPolicy, MAX_ATTEMPTS, DEFAULT_TIMEOUT_SEC, load_dead_letters
+from helix_journal import CrawlJournal, DEFAULT_JOURNAL_FILENAME
+from helix_ndjson import NdjsonWriter, compact_ndjson, ndjson_filename
+from helix_archive import WarcArchive, WarcReader, ArchiveFetcher, DEFAULT_ARCHIVE_FILENAME
+from helix_soup import PARSER_BACKENDS, DEFAULT_PARSER_BACKEND, configure_parser, get_parser
+
+BASE_URL = "https://www.helixcenter.org/roundtables/"
+START_YEAR = 2012
+END_YEAR = 2024
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+}
+
+def class_regions(tags, classes):
+    """
+    SoupStrainer matching any of `tags` carrying one of the CSS `classes`
+    (the same whole-class match as find(tag, class_="...")).
+    """
+    pattern = re.compile(r"(^|\s)(" + "|".join(classes) + r")(\s|$)")
+    return SoupStrainer(list(tags), class_=pattern)
+
+
+# Regions of a page each parse_* function reads. Everything inside a matched
+# element is kept, so find()/find_all() below return the same elements as on
+# the full page while menus, sidebars, footers and scripts are never built.
+SPEAKER_REGIONS = SoupStrainer("article", class_=re.compile(r"(participant|post-\d+)"))
+DETAIL_REGIONS = class_regions(("h1", "header", "div"),
+                               ("entry-title", "entry-header", "entry-content", "roundtable-participants"))
+LISTING_REGIONS = class_regions(("article", "div"), ("roundtable",))
+
 
 def parse_date_time(p_tag, year=None):
     """
@@ -15,7 +52,13 @@ def parse_date_time(p_tag, year=None):
 
     # Convert <br> to space => "Saturday, May 5th 4:30 - 6:30PM"
     raw_text = p_tag.get_text(" ", strip=True)
+    return split_date_time(raw_text, year=year)
+
 
+def split_date_time(raw_text, year=None):
+    """
+    Text half of parse_date_time, shared with the lxml-native backend.
+    """
     # Example: "Saturday, May 5th 4:30 - 6:30PM"
     # We want to separate the "Saturday, May 5th" from "4:30 - 6:30PM"
     # Some WordPress pages may use fancy dashes, so we unify them:
@@ -41,22 +84,15 @@ def parse_date_time(p_tag, year=None):
     return date_str, time_str
 
 
-def crawl_speaker_page(speaker_url, headers):
+def parse_speaker_page(html):
     """
-    Given the URL to a speaker's page, fetch and extract the FULL speaker bio
-    from <div class="entry-content">. Return the text as a single string.
+    Extract the FULL speaker bio from the <div class="entry-content"> of an
+    already-fetched speaker page. Return the text as a single string, or None.
     """
-    print(f"[DEBUG]   >> Accessing speaker page: {speaker_url}")
-    try:
-        resp = requests.get(speaker_url, headers=headers)
-        if resp.status_code != 200:
-            print(f"[DEBUG]   >> Speaker page request failed with status code {resp.status_code}")
-            return None
-    except requests.exceptions.RequestException as e:
-        print(f"[DEBUG]   >> RequestException in speaker page: {e}")
-        return None
-
-    soup = BeautifulSoup(resp.text, "html.parser")
+    backend = get_parser()
+    if backend.native is not None:
+        return backend.native.parse_speaker_page(html)
+    soup = backend.make_soup(html, SPEAKER_REGIONS)
 
     article_tag = soup.find("article", class_=re.compile(r"(participant|post-\d+)"))
     if not article_tag:
@@ -73,28 +109,44 @@ def crawl_speaker_page(speaker_url, headers):
     return full_bio
 
 
-def crawl_roundtable_detail(url, headers, year=None):
+def fetch_speaker_page(speaker_url, headers):
     """
-    Given a roundtable detail page URL, extract:
-        - title
-        - date
-        - time
-        - description
-        - panelists (name, title, FULL bio)
-    year: the integer year from the top-level listing (e.g. 2012)
-    Return a dictionary following the specified structure.
+    Fetch a speaker page and return its HTML, or None on failure.
     """
-    print(f"[DEBUG] Crawling roundtable detail page: {url} (year={year})")
+    print(f"[DEBUG]   >> Accessing speaker page: {speaker_url}")
     try:
-        response = requests.get(url, headers=headers)
-        if response.status_code != 200:
-            print(f"[DEBUG] Skipping detail page {url}, status {response.status_code}")
+        resp = get_fetcher().get(speaker_url, headers=headers)
+        if resp.status_code != 200:
+            print(f"[DEBUG]   >> Speaker page request failed with status code {resp.status_code}")
             return None
     except requests.exceptions.RequestException as e:
-        print(f"[DEBUG] Request exception: {e}")
+        print(f"[DEBUG]   >> RequestException in speaker page: {e}")
         return None
+    return resp.text
 
-    soup = BeautifulSoup(response.text, "html.parser")
+
+def crawl_speaker_page(speaker_url, headers):
+    """
+    Given the URL to a speaker's page, fetch and extract the FULL speaker bio
+    from <div class="entry-content">. Return the text as a single string.
+    """
+    html = fetch_speaker_page(speaker_url, headers)
+    if html is None:
+        return None
+    return parse_speaker_page(html)
+
+
+def parse_roundtable_detail(html, year=None):
+    """
+    Parse an already-fetched roundtable detail page.
+    Returns (roundtable_info, speaker_links) where roundtable_info holds the
+    short bios in "description_N" and speaker_links maps N -> "read more" URL,
+    so the caller decides how (and when) to fetch the full bios.
+    """
+    backend = get_parser()
+    if backend.native is not None:
+        return backend.native.parse_roundtable_detail(html, year=year)
+    soup = backend.make_soup(html, DETAIL_REGIONS)
 
     roundtable_info = {
         "id": None,
@@ -104,6 +156,7 @@ def crawl_roundtable_detail(url, headers, year=None):
         "description": "",
         "panelist": {}
     }
+    speaker_links = {}
 
     # 1) Title
     title_tag = soup.find("h1", class_="entry-title")
@@ -173,33 +226,141 @@ def crawl_roundtable_detail(url, headers, year=None):
                     p.get_text(" ", strip=True) for p in short_p_tags if p.get_text(strip=True)
                 )
 
-            # (d) read more -> FULL bio
-            full_bio = short_bio
+            # (d) read more -> link to the FULL bio (fetched by the caller)
             if entry_content_div:
                 read_more_link = entry_content_div.find("a", class_="read-more")
                 if read_more_link:
                     speaker_page_href = read_more_link.get("href")
                     if speaker_page_href:
-                        speaker_full_bio = crawl_speaker_page(speaker_page_href, headers)
-                        if speaker_full_bio:
-                            full_bio = speaker_full_bio
+                        speaker_links[idx] = speaker_page_href
 
             # Insert into dictionary
             roundtable_info["panelist"][f"name_{idx}"] = name_str
             roundtable_info["panelist"][f"title_{idx}"] = speaker_title
-            roundtable_info["panelist"][f"description_{idx}"] = full_bio
-
-            print(f"[DEBUG] -> Speaker #{idx}: {name_str}")
-            print(f"         Title: {speaker_title}")
-            print(f"         Bio: {full_bio[:80]}{'...' if len(full_bio) > 80 else ''}")
+            roundtable_info["panelist"][f"description_{idx}"] = short_bio
 
     else:
         print("[DEBUG] No <div class='roundtable-participants'> found for panelists.")
 
+    return roundtable_info, speaker_links
+
+
+def apply_speaker_bios(roundtable_info, full_bios):
+    """
+    Replace the short bios in roundtable_info with the FULL bios fetched from
+    the speaker pages. full_bios maps N -> bio (or None if the fetch failed,
+    in which case the short bio is kept).
+    """
+    panelist = roundtable_info["panelist"]
+    for idx, speaker_full_bio in full_bios.items():
+        if speaker_full_bio:
+            panelist[f"description_{idx}"] = speaker_full_bio
+
+    idx = 1
+    while f"name_{idx}" in panelist:
+        full_bio = panelist[f"description_{idx}"]
+        print(f"[DEBUG] -> Speaker #{idx}: {panelist[f'name_{idx}']}")
+        print(f"         Title: {panelist[f'title_{idx}']}")
+        print(f"         Bio: {full_bio[:80]}{'...' if len(full_bio) > 80 else ''}")
+        idx += 1
+
     return roundtable_info
 
 
-def crawl_helixcenter_roundtables():
+def fetch_roundtable_page(url, headers, year=None):
+    """
+    Fetch a roundtable detail page and return its HTML, or None on failure.
+    """
+    print(f"[DEBUG] Crawling roundtable detail page: {url} (year={year})")
+    try:
+        response = get_fetcher().get(url, headers=headers)
+        if response.status_code != 200:
+            print(f"[DEBUG] Skipping detail page {url}, status {response.status_code}")
+            return None
+    except requests.exceptions.RequestException as e:
+        print(f"[DEBUG] Request exception: {e}")
+        return None
+    return response.text
+
+
+def build_roundtable_record(html, headers, year=None, speaker_urls=None):
+    """
+    Parse a fetched roundtable detail page and fill in the FULL speaker bios.
+    If a speaker_urls list is given, the speaker page URLs are appended to it.
+    """
+    roundtable_info, speaker_links = parse_roundtable_detail(html, year=year)
+    if speaker_urls is not None:
+        speaker_urls.extend(speaker_links.values())
+
+    # Recurring panelists are fetched once per crawl, not once per roundtable
+    registry = get_registry()
+    full_bios = {
+        idx: registry.get(speaker_page_href, lambda u: crawl_speaker_page(u, headers))
+        for idx, speaker_page_href in speaker_links.items()
+    }
+    return apply_speaker_bios(roundtable_info, full_bios)
+
+
+def crawl_roundtable_detail(url, headers, year=None):
+    """
+    Given a roundtable detail page URL, extract:
+        - title
+        - date
+        - time
+        - description
+        - panelists (name, title, FULL bio)
+    year: the integer year from the top-level listing (e.g. 2012)
+    Return a dictionary following the specified structure.
+    """
+    html = fetch_roundtable_page(url, headers, year=year)
+    if html is None:
+        return None
+    return build_roundtable_record(html, headers, year=year)
+
+
+def page_hash(html):
+    """Fingerprint of a detail page, used by --incremental to spot changes."""
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+
+def manifest_filename(output_filename):
+    """helixcenter_openai_<ts>.json -> helixcenter_openai_<ts>_manifest.json"""
+    return output_filename.rsplit(".", 1)[0] + "_manifest.json"
+
+
+def dead_letter_filename(output_filename):
+    """helixcenter_openai_<ts>.json -> helixcenter_openai_<ts>_dead_letter.json"""
+    return output_filename.rsplit(".", 1)[0] + "_dead_letter.json"
+
+
+def parse_year_listing(html):
+    """
+    Parse a year listing page (e.g. /roundtables/2012/) and return the
+    roundtable detail links in page order.
+    """
+    backend = get_parser()
+    if backend.native is not None:
+        return backend.native.parse_year_listing(html)
+    soup = backend.make_soup(html, LISTING_REGIONS)
+    events = soup.find_all("article", class_="roundtable")
+    if not events:
+        events = soup.find_all("div", class_="roundtable")
+    print(f"[DEBUG] Found {len(events)} events.")
+
+    rt_links = []
+    for evt in events:
+        a_tag = evt.find("a")
+        if not a_tag:
+            continue
+        rt_link = a_tag.get("href")
+        if not rt_link:
+            continue
+        rt_links.append(rt_link)
+    return rt_links
+
+
+def iter_helixcenter_roundtables(base_url=BASE_URL, start_year=START_YEAR, end_year=END_YEAR,
+                                 manifest=None, journal=None):
     """
     Crawl Helix Center roundtable pages from 2012 to 2024 and extract event details:
       - Title
@@ -208,22 +369,21 @@ def crawl_helixcenter_roundtables():
       - Panelists with short or full bios
       We also pass `year` into crawl_roundtable_detail to incorporate
       the year into the date if desired.
+    If a manifest dict is given, it is filled with
+    {roundtable_url: {"id", "year", "page_sha256", "speaker_urls"}}
+    for --incremental and --redrive runs.
+    If a helix_journal.CrawlJournal is given, each finished roundtable is
+    appended to it and URLs it already holds are not fetched again.
+    Yields each roundtable (with its id) as soon as it is parsed.
     """
-    base_url = "https://www.helixcenter.org/roundtables/"
-    start_year = 2012
-    end_year = 2024
-    all_roundtables = []
     current_id = 0
-
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
-    }
+    headers = HEADERS
 
     for year in range(start_year, end_year + 1):
         year_url = f"{base_url}{year}/"
         print(f"\n[DEBUG] Fetching roundtables for year={year} : {year_url}")
         try:
-            resp = requests.get(year_url, headers=headers)
+            resp = get_fetcher().get(year_url, headers=headers)
             if resp.status_code != 200:
                 print(f"[DEBUG] Skipping {year_url}, status={resp.status_code}")
                 continue
@@ -231,39 +391,182 @@ def crawl_helixcenter_roundtables():
             print(f"[DEBUG] RequestException for {year_url}: {e}")
             continue
 
-        soup = BeautifulSoup(resp.text, "html.parser")
-        events = soup.find_all("article", class_="roundtable")
-        if not events:
-            events = soup.find_all("div", class_="roundtable")
-        print(f"[DEBUG] Found {len(events)} events for {year}.")
-
-        for evt in events:
-            a_tag = evt.find("a")
-            if not a_tag:
-                continue
-            rt_link = a_tag.get("href")
-            if not rt_link:
-                continue
+        for rt_link in parse_year_listing(resp.text):
+            done = journal.get(rt_link) if journal is not None else None
+            if done is not None:
+                print(f"[DEBUG] Already crawled (journal): {rt_link}")
+                rt_data = dict(done["record"])
+                fingerprint, speaker_urls = done["page_sha256"], done["speaker_urls"]
+            else:
+                html = fetch_roundtable_page(rt_link, headers, year=year)
+                if html is None:
+                    continue
+                speaker_urls = []
+                rt_data = build_roundtable_record(html, headers, year=year, speaker_urls=speaker_urls)
+                fingerprint = page_hash(html)
+                if journal is not None:
+                    journal.append(rt_link, year, rt_data, fingerprint, speaker_urls)
+
+            current_id += 1
+            rt_data["id"] = current_id
+            if manifest is not None:
+                manifest[rt_link] = {"id": current_id, "year": year, "page_sha256": fingerprint,
+                                     "speaker_urls": speaker_urls}
+            yield rt_data
+
+
+def crawl_helixcenter_roundtables(base_url=BASE_URL, start_year=START_YEAR, end_year=END_YEAR,
+                                  manifest=None, journal=None):
+    """
+    Crawl every roundtable (see iter_helixcenter_roundtables) into a list.
+    """
+    return list(iter_helixcenter_roundtables(base_url, start_year, end_year,
+                                             manifest=manifest, journal=journal))
 
-            rt_data = crawl_roundtable_detail(rt_link, headers, year=year)
-            if rt_data:
-                current_id += 1
-                rt_data["id"] = current_id
-                all_roundtables.append(rt_data)
 
-    return all_roundtables
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Crawl Helix Center roundtables into JSON.")
+    parser.add_argument("--base-url", default=BASE_URL,
+                        help="Roundtable listing root; year listings are <base-url><year>/.")
+    parser.add_argument("--start-year", type=int, default=START_YEAR)
+    parser.add_argument("--end-year", type=int, default=END_YEAR)
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="Fetch year, roundtable and speaker pages concurrently with httpx.")
+    parser.add_argument("--max-concurrency", type=int, default=16,
+                        help="Async mode: overall limit on in-flight requests.")
+    parser.add_argument("--per-host-limit", type=int, default=4,
+                        help="Async mode: limit on in-flight requests to any single host.")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="Fetch on a thread pool and parse on a process pool, one parser per core.")
+    parser.add_argument("--fetch-workers", type=int, default=8,
+                        help="Pipeline mode: concurrent fetch threads.")
+    parser.add_argument("--parse-workers", type=int, default=None,
+                        help="Pipeline mode: parser processes (default: number of cores).")
+    parser.add_argument("--pool-connections", type=int, default=POOL_CONNECTIONS,
+                        help="Number of per-host keep-alive pools in the shared fetcher.")
+    parser.add_argument("--pool-maxsize", type=int, default=POOL_MAXSIZE,
+                        help="Keep-alive connections kept per host in the shared fetcher.")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                        help="On-disk HTTP cache; unchanged pages are revalidated with conditional GETs.")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always download every page.")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE,
+                        help="Starting requests/second per host; adapts up on success, down on 429/503.")
+    parser.add_argument("--max-rate", type=float, default=MAX_RATE,
+                        help="Ceiling for the adaptive per-host request rate.")
+    parser.add_argument("--burst", type=int, default=DEFAULT_BURST,
+                        help="Requests per host that may be sent back-to-back.")
+    parser.add_argument("--max-attempts", type=int, default=MAX_ATTEMPTS,
+                        help="Attempts per URL on transport errors and 429/5xx, with jittered backoff.")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT_SEC,
+                        help="Per-request timeout in seconds.")
+    parser.add_argument("--journal", default=DEFAULT_JOURNAL_FILENAME,
+                        help="JSONL checkpoint of finished roundtables; a crashed crawl resumes from it.")
+    parser.add_argument("--no-journal", action="store_true",
+                        help="Do not checkpoint or resume the crawl.")
+    parser.add_argument("--ndjson", action="store_true",
+                        help="Stream one roundtable per line to <output>.ndjson as soon as it is parsed, "
+                             "then compact it into the usual pretty JSON array.")
+    parser.add_argument("--no-compact", action="store_true",
+                        help="With --ndjson, keep only the .ndjson file.")
+    parser.add_argument("--parser", choices=PARSER_BACKENDS, default=DEFAULT_PARSER_BACKEND,
+                        help="HTML parser backend for page extraction (see bench_parsers.py).")
+    parser.add_argument("--full-parse", action="store_true",
+                        help="Build the whole page tree instead of only the regions the extraction reads.")
+    parser.add_argument("--archive", default=DEFAULT_ARCHIVE_FILENAME,
+                        help="Append every fetched page to this WARC archive (.warc.gz).")
+    parser.add_argument("--no-archive", action="store_true",
+                        help="Do not archive fetched pages.")
+    parser.add_argument("--from-archive", metavar="ARCHIVE",
+                        help="Replay every request from this WARC archive instead of the network "
+                             "(re-parse after a selector fix); implies --no-journal.")
+    parser.add_argument("--incremental", metavar="PREVIOUS_JSON",
+                        help="Only fetch roundtables that are new or changed since this snapshot "
+                             "and merge them in, keeping existing ids.")
+    parser.add_argument("--redrive", metavar="PREVIOUS_JSON",
+                        help="Re-fetch only the URLs in PREVIOUS_JSON's _dead_letter.json and "
+                             "merge the recovered roundtables/bios into that snapshot.")
+    args = parser.parse_args()
+    if args.no_compact and not args.ndjson:
+        parser.error("--no-compact only applies to --ndjson crawls")
+    redrive_urls = None
+    if args.redrive:
+        redrive_urls = load_dead_letters(dead_letter_filename(args.redrive))
+        if not redrive_urls:
+            print(f"[INFO] No dead letters in {dead_letter_filename(args.redrive)}; nothing to redrive")
+            sys.exit(0)
+    configure_parser(args.parser, partial=not args.full_parse)
+    archive = None
+    if args.from_archive:
+        configure_fetcher(ArchiveFetcher, reader=WarcReader(args.from_archive))
+        args.no_journal = True
+    else:
+        cache = None if args.no_cache else HttpCache(args.cache_dir)
+        archive = None if args.no_archive else WarcArchive(args.archive)
+        rate_limiter = HostRateLimiter(rate=args.rate, burst=args.burst, max_rate=args.max_rate)
+        configure_fetcher(pool_connections=args.pool_connections, pool_maxsize=args.pool_maxsize,
+                          cache=cache, rate_limiter=rate_limiter, archive=archive,
+                          retry=RetryPolicy(max_attempts=args.max_attempts, timeout=args.timeout))
 
+    datetime_str = datetime.now().strftime("%Y%m%d-%H%M%S")
+    output_filename = f"helixcenter_openai_{datetime_str}.json"
+    sink = NdjsonWriter(ndjson_filename(output_filename)) if args.ndjson else None
 
-if __name__ == "__main__":
     start_time = time.time()
-    data = crawl_helixcenter_roundtables()
+    crawl_range = {"base_url": args.base_url, "start_year": args.start_year, "end_year": args.end_year}
+    manifest = {}
+    journal = None
+    if args.redrive or args.incremental:
+        from helix_incremental import crawl_incremental
+        if args.redrive:
+            data, manifest = crawl_incremental(args.redrive, redrive_urls=redrive_urls, **crawl_range)
+        else:
+            data, manifest = crawl_incremental(args.incremental, **crawl_range)
+        if sink is not None:
+            for rt_data in data:
+                sink.write(rt_data)
+    else:
+        journal = None if args.no_journal else CrawlJournal(args.journal)
+        if args.use_async:
+            from helix_async_crawler import run_async_crawl
+            data = run_async_crawl(**crawl_range, max_concurrency=args.max_concurrency,
+                                   per_host_limit=args.per_host_limit, manifest=manifest,
+                                   journal=journal, on_record=sink.write if sink else None)
+        elif args.pipeline:
+            from helix_pipeline import iter_helixcenter_roundtables_pipelined, PARSE_WORKERS
+            roundtables = iter_helixcenter_roundtables_pipelined(
+                **crawl_range, manifest=manifest, journal=journal, fetch_workers=args.fetch_workers,
+                parse_workers=args.parse_workers or PARSE_WORKERS)
+            if sink is not None:
+                for rt_data in roundtables:
+                    sink.write(rt_data)
+            else:
+                data = list(roundtables)
+        elif sink is not None:
+            for rt_data in iter_helixcenter_roundtables(**crawl_range, manifest=manifest, journal=journal):
+                sink.write(rt_data)
+        else:
+            data = crawl_helixcenter_roundtables(**crawl_range, manifest=manifest, journal=journal)
     end_time = time.time()
 
     execution_time = end_time - start_time
     print(f"Execution time: {execution_time:.6f} seconds")
+    get_fetcher().stats.print_summary()
+    get_registry().print_summary()
 
-    datetime_str = datetime.now().strftime("%Y%m%d-%H%M%S")
-    output_filename = f"helixcenter_openai_{datetime_str}.json"
-    with open(output_filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    print(f"\n[DEBUG] Crawl complete. Saved to {output_filename}")
+    if sink is not None:
+        sink.close()
+        if not args.no_compact:
+            compact_ndjson(sink.filename, output_filename)
+    else:
+        with open(output_filename, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    with open(manifest_filename(output_filename), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    if get_fetcher().dead_letters.urls():
+        get_fetcher().dead_letters.save(dead_letter_filename(output_filename))
+    if journal is not None:
+        journal.finish()
+    if archive is not None:
+        archive.close()
+    print(f"\n[DEBUG] Crawl complete. Saved to {sink.filename if args.no_compact else output_filename}")
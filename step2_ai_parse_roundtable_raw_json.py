@@ -1,169 +1,1020 @@
 #!/usr/bin/env python3
 
+import argparse
 import os
 import json
-import getpass
-import time
-import random
-import signal
+import asyncio
 import sys
-from openai import OpenAI
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from openai import APITimeoutError, RateLimitError
+
+from helix_rate_limit import LLMRateLimiter, parse_retry_after
+from helix_llm_cache import LLMCache, content_key, DEFAULT_LLM_CACHE_DIR
+from helix_journal import EnrichmentJournal
+from helix_tokens import TokenCounter, TokenUsageLog
+from helix_json_stream import StreamingFieldValidator, StreamMetrics
+from helix_extract import extract_panelist_fields
+from helix_llm_provider import OpenAIProvider, add_provider_arguments, provider_from_args
 
 # Constants
-MAX_API_WAIT_SEC = 10
-MIN_API_DELAY_SEC = 1
-MAX_API_DELAY_SEC = 2
+MODEL = "gpt-4"
+TEMPERATURE = 0.2
+MAX_API_WAIT_SEC = 10      # deadline for one roundtable's request
+RETRY_ROUNDS = 2           # passes over failed roundtables, each with double the deadline
+RETRY_BACKOFF_SEC = 5      # wait before the first retry pass, doubled for each later one
+MAX_TOKENS = 500
+MAX_IN_FLIGHT = 4           # concurrent LLM requests
+REQUESTS_PER_MIN = 60
+TOKENS_PER_MIN = 40000
+PROMPT_TOKENS = 3000        # budget for one roundtable's prompt; long bios are cut to fit
+BIO_MIN_TOKENS = 40         # every bio keeps at least its opening line
+PACK_TOKENS = 6000          # prompt + completion budget for one packed request
+BATCH_POLL_SEC = 30
+BATCH_COMPLETION_WINDOW = "24h"
+DEFAULT_INPUT_FILENAME = "helixcenter_openai_20241231-141845.json"
 
-class TimeoutException(Exception):
+class LLMTimeout(Exception):
+    """An LLM request missed its deadline; the roundtable is queued for retry."""
     pass
 
-def timeout_handler(signum, frame):
-    raise TimeoutException("[ERROR] API call timed out.")
+class SchemaError(ValueError):
+    """The answer was valid JSON but not the six fields with their types."""
+    pass
 
-if hasattr(signal, 'SIGALRM'):
-    signal.signal(signal.SIGALRM, timeout_handler)
+class MissingAnswer(ValueError):
+    """A batch finished without a usable result for the roundtable."""
+    pass
 
-api_key = getpass.getpass("Enter your OpenAI API key: ")
-client = OpenAI(api_key=api_key)
+# Shared by every worker thread; replaced by main()
+provider = OpenAIProvider(MODEL)
+rate_limiter = LLMRateLimiter(REQUESTS_PER_MIN, TOKENS_PER_MIN)
+llm_cache = None
+prompt_tokens_budget = PROMPT_TOKENS
+pack_block_tokens = 0
+token_counter = TokenCounter(MODEL)
+token_usage = TokenUsageLog()
+use_stream = False
+local_extract = True
+local_extractions = {}
+stream_metrics = StreamMetrics()
 
-def save_intermediate_results(roundtables, filename):
-    with open(filename, "w", encoding="utf-8") as f:
+def save_results(roundtables, filename):
+    """Write the JSON array to a temp file and rename it over filename, so it is never torn."""
+    tmp_filename = f"{filename}.{os.getpid()}.tmp"
+    with open(tmp_filename, "w", encoding="utf-8") as f:
         json.dump(roundtables, f, indent=2, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_filename, filename)
+
+def load_legacy_intermediate(filename, journal):
+    """
+    Seed the journal from a <input>_clean-intermediate.json written by
+    older versions (a finished prefix of the roundtables), keyed by id.
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        processed_roundtables = json.load(f)
+    for rt in processed_roundtables:
+        if journal.get(rt.get("id")) is None:
+            journal.append(rt.get("id"), {k: rt[k] for k in empty_fields() if k in rt})
+    print(f"[INFO] Imported {len(processed_roundtables)} roundtables from {filename}")
+
+# The six fields the LLM adds to each roundtable, with their JSON types
+FIELD_TYPES = {
+    "description_one-sentence": str,
+    "description_summary": str,
+    "keywords": list,
+    "panelist_ct": int,
+    "institutions": list,
+    "specialities": list,
+}
+
+# What the LLM is asked for when the panelist fields are extracted locally
+SUMMARY_FIELD_TYPES = {field: FIELD_TYPES[field] for field in ("description_one-sentence",
+                                                               "description_summary", "keywords")}
+
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are an assistant that analyzes roundtable data. "
+        "You will be given a roundtable 'description' plus its 'panelist' information. "
+        "Please generate and return new fields as structured JSON."
+    ),
+}
+
+SUMMARY_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are an assistant that analyzes roundtable data. "
+        "You will be given a roundtable 'description'. "
+        "Please generate and return new fields as structured JSON."
+    ),
+}
+
+TASKS = (
+    "TASKS:\n"
+    "1) description_one-sentence: Summarize 'description' in exactly one sentence.\n"
+    "2) description_summary: Summarize 'description' in exactly 2 or 3 sentences.\n"
+    "3) keywords: Extract 3-6 short topical keywords.\n"
+    "4) panelist_ct: The integer count of total panelists.\n"
+    "5) institutions: A list of affiliations gleaned from 'title_{n}' or 'description_{n}'.\n"
+    "6) specialities: A list of specialized subject areas gleaned from 'title_{n}' or 'description_{n}'.\n\n"
+)
+
+SUMMARY_TASKS = (
+    "TASKS:\n"
+    "1) description_one-sentence: Summarize 'description' in exactly one sentence.\n"
+    "2) description_summary: Summarize 'description' in exactly 2 or 3 sentences.\n"
+    "3) keywords: Extract 3-6 short topical keywords.\n\n"
+)
+
+STRICT_JSON_RULES = (
+    "\n\nAn earlier answer for this roundtable could not be used. Reply with ONE JSON object "
+    "and nothing else: no markdown, no code fences, no text before or after it. Include every "
+    "field shown with exactly the type shown; use \"\", [] or 0 when unsure, never null."
+)
+
+FIELDS_SCHEMA = (
+    "{\n"
+    "   \"description_one-sentence\": ...,\n"
+    "   \"description_summary\": ...,\n"
+    "   \"keywords\": [...],\n"
+    "   \"panelist_ct\": number,\n"
+    "   \"institutions\": [...],\n"
+    "   \"specialities\": [...]\n"
+    "}"
+)
+
+SUMMARY_SCHEMA = (
+    "{\n"
+    "   \"description_one-sentence\": ...,\n"
+    "   \"description_summary\": ...,\n"
+    "   \"keywords\": [...]\n"
+    "}"
+)
+
+def empty_fields():
+    return {
+        "description_one-sentence": "",
+        "description_summary": "",
+        "keywords": [],
+        "panelist_ct": 0,
+        "institutions": [],
+        "specialities": []
+    }
+
+def valid_fields(answer, field_types=FIELD_TYPES):
+    """
+    True if answer is a dict holding all the fields with the right JSON
+    types. A JSON true/false is not a number, although bool is an int.
+    """
+    return isinstance(answer, dict) and all(
+        isinstance(answer.get(field), field_type)
+        and not (isinstance(answer.get(field), bool) and field_type is not bool)
+        for field, field_type in field_types.items()
+    )
+
+def local_fields(roundtable):
+    """
+    (panelist_ct/institutions/specialities, confident) extracted by rule
+    from the panelist dict, once per roundtable id; (None, False) with
+    local extraction off.
+    """
+    if not local_extract:
+        return None, False
+    roundtable_id = str(roundtable.get("id"))
+    if roundtable_id not in local_extractions:
+        local_extractions[roundtable_id] = extract_panelist_fields(roundtable.get("panelist", {}))
+    return local_extractions[roundtable_id]
+
+def summary_only(roundtable):
+    return answer_types(roundtable) is SUMMARY_FIELD_TYPES
+
+def answer_types(roundtable):
+    """The fields the LLM is asked for: only the summary ones when local extraction is confident."""
+    return SUMMARY_FIELD_TYPES if local_fields(roundtable)[1] else FIELD_TYPES
+
+def with_local_fields(roundtable, new_fields):
+    """
+    The LLM's fields with panelist_ct replaced by the exact local count,
+    and institutions/specialities by the local ones when confident.
+    """
+    extracted, confident = local_fields(roundtable)
+    if extracted is None or "enrichment_error" in new_fields:
+        return new_fields
+    merged = dict(new_fields, panelist_ct=extracted["panelist_ct"])
+    if confident:
+        merged.update(extracted)
+    return merged
+
+def failure_fields(e):
+    """Empty placeholder fields tagged with the class of the error that caused them."""
+    return dict(empty_fields(), enrichment_error=type(e).__name__)
 
-def analyze_roundtable_with_gpt(roundtable, total_ct, current_idx):
+def is_failure(fields):
+    """A tagged placeholder, or an untagged empty one written by older versions."""
+    return "enrichment_error" in fields or {k: fields.get(k) for k in FIELD_TYPES} == empty_fields()
+
+def parse_answer(raw_answer, field_types=FIELD_TYPES):
+    """The requested fields from a single-roundtable answer. Raises ValueError (or SchemaError)."""
+    new_fields = json.loads(raw_answer)
+    if not valid_fields(new_fields, field_types):
+        raise SchemaError(f"answer is not an object with the {len(field_types)} fields and their types")
+    return {field: new_fields[field] for field in field_types}
+
+def apply_fields(roundtable, new_fields, journal):
+    new_fields = with_local_fields(roundtable, new_fields)
+    roundtable.pop("enrichment_error", None)
+    roundtable.update(new_fields)
+    journal.append(roundtable.get("id"), new_fields)
+
+def is_bio(key):
+    return key.startswith("description_")
+
+def bio_caps(sizes, available):
+    """
+    Split `available` tokens between bios of the given sizes: bios that
+    fit an equal share keep everything, the rest share what is left
+    (but never less than BIO_MIN_TOKENS each).
+    """
+    caps = {}
+    remaining = sorted(sizes.items(), key=lambda kv: kv[1])
+    while remaining and remaining[0][1] <= available // len(remaining):
+        key, size = remaining.pop(0)
+        caps[key] = size
+        available -= size
+    for key, _ in remaining:
+        caps[key] = max(BIO_MIN_TOKENS, available // len(remaining))
+    return caps
+
+def trim_panelists(roundtable, packed=False):
+    """
+    (panelist dict, bio tokens cut): the description_N bios shortened so
+    the six-field single-roundtable prompt fits prompt_tokens_budget and,
+    with packed=True, the roundtable's block also fits its share of a
+    packed request (pack_block_tokens). Names and titles are never cut.
+    """
+    panelists_data = roundtable.get("panelist", {})
+    sizes = {key: token_counter.count(val) for key, val in panelists_data.items() if is_bio(key)}
+    no_bios = {key: ("" if is_bio(key) else val) for key, val in panelists_data.items()}
+    limits = []
+    if prompt_tokens_budget:
+        limits.append(prompt_tokens_budget - token_counter.count_messages(
+            build_messages(roundtable, no_bios, summary=False)))
+    if packed and pack_block_tokens:
+        limits.append(pack_block_tokens - token_counter.count(roundtable_block(roundtable, no_bios)))
+    if not limits:
+        return panelists_data, 0
+    available = min(limits)
+    if sum(sizes.values()) <= available:
+        return panelists_data, 0
+
+    caps = bio_caps(sizes, available)
+    trimmed = {key: (token_counter.truncate(val, caps[key]) if is_bio(key) else val)
+               for key, val in panelists_data.items()}
+    cut = sum(sizes.values()) - sum(token_counter.count(trimmed[key]) for key in sizes)
+    return trimmed, cut
+
+def summary_block(roundtable):
+    """The part of a summary-only prompt describing one roundtable: no panelists."""
+    return (
+        f"Roundtable ID: {roundtable.get('id', '')}\n"
+        f"Title: {roundtable.get('title', '')}\n\n"
+        f"Description:\n{roundtable.get('description', '')}\n\n"
+    )
+
+def roundtable_block(roundtable, panelists_data=None):
+    """The part of the prompt describing one roundtable (bios trimmed to the budget)."""
     roundtable_id = roundtable.get("id", "")
     title = roundtable.get("title", "")
     description = roundtable.get("description", "")
-    panelists_data = roundtable.get("panelist", {})
+    if panelists_data is None:
+        panelists_data = trim_panelists(roundtable)[0]
 
     panelists_str = ""
     for key, val in panelists_data.items():
         panelists_str += f"{key}: {val}\n"
 
-    system_message = {
-        "role": "system",
+    return (
+        f"Roundtable ID: {roundtable_id}\n"
+        f"Title: {title}\n\n"
+        f"Description:\n{description}\n\n"
+        f"Panelists:\n{panelists_str}\n\n"
+    )
+
+def build_messages(roundtable, panelists_data=None, strict=False, summary=None):
+    """
+    The system and user messages asking the LLM for the six new fields, or
+    just the three summary ones (without the panelists) when local
+    extraction is confident (or summary=True); strict=True adds
+    STRICT_JSON_RULES for a retry.
+    """
+    if summary is None:
+        summary = summary_only(roundtable)
+    if summary:
+        user_message = {
+            "role": "user",
+            "content": (
+                summary_block(roundtable)
+                + SUMMARY_TASKS
+                + "Return answer ONLY as valid JSON with exactly these fields:\n"
+                + SUMMARY_SCHEMA
+                + (STRICT_JSON_RULES if strict else "")
+            ),
+        }
+        return [SUMMARY_SYSTEM_MESSAGE, user_message]
+
+    user_message = {
+        "role": "user",
         "content": (
-            "You are an assistant that analyzes roundtable data. "
-            "You will be given a roundtable 'description' plus its 'panelist' information. "
-            "Please generate and return new fields as structured JSON."
+            roundtable_block(roundtable, panelists_data)
+            + TASKS
+            + "Return answer ONLY as valid JSON with exactly these fields:\n"
+            + FIELDS_SCHEMA
+            + (STRICT_JSON_RULES if strict else "")
         ),
     }
+    return [SYSTEM_MESSAGE, user_message]
 
+def packed_block(roundtable):
+    """
+    A roundtable's block in a packed prompt: what its own request would
+    show, with bios trimmed to the roundtable's share of the pack.
+    """
+    if summary_only(roundtable):
+        return summary_block(roundtable)
+    return roundtable_block(roundtable, trim_panelists(roundtable, packed=True)[0])
+
+def build_packed_messages(roundtables, summary=False):
+    """
+    One request covering several roundtables; the answer is a JSON array
+    keyed by id. With summary=True (a pack of roundtables whose panelist
+    fields were extracted locally) only the three summary fields are asked
+    for and the panelists are left out, as in their own requests.
+    """
+    system_message, tasks, schema = ((SUMMARY_SYSTEM_MESSAGE, SUMMARY_TASKS, SUMMARY_SCHEMA) if summary
+                                     else (SYSTEM_MESSAGE, TASKS, FIELDS_SCHEMA))
     user_message = {
         "role": "user",
         "content": (
-            f"Roundtable ID: {roundtable_id}\n"
-            f"Title: {title}\n\n"
-            f"Description:\n{description}\n\n"
-            f"Panelists:\n{panelists_str}\n\n"
-            "TASKS:\n"
-            "1) description_one-sentence: Summarize 'description' in exactly one sentence.\n"
-            "2) description_summary: Summarize 'description' in exactly 2 or 3 sentences.\n"
-            "3) keywords: Extract 3-6 short topical keywords.\n"
-            "4) panelist_ct: The integer count of total panelists.\n"
-            "5) institutions: A list of affiliations gleaned from 'title_{n}' or 'description_{n}'.\n"
-            "6) specialities: A list of specialized subject areas gleaned from 'title_{n}' or 'description_{n}'.\n\n"
-            "Return answer ONLY as valid JSON with exactly these fields:\n"
-            "{\n"
-            "   \"description_one-sentence\": ...,\n"
-            "   \"description_summary\": ...,\n"
-            "   \"keywords\": [...],\n"
-            "   \"panelist_ct\": number,\n"
-            "   \"institutions\": [...],\n"
-            "   \"specialities\": [...]\n"
-            "}"
+            f"There are {len(roundtables)} roundtables below. Do the TASKS for each one.\n\n"
+            + "---\n".join(packed_block(rt) for rt in roundtables)
+            + tasks
+            + f"Return answer ONLY as a valid JSON array with one object per roundtable "
+              f"({len(roundtables)} objects). Each object has \"id\" (the Roundtable ID) "
+              f"plus exactly these fields:\n"
+            + schema
         ),
     }
+    return [system_message, user_message]
+
+def estimate_tokens(messages, max_tokens=MAX_TOKENS):
+    """Prompt tokens (counted locally) plus the completion budget."""
+    return token_counter.count_messages(messages) + max_tokens
+
+def record_usage(roundtable, source, prompt_tokens, completion_tokens=None, total_tokens=None):
+    """Usage for one roundtable; summary-only prompts carry no bios, so none were cut."""
+    bio_tokens_cut = 0 if summary_only(roundtable) else trim_panelists(roundtable, source == "packed")[1]
+    token_usage.record(roundtable.get("id"), source=source, prompt_tokens=prompt_tokens,
+                       bio_tokens_cut=bio_tokens_cut,
+                       completion_tokens=completion_tokens, total_tokens=total_tokens)
 
+def cache_key(roundtable):
+    """
+    LLM cache key for a roundtable. The id is left out of the prompt
+    hashed, so a re-crawl that renumbers unchanged roundtables still hits.
+    """
+    messages = build_messages(dict(roundtable, id=""), summary=summary_only(roundtable))
+    return content_key(provider.cache_namespace, messages, temperature=TEMPERATURE, max_tokens=MAX_TOKENS)
+
+def create_completion(messages, max_tokens, deadline_sec):
+    """
+    One chat completion that gives up after deadline_sec. The deadline is
+    the request's own timeout (no client-side retries stretching it), so
+    every worker thread has its own. Raises LLMTimeout.
+    """
     try:
-        if hasattr(signal, 'SIGALRM'):
-            signal.alarm(MAX_API_WAIT_SEC)
-
-        print(f"[DEBUG] --> Sending request to LLM for roundtable ID={roundtable_id} ...")
-        
-        response = client.chat.completions.create(
-            model="gpt-4",
-            messages=[system_message, user_message],
-            max_tokens=500,
-            temperature=0.2
+        return provider.complete(
+            messages,
+            timeout=deadline_sec,
+            max_retries=0,
+            max_tokens=max_tokens,
+            temperature=TEMPERATURE
         )
+    except APITimeoutError as e:
+        raise LLMTimeout(f"no answer within {deadline_sec}s") from e
 
-        if hasattr(signal, 'SIGALRM'):
-            signal.alarm(0)
+async def acreate_completion(messages, max_tokens, deadline_sec):
+    """Async version of create_completion(); a missed deadline cancels the request."""
+    try:
+        return await asyncio.wait_for(
+            provider.acomplete(
+                messages,
+                max_retries=0,
+                max_tokens=max_tokens,
+                temperature=TEMPERATURE
+            ),
+            deadline_sec
+        )
+    except (asyncio.TimeoutError, APITimeoutError) as e:
+        raise LLMTimeout(f"no answer within {deadline_sec}s") from e
 
-        raw_answer = response.choices[0].message.content
-        print(f"[DEBUG] --> Raw LLM response:\n{raw_answer}\n")
+def read_chunk(validator, chunk):
+    """Feed a stream chunk's text to the validator; returns the usage if the chunk carries it."""
+    if chunk.choices and chunk.choices[0].delta.content:
+        validator.feed(chunk.choices[0].delta.content)
+    return chunk.usage
 
-        new_fields = json.loads(raw_answer)
+def stream_completion(messages, max_tokens, deadline_sec, field_types=FIELD_TYPES):
+    """
+    Streamed create_completion(). Every delta is checked against
+    field_types as it arrives, so a malformed answer is cut off (StreamViolation)
+    at the first bad character instead of after max_tokens, and the
+    deadline covers the whole answer rather than each read. Returns
+    (answer text, usage or None).
+    """
+    validator = StreamingFieldValidator(field_types)
+    usage = None
+    error = None
+    try:
+        stream = provider.complete(
+            messages,
+            timeout=deadline_sec,
+            max_retries=0,
+            max_tokens=max_tokens,
+            temperature=TEMPERATURE,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        with stream:
+            for chunk in stream:
+                usage = read_chunk(validator, chunk) or usage
+                if time.monotonic() - validator.start > deadline_sec:
+                    raise LLMTimeout(f"answer not finished within {deadline_sec}s")
+    except APITimeoutError as e:
+        error = LLMTimeout(f"no answer within {deadline_sec}s")
+        raise error from e
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        stream_metrics.record(validator, error)
+    return validator.answer(), usage
 
-        progress = (current_idx / total_ct) * 100
-        print(f"\n\n========== PROCESSED {progress:.1f}% of {total_ct} roundtables ==========\n\n")
+async def astream_completion(messages, max_tokens, deadline_sec, field_types=FIELD_TYPES):
+    """Async version of stream_completion(); a missed deadline cancels the stream."""
+    validator = StreamingFieldValidator(field_types)
+    usage = None
 
-        return new_fields
+    async def consume():
+        nonlocal usage
+        stream = await provider.acomplete(
+            messages,
+            max_retries=0,
+            max_tokens=max_tokens,
+            temperature=TEMPERATURE,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        try:
+            async for chunk in stream:
+                usage = read_chunk(validator, chunk) or usage
+        finally:
+            await stream.close()
 
-    except TimeoutException as te:
-        print(f"{te} for roundtable id={roundtable_id}")
-        return {
-            "description_one-sentence": "",
-            "description_summary": "",
-            "keywords": [],
-            "panelist_ct": 0,
-            "institutions": [],
-            "specialities": []
-        }
+    error = None
+    try:
+        await asyncio.wait_for(consume(), deadline_sec)
+    except (asyncio.TimeoutError, APITimeoutError) as e:
+        error = LLMTimeout(f"no answer within {deadline_sec}s")
+        raise error from e
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        stream_metrics.record(validator, error)
+    return validator.answer(), usage
+
+def cached_answer(roundtable):
+    """(cache key, cached fields or None); the key is None when the cache is off."""
+    if llm_cache is None:
+        return None, None
+    key = cache_key(roundtable)
+    cached = llm_cache.get(key)
+    if cached is not None:
+        print(f"[DEBUG] --> Unchanged roundtable ID={roundtable.get('id', '')}: reusing cached LLM answer")
+        record_usage(roundtable, "cache", token_counter.count_messages(build_messages(roundtable)))
+    return key, cached
+
+def answer_fields(roundtable, key, raw_answer, usage, prompt_tokens, estimated):
+    """Settle the rate limiter, record usage and parse (and cache) the answer."""
+    if usage is not None:
+        rate_limiter.settle(estimated, usage.total_tokens)
+        record_usage(roundtable, "llm", prompt_tokens, usage.completion_tokens, usage.total_tokens)
+    else:
+        record_usage(roundtable, "llm", prompt_tokens)
+
+    print(f"[DEBUG] --> Raw LLM response:\n{raw_answer}\n")
 
+    new_fields = parse_answer(raw_answer, answer_types(roundtable))
+    if key is not None:
+        llm_cache.put(key, new_fields)
+    return new_fields
+
+def llm_failed(roundtable, e):
+    if isinstance(e, RateLimitError):
+        rate_limiter.pause(parse_retry_after(e.response.headers.get("retry-after")) or MAX_API_WAIT_SEC)
+    print(f"[ERROR] LLM call or JSON parsing failed for roundtable id={roundtable.get('id', '')} "
+          f"({type(e).__name__}):\n{e}\n")
+    return failure_fields(e)
+
+def analyze_roundtable_with_gpt(roundtable, deadline_sec=MAX_API_WAIT_SEC, strict=False):
+    """
+    New fields for one roundtable, or failure_fields() tagged with the
+    error if the request failed, missed deadline_sec or gave a bad answer.
+    """
+    key, cached = cached_answer(roundtable)
+    if cached is not None:
+        return cached
+
+    messages = build_messages(roundtable, strict=strict)
+    prompt_tokens = token_counter.count_messages(messages)
+    estimated = prompt_tokens + MAX_TOKENS
+    try:
+        rate_limiter.acquire(estimated)
+        print(f"[DEBUG] --> Sending request to LLM for roundtable ID={roundtable.get('id', '')} ...")
+        if use_stream:
+            raw_answer, usage = stream_completion(messages, MAX_TOKENS, deadline_sec, answer_types(roundtable))
+        else:
+            response = create_completion(messages, MAX_TOKENS, deadline_sec)
+            raw_answer, usage = response.choices[0].message.content, response.usage
+        return answer_fields(roundtable, key, raw_answer, usage, prompt_tokens, estimated)
     except Exception as e:
-        print(f"[ERROR] LLM call or JSON parsing failed for roundtable id={roundtable_id}:\n{e}\n")
-        return {
-            "description_one-sentence": "",
-            "description_summary": "",
-            "keywords": [],
-            "panelist_ct": 0,
-            "institutions": [],
-            "specialities": []
-        }
+        return llm_failed(roundtable, e)
+
+async def aanalyze_roundtable_with_gpt(roundtable, deadline_sec=MAX_API_WAIT_SEC):
+    """Async version of analyze_roundtable_with_gpt()."""
+    key, cached = cached_answer(roundtable)
+    if cached is not None:
+        return cached
+
+    messages = build_messages(roundtable)
+    prompt_tokens = token_counter.count_messages(messages)
+    estimated = prompt_tokens + MAX_TOKENS
+    try:
+        await rate_limiter.aacquire(estimated)
+        print(f"[DEBUG] --> Sending request to LLM for roundtable ID={roundtable.get('id', '')} ...")
+        if use_stream:
+            raw_answer, usage = await astream_completion(messages, MAX_TOKENS, deadline_sec,
+                                                         answer_types(roundtable))
+        else:
+            response = await acreate_completion(messages, MAX_TOKENS, deadline_sec)
+            raw_answer, usage = response.choices[0].message.content, response.usage
+        return answer_fields(roundtable, key, raw_answer, usage, prompt_tokens, estimated)
+    except Exception as e:
+        return llm_failed(roundtable, e)
+
+def pack_roundtables(roundtables, pack_size, pack_tokens=PACK_TOKENS):
+    """
+    Greedily group roundtables, in order, into packs of at most pack_size
+    whose prompt blocks plus MAX_TOKENS of answer each fit in pack_tokens.
+    Summary-only roundtables and six-field ones go in separate packs, so
+    each pack asks for the fields its roundtables' own requests would. A
+    roundtable too big for any pack goes alone.
+    """
+    packs = []
+    for summary in (True, False):
+        overhead = estimate_tokens(build_packed_messages([], summary), max_tokens=0)
+        current, used = [], overhead
+        for rt in roundtables:
+            if summary_only(rt) != summary:
+                continue
+            cost = token_counter.count(packed_block(rt)) + MAX_TOKENS
+            if current and (len(current) >= pack_size or used + cost > pack_tokens):
+                packs.append(current)
+                current, used = [], overhead
+            current.append(rt)
+            used += cost
+        if current:
+            packs.append(current)
+    return packs
+
+def parse_packed_answer(raw_answer, pack, field_types=FIELD_TYPES):
+    """
+    {roundtable id (str): fields} for every object in a packed answer that
+    belongs to the pack and holds field_types; anything else is left out.
+    """
+    wanted = {str(rt.get("id")) for rt in pack}
+    answers = {}
+    try:
+        items = json.loads(raw_answer)
+    except ValueError as e:
+        print(f"[ERROR] Packed answer is not valid JSON: {e}")
+        return answers
+    if not isinstance(items, list):
+        print("[ERROR] Packed answer is not a JSON array")
+        return answers
+    for item in items:
+        if not isinstance(item, dict) or str(item.get("id")) not in wanted or not valid_fields(item, field_types):
+            continue
+        answers[str(item["id"])] = {field: item[field] for field in field_types}
+    return answers
+
+def analyze_pack_with_gpt(pack, deadline_sec=MAX_API_WAIT_SEC, strict=False):
+    """
+    Enrich several roundtables with one request. Returns their new fields in
+    pack order. The pack's roundtables are all summary-only or all
+    six-field (see pack_roundtables()), and the answer is checked against
+    those fields. Roundtables missing from a malformed, partial or
+    timed-out answer are split in half and asked again, down to single
+    analyze_roundtable_with_gpt calls. deadline_sec is per roundtable in
+    the pack; strict applies to single-roundtable requests.
+    """
+    if len(pack) == 1:
+        return [analyze_roundtable_with_gpt(pack[0], deadline_sec, strict)]
+
+    ids = [str(rt.get("id")) for rt in pack]
+    summary = summary_only(pack[0])
+    messages = build_packed_messages(pack, summary)
+    max_tokens = MAX_TOKENS * len(pack)
+    estimated = estimate_tokens(messages, max_tokens=max_tokens)
+    answers = {}
+    try:
+        rate_limiter.acquire(estimated)
+        print(f"[DEBUG] --> Sending packed request to LLM for roundtable IDs={','.join(ids)} ...")
+        response = create_completion(messages, max_tokens, deadline_sec * len(pack))
+        if response.usage is not None:
+            rate_limiter.settle(estimated, response.usage.total_tokens)
+        answers = parse_packed_answer(response.choices[0].message.content, pack, answer_types(pack[0]))
+        # The request's usage is shared out by each roundtable's share of the prompt
+        block_tokens = {str(rt.get("id")): token_counter.count(packed_block(rt)) for rt in pack}
+        for rt in pack:
+            share = block_tokens[str(rt.get("id"))] / sum(block_tokens.values())
+            if response.usage is not None:
+                prompt_share = round(response.usage.prompt_tokens * share)
+                completion_share = round(response.usage.completion_tokens / len(pack))
+                record_usage(rt, "packed", prompt_share, completion_share, prompt_share + completion_share)
+            else:
+                record_usage(rt, "packed", round((estimated - max_tokens) * share))
+    except Exception as e:
+        if isinstance(e, RateLimitError):
+            rate_limiter.pause(parse_retry_after(e.response.headers.get("retry-after")) or MAX_API_WAIT_SEC)
+        print(f"[ERROR] Packed LLM call failed for roundtable IDs={','.join(ids)}:\n{e}\n")
+
+    if llm_cache is not None:
+        for rt in pack:
+            if str(rt.get("id")) in answers:
+                llm_cache.put(cache_key(rt), answers[str(rt.get("id"))])
+
+    missing = [rt for rt in pack if str(rt.get("id")) not in answers]
+    if missing:
+        print(f"[DEBUG] --> {len(missing)} of {len(pack)} roundtables missing from the packed answer; splitting")
+        half = (len(missing) + 1) // 2
+        for part in (missing[:half], missing[half:]):
+            if part:
+                answers.update(zip((str(rt.get("id")) for rt in part),
+                                   analyze_pack_with_gpt(part, deadline_sec, strict)))
+    return [answers[roundtable_id] for roundtable_id in ids]
 
-def main():
-    input_filename = "helixcenter_openai_20241231-141845.json"
-    intermediate_filename = "helixcenter_openai_20241231-141845_clean-intermediate.json"
-    output_filename = "helixcenter_openai_20241231-141845_cleaned.json"
+def print_progress(finished_ct, total_roundtable_ct):
+    progress = (finished_ct / total_roundtable_ct) * 100
+    print(f"\n\n========== PROCESSED {progress:.1f}% of {total_roundtable_ct} roundtables ==========\n\n")
+
+def enrich_round(packs, journal, concurrency, deadline_sec, total_roundtable_ct, finished_ct, strict=False):
+    """One pass over packs on a thread pool. Returns the finished count."""
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        futures = {}
+        for pack in packs:
+            print(f"[INFO] Queueing roundtable ID={','.join(str(rt.get('id')) for rt in pack)}")
+            futures[pool.submit(analyze_pack_with_gpt, pack, deadline_sec, strict)] = pack
+
+        # Completions arrive in any order; each result goes back to the
+        # record it was computed from
+        for future in as_completed(futures):
+            for rt, new_fields in zip(futures[future], future.result()):
+                apply_fields(rt, new_fields, journal)
+                finished_ct += 1
+            print_progress(finished_ct, total_roundtable_ct)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return finished_ct
+
+def enrich_concurrently(pending, journal, concurrency, total_roundtable_ct, finished_ct=0,
+                        pack_size=1, pack_tokens=PACK_TOKENS):
+    """
+    Interactive path: up to `concurrency` requests in flight, each for one
+    roundtable or (pack_size > 1) a pack of them.
+    """
+    if pack_size > 1:
+        if llm_cache is not None:
+            uncached = []
+            for rt in pending:
+                cached = llm_cache.get(cache_key(rt))
+                if cached is not None:
+                    apply_fields(rt, cached, journal)
+                    record_usage(rt, "cache", token_counter.count_messages(build_messages(rt)))
+                    finished_ct += 1
+                else:
+                    uncached.append(rt)
+            pending = uncached
+        packs = pack_roundtables(pending, pack_size, pack_tokens)
+        print(f"[INFO] Packed {len(pending)} roundtables into {len(packs)} requests")
+    else:
+        packs = [[rt] for rt in pending]
+    enrich_round(packs, journal, concurrency, MAX_API_WAIT_SEC, total_roundtable_ct, finished_ct)
+
+async def aenrich_concurrently(pending, journal, concurrency, total_roundtable_ct, finished_ct=0):
+    """
+    asyncio alternative to enrich_concurrently(): one task per roundtable,
+    at most `concurrency` awaiting the API. A missed deadline cancels the
+    request itself rather than abandoning a blocked thread.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def analyze(rt):
+        async with semaphore:
+            return rt, await aanalyze_roundtable_with_gpt(rt)
+
+    for next_done in asyncio.as_completed([analyze(rt) for rt in pending]):
+        rt, new_fields = await next_done
+        apply_fields(rt, new_fields, journal)
+        finished_ct += 1
+        print_progress(finished_ct, total_roundtable_ct)
+
+def failed_roundtables(roundtables):
+    return [rt for rt in roundtables if "enrichment_error" in rt]
+
+def retry_failed(roundtables, journal, concurrency, rounds=RETRY_ROUNDS):
+    """
+    The retry queue: after the main pass, re-submit only the roundtables
+    whose enrichment failed, one per request with STRICT_JSON_RULES added.
+    Each round waits RETRY_BACKOFF_SEC (doubling) first and doubles the
+    deadline. Prints the failure rate before and after.
+    """
+    failed = failed_roundtables(roundtables)
+    first_pass_ct = len(failed)
+    for retry in range(1, rounds + 1):
+        if not failed:
+            break
+        backoff = RETRY_BACKOFF_SEC * 2 ** (retry - 1)
+        print(f"[INFO] Retry round {retry}/{rounds} for {len(failed)} failed roundtables "
+              f"{dict(Counter(rt['enrichment_error'] for rt in failed))} in {backoff}s")
+        time.sleep(backoff)
+        enrich_round([[rt] for rt in failed], journal, concurrency, MAX_API_WAIT_SEC * 2 ** retry,
+                     len(roundtables), len(roundtables) - len(failed), strict=True)
+        failed = failed_roundtables(roundtables)
+
+    total = len(roundtables) or 1
+    print(f"[INFO] Enrichment failures: {first_pass_ct} after the first pass, {len(failed)} of "
+          f"{len(roundtables)} ({len(failed) / total * 100:.1f}%) after retries"
+          + (f": {dict(Counter(rt['enrichment_error'] for rt in failed))}" if failed else ""))
+    return failed
+
+def batch_request(roundtable):
+    """One Batch API request line; custom_id is the roundtable id."""
+    return {
+        "custom_id": str(roundtable.get("id")),
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": provider.model,
+            "messages": build_messages(roundtable),
+            "max_tokens": MAX_TOKENS,
+            "temperature": TEMPERATURE,
+        },
+    }
+
+def submit_batch(roundtables, request_filename):
+    """Write the batch request file, upload it and start the batch. Returns the batch id."""
+    with open(request_filename, "w", encoding="utf-8") as f:
+        for rt in roundtables:
+            f.write(json.dumps(batch_request(rt), ensure_ascii=False) + "\n")
+    with open(request_filename, "rb") as f:
+        batch_file = provider.client.files.create(file=f, purpose="batch")
+    batch = provider.client.batches.create(input_file_id=batch_file.id, endpoint="/v1/chat/completions",
+                                           completion_window=BATCH_COMPLETION_WINDOW)
+    print(f"[INFO] Submitted batch {batch.id} with {len(roundtables)} roundtables ({request_filename})")
+    return batch.id
+
+def wait_for_batch(batch_id, poll_sec=BATCH_POLL_SEC):
+    while True:
+        batch = provider.client.batches.retrieve(batch_id)
+        counts = batch.request_counts
+        print(f"[INFO] Batch {batch_id}: {batch.status}"
+              + (f" ({counts.completed}/{counts.total} done, {counts.failed} failed)" if counts else ""))
+        if batch.status in ("completed", "failed", "expired", "cancelled"):
+            return batch
+        time.sleep(poll_sec)
+
+def read_batch_results(batch):
+    """{custom_id: chat completion body, or None for a failed request} from a finished batch."""
+    answers = {}
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if not file_id:
+            continue
+        for line in provider.client.files.content(file_id).text.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            response = result.get("response") or {}
+            if response.get("status_code") == 200:
+                answers[result["custom_id"]] = response["body"]
+            else:
+                print(f"[ERROR] Batch request {result['custom_id']} failed: "
+                      f"{result.get('error') or response.get('body')}")
+                answers[result["custom_id"]] = None
+    return answers
+
+def enrich_with_batch(pending, base_filename, journal, poll_sec=BATCH_POLL_SEC):
+    """
+    Batch API alternative to the thread pool: every pending roundtable not
+    in the LLM cache goes into one batch, and the results are merged back
+    by custom_id. The batch id is saved to <input>_clean-batch.json while
+    it runs, so an interrupted run resumes polling instead of resubmitting.
+    """
+    state_filename = f"{base_filename}_clean-batch.json"
+    request_filename = f"{base_filename}_clean-batch-requests.jsonl"
+    to_send = []
+    for rt in pending:
+        cached = llm_cache.get(cache_key(rt)) if llm_cache is not None else None
+        if cached is not None:
+            apply_fields(rt, cached, journal)
+            record_usage(rt, "cache", token_counter.count_messages(build_messages(rt)))
+        else:
+            to_send.append(rt)
+    if not to_send:
+        return
+
+    if os.path.exists(state_filename):
+        with open(state_filename, "r", encoding="utf-8") as f:
+            batch_id = json.load(f)["batch_id"]
+        print(f"[INFO] Resuming batch {batch_id} from {state_filename}")
+    else:
+        batch_id = submit_batch(to_send, request_filename)
+        with open(state_filename, "w", encoding="utf-8") as f:
+            json.dump({"batch_id": batch_id}, f)
+
+    batch = wait_for_batch(batch_id, poll_sec)
+    answers = read_batch_results(batch) if batch.status == "completed" else {}
+    for rt in to_send:
+        custom_id = str(rt.get("id"))
+        body = answers.get(custom_id)
+        try:
+            if body is None:
+                raise MissingAnswer(f"no answer in batch {batch_id} ({batch.status})")
+            usage = body.get("usage") or {}
+            record_usage(rt, "batch", token_counter.count_messages(build_messages(rt)),
+                         usage.get("completion_tokens"), usage.get("total_tokens"))
+            new_fields = parse_answer(body["choices"][0]["message"]["content"], answer_types(rt))
+            if llm_cache is not None:
+                llm_cache.put(cache_key(rt), new_fields)
+        except (ValueError, KeyError, IndexError) as e:
+            print(f"[ERROR] Batch result unusable for roundtable id={custom_id} ({type(e).__name__}):\n{e}\n")
+            new_fields = failure_fields(e)
+        apply_fields(rt, new_fields, journal)
+    os.remove(state_filename)
+    if os.path.exists(request_filename):
+        os.remove(request_filename)
+
+def main(input_filename=DEFAULT_INPUT_FILENAME, concurrency=MAX_IN_FLIGHT,
+         requests_per_min=REQUESTS_PER_MIN, tokens_per_min=TOKENS_PER_MIN,
+         llm_cache_dir=DEFAULT_LLM_CACHE_DIR, use_batch=False, batch_poll_sec=BATCH_POLL_SEC,
+         pack_size=1, pack_tokens=PACK_TOKENS, prompt_tokens=PROMPT_TOKENS, use_async=False,
+         retry_rounds=RETRY_ROUNDS, stream=False, local_extraction=True, llm_provider=None):
+    global provider, token_counter, rate_limiter, llm_cache, prompt_tokens_budget, pack_block_tokens
+    global use_stream, local_extract
+    global local_extractions
+    base_filename = input_filename.rsplit(".", 1)[0]
+    journal_filename = f"{base_filename}_clean-journal.jsonl"
+    usage_filename = f"{base_filename}_clean-token-usage.json"
+    legacy_intermediate_filename = f"{base_filename}_clean-intermediate.json"
+    output_filename = f"{base_filename}_cleaned.json"
 
     with open(input_filename, "r", encoding="utf-8") as f:
         roundtables = json.load(f)
     
     total_roundtable_ct = len(roundtables)
-    start_idx = 0
-
-    # Check for intermediate results
-    if os.path.exists(intermediate_filename):
-        with open(intermediate_filename, "r", encoding="utf-8") as f:
-            processed_roundtables = json.load(f)
-            start_idx = len(processed_roundtables)
-            roundtables[:start_idx] = processed_roundtables
-            print(f"[INFO] Resuming from index {start_idx}")
-
-    for idx in range(start_idx, total_roundtable_ct):
-        rt = roundtables[idx]
-        rt_id = rt.get("id")
-        print(f"[INFO] Processing roundtable index={idx+1}, ID={rt_id}")
-        
-        new_fields = analyze_roundtable_with_gpt(rt, total_roundtable_ct, idx + 1)
-        rt.update(new_fields)
-
-        # Save intermediate results
-        save_intermediate_results(roundtables[:idx + 1], intermediate_filename)
-
-        delay = random.uniform(MIN_API_DELAY_SEC, MAX_API_DELAY_SEC)
-        print(f"[DEBUG] Waiting for {delay:.2f} seconds before next call...")
-        time.sleep(delay)
+
+    # Results already in the journal are applied by roundtable id; failed
+    # ones are sent again
+    journal = EnrichmentJournal(journal_filename)
+    if os.path.exists(legacy_intermediate_filename):
+        load_legacy_intermediate(legacy_intermediate_filename, journal)
+    pending = []
+    for rt in roundtables:
+        fields = journal.get(rt.get("id"))
+        if fields is not None and not is_failure(fields):
+            rt.update(fields)
+        else:
+            pending.append(rt)
+    finished_ct = total_roundtable_ct - len(pending)
+
+    provider = llm_provider or OpenAIProvider(MODEL)
+    token_counter = TokenCounter(provider.model)
+    rate_limiter = LLMRateLimiter(requests_per_min, tokens_per_min)
+    llm_cache = LLMCache(llm_cache_dir) if llm_cache_dir else None
+    prompt_tokens_budget = prompt_tokens
+    # Each packed six-field block gets an equal share of pack_tokens, less
+    # its answer, so packs fill to pack_size instead of stopping at two
+    pack_block_tokens = 0
+    if pack_size > 1:
+        pack_overhead = estimate_tokens(build_packed_messages([]), max_tokens=0)
+        pack_block_tokens = (pack_tokens - pack_overhead) // pack_size - MAX_TOKENS
+    use_stream = stream
+    local_extract = local_extraction
+    local_extractions = {}
+    if local_extract:
+        confident_ct = sum(1 for rt in pending if local_fields(rt)[1])
+        print(f"[INFO] Panelist fields extracted locally; {confident_ct} of {len(pending)} roundtables "
+              f"need only the summary fields from the model")
+    if not token_counter.exact:
+        print("[WARN] tiktoken is not installed; token counts are estimated from text length")
+    try:
+        if use_batch:
+            enrich_with_batch(pending, base_filename, journal, poll_sec=batch_poll_sec)
+        elif use_async:
+            asyncio.run(aenrich_concurrently(pending, journal, concurrency, total_roundtable_ct, finished_ct))
+        else:
+            enrich_concurrently(pending, journal, concurrency, total_roundtable_ct, finished_ct,
+                                pack_size=pack_size, pack_tokens=pack_tokens)
+        failed = retry_failed(roundtables, journal, concurrency, rounds=retry_rounds)
+    finally:
+        journal.close()
+        provider.close()
+
+    if llm_cache is not None:
+        llm_cache.print_summary()
+    token_usage.print_summary()
+    stream_metrics.print_summary()
+    token_usage.save(usage_filename)
+    print(f"[INFO] Wrote per-roundtable token usage to {usage_filename}")
 
     # Save final results
-    save_intermediate_results(roundtables, output_filename)
+    save_results(roundtables, output_filename)
     print(f"[INFO] Wrote final data to {output_filename}")
+    if failed:
+        # Keep the journal: the next run only sends the failed roundtables
+        print(f"[INFO] Kept {journal_filename}; run again to retry the {len(failed)} failed roundtables")
+    else:
+        os.remove(journal_filename)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Add LLM-generated summary fields to crawled roundtables.")
+    parser.add_argument("--input", default=DEFAULT_INPUT_FILENAME,
+                        help="step1 output; writes <input>_cleaned.json, checkpointing to <input>_clean-journal.jsonl.")
+    parser.add_argument("--concurrency", type=int, default=MAX_IN_FLIGHT,
+                        help="LLM requests in flight at once.")
+    parser.add_argument("--rpm", type=float, default=REQUESTS_PER_MIN,
+                        help="Requests-per-minute limit.")
+    parser.add_argument("--tpm", type=float, default=TOKENS_PER_MIN,
+                        help="Tokens-per-minute limit (prompt estimate plus max completion).")
+    parser.add_argument("--llm-cache-dir", default=DEFAULT_LLM_CACHE_DIR,
+                        help="Cache of LLM answers keyed by model, prompt template and roundtable content.")
+    parser.add_argument("--no-llm-cache", action="store_true",
+                        help="Send every roundtable to the model.")
+    parser.add_argument("--prompt-tokens", type=int, default=PROMPT_TOKENS,
+                        help="Token budget for one roundtable's prompt; panelist bios are cut to fit "
+                             "(0 = no limit).")
+    parser.add_argument("--retry-rounds", type=int, default=RETRY_ROUNDS,
+                        help="Retry passes over failed roundtables, with a stricter JSON prompt.")
+    parser.add_argument("--stream", action="store_true",
+                        help="Stream single-roundtable answers, validating the six fields as they arrive "
+                             "and cutting off malformed ones early (one roundtable per request).")
+    parser.add_argument("--no-local-extract", action="store_true",
+                        help="Ask the model for panelist_ct, institutions and specialities too, "
+                             "instead of extracting them from the panelist titles.")
+    parser.add_argument("--pack-size", type=int, default=1,
+                        help="Roundtables per request; the answer is a JSON array keyed by id.")
+    parser.add_argument("--pack-tokens", type=int, default=PACK_TOKENS,
+                        help="Token budget (prompt + answers) for one packed request; panelist bios "
+                             "are cut so pack-size roundtables fit.")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="Run the LLM requests as asyncio tasks instead of on a thread pool "
+                             "(one roundtable per request).")
+    parser.add_argument("--batch", action="store_true",
+                        help="Use the Batch API (cheaper, hours of latency) instead of interactive calls "
+                             "(one roundtable per request).")
+    parser.add_argument("--batch-poll", type=float, default=BATCH_POLL_SEC,
+                        help="Seconds between batch status checks.")
+    add_provider_arguments(parser, default_model=MODEL)
+    args = parser.parse_args()
+    if args.pack_size > 1:
+        for flag, given in (("--async", args.use_async), ("--stream", args.stream), ("--batch", args.batch)):
+            if given:
+                parser.error(f"{flag} sends one roundtable per request; drop --pack-size")
     try:
-        main()
+        main(args.input, concurrency=args.concurrency,
+             requests_per_min=args.rpm, tokens_per_min=args.tpm,
+             llm_cache_dir=None if args.no_llm_cache else args.llm_cache_dir,
+             use_batch=args.batch, batch_poll_sec=args.batch_poll,
+             pack_size=args.pack_size, pack_tokens=args.pack_tokens,
+             prompt_tokens=args.prompt_tokens, use_async=args.use_async,
+             retry_rounds=args.retry_rounds, stream=args.stream,
+             local_extraction=not args.no_local_extract,
+             llm_provider=provider_from_args(args))
     except KeyboardInterrupt:
         print("\n[INFO] Process interrupted by user.")
-        sys.exit(0)
\ No newline at end of file
+        sys.exit(0)
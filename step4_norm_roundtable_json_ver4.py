@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 
+import argparse
 import json
-import getpass
 import os
-from openai import OpenAI
 from collections import Counter
 
+from helix_llm_provider import OpenAIProvider, add_provider_arguments, provider_from_args
+
 MAX_API_WAIT_SEC = 60
 CHUNK_SIZE = 50  # Process values in smaller chunks
 INPUT_JSON_FILENAME = "helixcenter_openai_20241231-141845_cleaned.json"
@@ -14,15 +15,11 @@ OUTPUT_JSON_NORM_FILENAME = INPUT_JSON_FILENAME.replace('_cleaned.json', '_norme
 OUTPUT_REPORT_FILENAME = INPUT_JSON_FILENAME.replace('_cleaned.json', '_norm_report.txt')
 INTERMEDIATE_FILE = INPUT_JSON_FILENAME.replace('_cleaned.json', '_intermediate.json')
 
-def setup_openai():
-    api_key = getpass.getpass("Enter your OpenAI API key: ")
-    return OpenAI(api_key=api_key)
-
 def chunk_list(lst, n):
     """Split list into chunks of size n"""
     return [lst[i:i + n] for i in range(0, len(lst), n)]
 
-def normalize_values(client, field_name, values):
+def normalize_values(provider, field_name, values):
     print(f"\n[DEBUG] Processing {len(values)} {field_name} terms...")
     
     # Split values into chunks
@@ -35,9 +32,8 @@ def normalize_values(client, field_name, values):
 {', '.join(chunk)}"""
 
         try:
-            response = client.chat.completions.create(
-                model="gpt-4",
-                messages=[
+            response = provider.complete(
+                [
                     {"role": "system", "content": "You are a data standardization assistant."},
                     {"role": "user", "content": prompt}
                 ],
@@ -100,8 +96,14 @@ def generate_normalization_report(norm_maps):
                     report.append(f"  - {term}")
     return "\n".join(report)
 
-def main():
-    client = setup_openai()
+def main(llm_provider=None):
+    provider = llm_provider or OpenAIProvider()
+    try:
+        normalize_fields(provider)
+    finally:
+        provider.close()
+
+def normalize_fields(provider):
     state = load_intermediate_state()
     
     with open(INPUT_JSON_FILENAME, 'r', encoding='utf-8') as f:
@@ -114,7 +116,7 @@ def main():
         try:
             print(f"\nProcessing {field}...")
             unique_values = get_unique_values(data, field)
-            state['normalization_maps'][field] = normalize_values(client, field, unique_values)
+            state['normalization_maps'][field] = normalize_values(provider, field, unique_values)
             state['processed_fields'].append(field)
             save_intermediate_state(state['processed_fields'], state['normalization_maps'])
             progress = (len(state['processed_fields']) / len(fields)) * 100
@@ -147,4 +149,7 @@ def finalize_output(data, normalization_maps):
         json.dump(normalized_data, f, indent=2, ensure_ascii=False)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Normalise keywords, institutions and specialities with an LLM.")
+    add_provider_arguments(parser)
+    args = parser.parse_args()
+    main(provider_from_args(args))
\ No newline at end of file
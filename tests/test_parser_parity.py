@@ -0,0 +1,40 @@
+"""
+Every parser backend, with full and partial parsing, must extract the same
+records as full html.parser (the original behaviour) from the pages
+rendered from the committed crawl. Same check as
+"bench_parsers.py --fixtures --check", without the timing passes.
+"""
+import pytest
+
+from bench_parsers import DEFAULT_FIXTURES, load_fixture_pages, parse_page, variants
+from helix_soup import PARSER_BACKENDS, configure_parser
+
+
+@pytest.fixture(scope="module")
+def pages():
+    return load_fixture_pages(DEFAULT_FIXTURES)
+
+
+def parse_all(pages, backend, partial):
+    configure_parser(backend, partial=partial)
+    try:
+        return {url: parse_page(kind, html) for kind, url, html in pages}
+    finally:
+        configure_parser()
+
+
+@pytest.fixture(scope="module")
+def reference(pages):
+    return parse_all(pages, "html.parser", partial=False)
+
+
+def test_fixture_pages_cover_every_page_kind(pages):
+    assert {kind for kind, _, _ in pages} == {"listing", "detail", "speaker"}
+
+
+@pytest.mark.parametrize("label,backend,partial",
+                         [v for v in variants(PARSER_BACKENDS) if v[0] != "html.parser/full"])
+def test_backend_matches_html_parser(pages, reference, label, backend, partial):
+    results = parse_all(pages, backend, partial)
+    mismatched = [url for url in reference if results[url] != reference[url]]
+    assert not mismatched, f"{label}: {len(mismatched)} pages differ, e.g. {mismatched[:3]}"
@@ -0,0 +1,52 @@
+"""
+step1's sync, async and pipelined crawls of the same site must write
+byte-identical output. The site is a local replay server serving pages
+rendered from the committed crawl, so no network is needed.
+"""
+import glob
+import os
+import subprocess
+import sys
+
+import pytest
+
+from bench_parsers import DEFAULT_FIXTURES
+from helix_replay_server import RecordPages, ReplayServer
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STEP1 = os.path.join(REPO_DIR, "step1_crawl_helix_requests_openai.py")
+MODES = {"sync": [], "async": ["--async"], "pipeline": ["--pipeline"]}
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = ReplayServer(RecordPages(os.path.join(REPO_DIR, DEFAULT_FIXTURES))).start()
+    yield server
+    server.stop()
+
+
+def crawl(server, mode, workdir):
+    """Run step1 against the replay server; return the bytes of its output JSON."""
+    command = [sys.executable, STEP1, "--base-url", server.base_url,
+               "--start-year", "2012", "--end-year", "2013",
+               "--no-cache", "--no-archive", "--no-journal",
+               "--rate", "1000", "--max-rate", "1000", "--burst", "1000"] + MODES[mode]
+    result = subprocess.run(command, cwd=workdir, stdin=subprocess.DEVNULL,
+                            capture_output=True, text=True, timeout=300)
+    assert result.returncode == 0, result.stdout[-2000:] + result.stderr[-2000:]
+    outputs = [f for f in glob.glob(os.path.join(workdir, "helixcenter_openai_*.json"))
+               if not f.endswith("_manifest.json")]
+    assert len(outputs) == 1, outputs
+    with open(outputs[0], "rb") as f:
+        return f.read()
+
+
+def test_sync_async_and_pipeline_output_identical(server, tmp_path):
+    outputs = {}
+    for mode in MODES:
+        workdir = tmp_path / mode
+        workdir.mkdir()
+        outputs[mode] = crawl(server, mode, str(workdir))
+    assert outputs["sync"].startswith(b"[") and b'"title"' in outputs["sync"]
+    assert outputs["async"] == outputs["sync"]
+    assert outputs["pipeline"] == outputs["sync"]